@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Benchmark genomes.py cold start.
+
+genomes.py is launched many times from batch scripts, often on network
+filesystems, so interpreter start + imports + argument parsing is paid on every
+call. This runs each mode in fresh interpreters and reports wall time:
+
+  help             genomes.py --help (imports and argparse only)
+  rebuild_preview  genomes.py <genomes> x --dry-run-rebuild on a synthetic tree
+  export_records   genomes.py <genomes> x --export-records on the same tree
+
+The synthetic tree (--accessions folders with a tiny genomic FASTA and a catalog
+entry each, no tax_id so taxonkit is never called) is built in a fresh temporary
+directory, created inside --workdir when given. Put --workdir on the network mount
+to measure there. Each mode runs once untimed first so the SQLite store and .pyc
+files exist before timing.
+
+The median of the help mode must stay under --budget-ms; otherwise the slowest
+imports are printed and the exit status is 1 (also when the help mode fails).
+Every run appends to a JSON history (default:
+benchmarks/genomes_startup_history.json, ignored by git) and is compared with the
+previous entry with the same parameters.
+
+Example:
+  python benchmarks/benchmark_genomes_startup.py --repeats 15 --label "lazy imports"
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmark_window_gc import git_commit, read_history, write_history
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+GENOMES_SCRIPT = REPO_ROOT / "genomes.py"
+
+MODES = ["help", "rebuild_preview", "export_records"]
+
+
+def write_synthetic_genomes_dir(genomes_dir: Path, n_accessions: int) -> None:
+    records_dir = genomes_dir / "records"
+    records_dir.mkdir(parents=True, exist_ok=True)
+    with (records_dir / "genomes_catalog.jsonl").open("w") as catalog:
+        for i in range(n_accessions):
+            accession = f"GCA_{900000000 + i:09d}.1"
+            data_dir = genomes_dir / accession / "ncbi_dataset" / "data" / accession
+            data_dir.mkdir(parents=True, exist_ok=True)
+            (data_dir / f"{accession}_synthetic_genomic.fna").write_text(">chr1\nACGT\n")
+            (data_dir / "genomic.gff").write_text("##gff-version 3\n")
+            entry = {
+                "accession": accession,
+                "organism": {"organism_name": f"Synthetic species{i % (n_accessions // 2 or 1)}"},
+                "assembly_info": {"assembly_name": f"syn{i}", "assembly_level": "Chromosome"},
+            }
+            catalog.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+def mode_command(mode: str, genomes_dir: Path) -> List[str]:
+    if mode == "help":
+        return [sys.executable, str(GENOMES_SCRIPT), "--help"]
+    if mode == "rebuild_preview":
+        return [sys.executable, str(GENOMES_SCRIPT), str(genomes_dir), "x", "--dry-run-rebuild"]
+    return [sys.executable, str(GENOMES_SCRIPT), str(genomes_dir), "x", "--export-records"]
+
+
+def time_command(command: List[str]) -> float:
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        last_line = (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+        raise RuntimeError(f"{' '.join(command)} failed: {last_line}")
+    return elapsed
+
+
+def slowest_imports(limit: int = 8) -> List[str]:
+    """Top cumulative import times of genomes.py --help, from python -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(GENOMES_SCRIPT), "--help"],
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2]
+        if name.startswith("  "):  # nested import; counted in its parent
+            continue
+        rows.append((int(fields[1]), name.strip()))
+    return [f"{us / 1000:>7.1f} ms  {name}" for us, name in sorted(rows, reverse=True)[:limit]]
+
+
+def run_mode(mode: str, genomes_dir: Path, repeats: int) -> Dict[str, object]:
+    command = mode_command(mode, genomes_dir)
+    try:
+        time_command(command)  # warm-up: .pyc files, SQLite store
+        samples = [time_command(command) for _ in range(repeats)]
+    except RuntimeError as exc:
+        return {"mode": mode, "status": "failed", "error": str(exc)}
+    return {
+        "mode": mode,
+        "status": "ok",
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "min_ms": round(min(samples) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+
+
+def print_comparison(entry: Dict[str, object], previous: Optional[Dict[str, object]], budget_ms: float) -> None:
+    previous_results = {row["mode"]: row for row in (previous or {}).get("results", [])}
+    print(f"\n[OK] genomes.py startup at {entry['git_commit'] or 'unknown commit'} ({entry['label'] or 'no label'})")
+    if previous:
+        print(f"     compared with {previous['git_commit'] or 'unknown commit'} ({previous['label'] or 'no label'}, {previous['timestamp']})")
+    for row in entry["results"]:
+        if row["status"] != "ok":
+            print(f"  {row['mode']:<16} {row['status']}: {row.get('error', '')}")
+            continue
+        line = f"  {row['mode']:<16} median {row['median_ms']:>7.1f} ms  min {row['min_ms']:>7.1f} ms  max {row['max_ms']:>7.1f} ms"
+        if row["mode"] == "help":
+            line += f"  (budget {budget_ms:.0f} ms)"
+        before = previous_results.get(row["mode"])
+        if before and before.get("status") == "ok" and before["median_ms"] > 0:
+            change = (row["median_ms"] - before["median_ms"]) / before["median_ms"] * 100
+            line += f"  ({change:+.1f}% vs previous)"
+        print(line)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark genomes.py cold-start time per mode.")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="Modes to time. Default: all")
+    parser.add_argument("--repeats", type=int, default=10, help="Timed runs per mode. Default: 10")
+    parser.add_argument("--accessions", type=int, default=200, help="Accession folders in the synthetic genomes dir. Default: 200")
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="Budget for the median of the help mode. Default: 150")
+    parser.add_argument("--workdir", default=None, help="Directory in which a fresh temporary directory for the synthetic genomes dir is created. Default: the system temporary directory")
+    parser.add_argument("--keep-workdir", action="store_true", help="Keep the temporary directory with the synthetic genomes dir after the run.")
+    parser.add_argument("--history", default=str(REPO_ROOT / "benchmarks" / "genomes_startup_history.json"), help="JSON history file to append to.")
+    parser.add_argument("--label", default="", help="Free-text label stored with this run, e.g. a branch or change name.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    params = {"modes": args.modes, "repeats": args.repeats, "accessions": args.accessions}
+
+    # always a new directory, so nothing that already exists under --workdir is touched
+    if args.workdir:
+        Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    workdir = Path(tempfile.mkdtemp(prefix="genomes_startup_", dir=args.workdir))
+    genomes_dir = workdir / "genomes"
+
+    try:
+        if any(mode != "help" for mode in args.modes):
+            write_synthetic_genomes_dir(genomes_dir, args.accessions)
+        results = []
+        for mode in args.modes:
+            print(f"[INFO] Timing {mode}", file=sys.stderr)
+            results.append(run_mode(mode, genomes_dir, args.repeats))
+    finally:
+        if args.keep_workdir:
+            print(f"[INFO] Kept {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    entry = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "label": args.label,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "budget_ms": args.budget_ms,
+        "params": params,
+        "results": results,
+    }
+    history_path = Path(args.history)
+    history = read_history(history_path)
+    previous = next((old for old in reversed(history) if old.get("params") == params), None)
+    history.append(entry)
+    write_history(history_path, history)
+    print_comparison(entry, previous, args.budget_ms)
+    print(f"\n[OK] Appended to {history_path}")
+
+    help_row = next((row for row in results if row["mode"] == "help"), None)
+    if help_row and help_row["status"] != "ok":
+        print(f"\n[ERROR] genomes.py --help failed, so the {args.budget_ms:.0f} ms budget could not be checked.", file=sys.stderr)
+        sys.exit(1)
+    if help_row and help_row["median_ms"] > args.budget_ms:
+        print(f"\n[WARN] genomes.py --help median {help_row['median_ms']} ms is over the {args.budget_ms:.0f} ms budget. Slowest imports:", file=sys.stderr)
+        for line in slowest_imports():
+            print(f"  {line}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
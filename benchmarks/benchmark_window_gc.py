@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Benchmark the window/GC hot paths on synthetic genomes.
+
+Benchmarks:
+  window_build      sql/00_build_starter_sql_tsvs_v14.py: build_sequences_rows() + build_window_tables()
+  compleasm_slices  sql/04_build_compleasm_feature_tsvs_v4.py: extract_introns() + extract_flank()
+  gc4_alignment     gc_analysis/14_gc4_from_alignment.py: calculate_gc4_for_alignment()
+
+Synthetic inputs are generated in a fresh temporary directory (inside --workdir
+when given) from a fixed --seed, so two runs with the same parameters benchmark
+identical data. Each benchmark runs in its own
+child process so peak RSS is per benchmark, not cumulative.
+
+Every run appends one entry to a JSON history file (default:
+benchmarks/benchmark_history.json, ignored by git) with wall time, peak RSS,
+rows and rows/sec per benchmark, plus the git commit and parameters. The
+previous entry with the same parameters is printed alongside, so regressions
+show up between versions.
+
+Example:
+  python benchmarks/benchmark_window_gc.py --genome-size-mb 50 --scaffolds 200 --label "before prefix sums"
+  python benchmarks/benchmark_window_gc.py --genome-size-mb 50 --scaffolds 200 --label "after prefix sums"
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+WINDOW_SCRIPT = REPO_ROOT / "sql" / "00_build_starter_sql_tsvs_v14.py"
+COMPLEASM_SCRIPT = REPO_ROOT / "sql" / "04_build_compleasm_feature_tsvs_v4.py"
+GC4_SCRIPT = REPO_ROOT / "gc_analysis" / "14_gc4_from_alignment.py"
+
+BENCHMARKS = ["window_build", "compleasm_slices", "gc4_alignment"]
+
+SYNTHETIC_ACCESSION = "GCA_900000001.1"
+
+BASES = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+def load_script(path: Path, name: str):
+    """Import a pipeline script (their file names are not valid module names)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # needed for dataclasses and process pools
+    spec.loader.exec_module(module)
+    return module
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS of this process; ru_maxrss is KiB on Linux and bytes on macOS."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return maxrss / (1024 * 1024)
+    return maxrss / 1024
+
+
+def git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(REPO_ROOT), "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+# -----------------------------------------------------------------------------
+# Synthetic inputs
+# -----------------------------------------------------------------------------
+
+
+def scaffold_lengths(rng: np.random.Generator, genome_size_bp: int, n_scaffolds: int) -> List[int]:
+    """Split genome_size_bp into n_scaffolds lognormal-sized pieces, largest first."""
+    weights = rng.lognormal(mean=0.0, sigma=1.5, size=n_scaffolds)
+    lengths = np.maximum(1, np.floor(weights / weights.sum() * genome_size_bp)).astype(np.int64)
+    lengths[0] += genome_size_bp - int(lengths.sum())
+    return sorted((int(length) for length in lengths if length > 0), reverse=True)
+
+
+def synthetic_sequence(
+    rng: np.random.Generator,
+    length: int,
+    gc_fraction: float,
+    n_runs_per_mb: float,
+    mean_n_run_bp: int,
+    softmask_fraction: float,
+) -> np.ndarray:
+    at = (1.0 - gc_fraction) / 2.0
+    gc = gc_fraction / 2.0
+    seq = BASES[rng.choice(4, size=length, p=[at, gc, gc, at])]
+    n_runs = rng.poisson(n_runs_per_mb * length / 1_000_000)
+    for start in rng.integers(0, length, size=n_runs):
+        run = int(rng.geometric(1.0 / max(1, mean_n_run_bp)))
+        seq[start:start + run] = ord("N")
+    if softmask_fraction > 0:
+        # Lowercase a fraction of the genome in 1 kb blocks, like repeat soft-masking.
+        n_blocks = int(length * softmask_fraction / 1000)
+        for start in rng.integers(0, length, size=n_blocks):
+            block = seq[start:start + 1000]
+            seq[start:start + 1000] = np.where(block == ord("N"), block, block | 0x20)
+    return seq
+
+
+def write_synthetic_fasta(path: Path, args: argparse.Namespace) -> Dict[str, int]:
+    """Write a line-wrapped synthetic genome FASTA and return {sequence_id: length}."""
+    rng = np.random.default_rng(args.seed)
+    lengths = scaffold_lengths(rng, int(args.genome_size_mb * 1_000_000), args.scaffolds)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sequences: Dict[str, int] = {}
+    with path.open("wb") as handle:
+        for index, length in enumerate(lengths, start=1):
+            if index <= args.chromosomes:
+                sequence_id = f"CM{index:06d}.1"
+                header = f"{sequence_id} Synthetic species chromosome {index}, whole genome shotgun sequence"
+            else:
+                sequence_id = f"JASYNT01{index:07d}.1"
+                header = f"{sequence_id} Synthetic species scaffold_{index}, whole genome shotgun sequence"
+            seq = synthetic_sequence(
+                rng, length, args.gc_fraction, args.n_runs_per_mb, args.mean_n_run_bp, args.softmask_fraction
+            ).tobytes()
+            handle.write(f">{header}\n".encode())
+            width = args.line_width
+            handle.write(b"\n".join(seq[i:i + width] for i in range(0, length, width)))
+            handle.write(b"\n")
+            sequences[sequence_id] = length
+    return sequences
+
+
+def write_synthetic_full_table(path: Path, sequences: Dict[str, int], args: argparse.Namespace) -> int:
+    """Write a Compleasm-style full_table.tsv of single-copy genes with 2-12 exons each."""
+    rng = np.random.default_rng(args.seed + 1)
+    names = [name for name, length in sequences.items() if length > 50_000]
+    if not names:
+        names = list(sequences)
+    n_genes = 0
+    with path.open("w") as handle:
+        for gene_index in range(args.genes):
+            sequence_id = names[int(rng.integers(0, len(names)))]
+            seq_len = sequences[sequence_id]
+            strand = "+" if rng.random() < 0.5 else "-"
+            n_exons = int(rng.integers(2, 13))
+            exon_lengths = rng.integers(50, 300, size=n_exons)
+            intron_lengths = rng.integers(80, 5000, size=n_exons - 1)
+            span = int(exon_lengths.sum() + intron_lengths.sum())
+            if span + 2 >= seq_len:
+                continue
+            start = int(rng.integers(1, seq_len - span))
+            tokens = []
+            position = start
+            for exon_index, exon_len in enumerate(exon_lengths):
+                tokens.append(f"{position}_{position + int(exon_len) - 1}_{strand}")
+                position += int(exon_len)
+                if exon_index < len(intron_lengths):
+                    position += int(intron_lengths[exon_index])
+            gene_end = position - 1
+            handle.write("\t".join([
+                f"{gene_index}at8457", "Single", sequence_id, "1000", str(span), strand,
+                "", "", "", str(start), str(gene_end), "", "|".join(tokens),
+            ]) + "\n")
+            n_genes += 1
+    return n_genes
+
+
+def write_synthetic_alignment(path: Path, args: argparse.Namespace) -> None:
+    """Write a codon-aware alignment with gaps and Ns at --alignment-gap-fraction."""
+    rng = np.random.default_rng(args.seed + 2)
+    n_sites = args.alignment_codons * 3
+    ancestor = BASES[rng.integers(0, 4, size=n_sites)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as handle:
+        for index in range(args.alignment_sequences):
+            seq = ancestor.copy()
+            mutate = rng.random(n_sites) < 0.1
+            seq[mutate] = BASES[rng.integers(0, 4, size=int(mutate.sum()))]
+            gapped = rng.random(args.alignment_codons) < args.alignment_gap_fraction
+            seq.reshape(-1, 3)[gapped] = ord("-")
+            handle.write(f">species_{index:03d}\n{seq.tobytes().decode()}\n")
+
+
+def prepare_inputs(workdir: Path, args: argparse.Namespace) -> Dict[str, str]:
+    genomes_dir = workdir / "genomes"
+    fasta_path = genomes_dir / SYNTHETIC_ACCESSION / "ncbi_dataset" / "data" / SYNTHETIC_ACCESSION / f"{SYNTHETIC_ACCESSION}_synthetic_genomic.fna"
+    print(f"[INFO] Writing synthetic genome: {fasta_path}", file=sys.stderr)
+    sequences = write_synthetic_fasta(fasta_path, args)
+    full_table = workdir / "full_table.tsv"
+    n_genes = write_synthetic_full_table(full_table, sequences, args)
+    alignment = workdir / "alignment.fasta"
+    write_synthetic_alignment(alignment, args)
+    print(
+        f"[INFO] Synthetic inputs: {len(sequences)} sequences, {sum(sequences.values())} bp, "
+        f"{n_genes} genes, {args.alignment_sequences} x {args.alignment_codons} codon alignment",
+        file=sys.stderr,
+    )
+    return {
+        "genomes_dir": str(genomes_dir),
+        "fasta_path": str(fasta_path),
+        "full_table": str(full_table),
+        "alignment": str(alignment),
+        "output_dir": str(workdir / "out"),
+    }
+
+
+# -----------------------------------------------------------------------------
+# Benchmarks (each runs in a child process)
+# -----------------------------------------------------------------------------
+
+
+def bench_window_build(inputs: Dict[str, str], params: Dict[str, object]) -> Dict[str, object]:
+    module = load_script(WINDOW_SCRIPT, "starter_tsvs")
+    fasta_path = Path(inputs["fasta_path"])
+    output_dir = Path(inputs["output_dir"])
+    shutil.rmtree(output_dir, ignore_errors=True)
+    manifest_rows = [{"accession": SYNTHETIC_ACCESSION}]
+    genomes_rows = [{"genome_pk": 1, "accession_id": SYNTHETIC_ACCESSION, "species_pk": 1}]
+    fasta_lookup = {SYNTHETIC_ACCESSION: fasta_path}
+
+    start = time.perf_counter()
+    sequences_rows = module.build_sequences_rows(manifest_rows, {SYNTHETIC_ACCESSION: 1}, fasta_path_lookup=fasta_lookup)
+    _, chunk_rows, _ = module.build_window_tables(
+        manifest_rows,
+        genomes_rows,
+        sequences_rows,
+        fasta_path_lookup=fasta_lookup,
+        run_pk=1,
+        window_sizes_bp=params["window_sizes_bp"],
+        step_sizes_bp=None,
+        sequence_types=["chromosome", "scaffold", "mitochondrion"],
+        min_callable_frac=0.8,
+        tiling_type="non_overlapping",
+        start_offset_bp=0,
+        mask_mode="raw_fasta_N_excluded",
+        output_dir=output_dir,
+    )
+    wall = time.perf_counter() - start
+    rows = sum(int(row["n_rows"]) for row in chunk_rows if row["table_name"] == "genomic_windows")
+    return {"wall_s": wall, "rows": rows, "rows_unit": "genomic_windows rows"}
+
+
+def bench_compleasm_slices(inputs: Dict[str, str], params: Dict[str, object]) -> Dict[str, object]:
+    module = load_script(COMPLEASM_SCRIPT, "compleasm_features")
+    start = time.perf_counter()
+    records = module.parse_full_table(Path(inputs["full_table"]))
+    genome = module.load_genome(Path(inputs["fasta_path"]))
+    rows = 0
+    for record in records.values():
+        rows += len(module.extract_introns(genome, record))
+        for _, _, up_bp, down_bp in module.FLANK_SPECS:
+            module.extract_flank(genome, record, up_bp, down_bp)
+            rows += 1
+    genome.close()
+    wall = time.perf_counter() - start
+    return {"wall_s": wall, "rows": rows, "rows_unit": "introns + flanks"}
+
+
+def bench_gc4_alignment(inputs: Dict[str, str], params: Dict[str, object]) -> Dict[str, object]:
+    module = load_script(GC4_SCRIPT, "gc4_from_alignment")
+    start = time.perf_counter()
+    module.calculate_gc4_for_alignment(Path(inputs["alignment"]))
+    wall = time.perf_counter() - start
+    rows = int(params["alignment_sequences"]) * int(params["alignment_codons"])
+    return {"wall_s": wall, "rows": rows, "rows_unit": "sequence codons"}
+
+
+BENCHMARK_FUNCTIONS = {
+    "window_build": bench_window_build,
+    "compleasm_slices": bench_compleasm_slices,
+    "gc4_alignment": bench_gc4_alignment,
+}
+
+
+def run_child(name: str, inputs: Dict[str, str], params: Dict[str, object]) -> Dict[str, object]:
+    """Run one benchmark in a fresh interpreter and return its result dict."""
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--run-one",
+        json.dumps({"name": name, "inputs": inputs, "params": params}),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        last_line = (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+        return {"benchmark": name, "status": "failed", "error": last_line}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_one(payload_text: str) -> None:
+    payload = json.loads(payload_text)
+    name = payload["name"]
+    try:
+        result = BENCHMARK_FUNCTIONS[name](payload["inputs"], payload["params"])
+    except ImportError as exc:
+        # e.g. 04_build_compleasm_feature_tsvs needs pandas and biopython.
+        result = {"status": "skipped", "error": f"{type(exc).__name__}: {exc}"}
+    else:
+        result["status"] = "ok"
+        result["peak_rss_mb"] = round(peak_rss_mb(), 1)
+        result["rows_per_s"] = round(result["rows"] / result["wall_s"], 1) if result["wall_s"] > 0 else None
+        result["wall_s"] = round(result["wall_s"], 4)
+    print(json.dumps({"benchmark": name, **result}))
+
+
+# -----------------------------------------------------------------------------
+# History
+# -----------------------------------------------------------------------------
+
+
+def read_history(path: Path) -> List[Dict[str, object]]:
+    if not path.exists():
+        return []
+    with path.open("r") as handle:
+        return json.load(handle)
+
+
+def write_history(path: Path, history: List[Dict[str, object]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w") as handle:
+        json.dump(history, handle, indent=2)
+        handle.write("\n")
+    tmp_path.replace(path)
+
+
+def print_comparison(entry: Dict[str, object], previous: Optional[Dict[str, object]]) -> None:
+    previous_results = {row["benchmark"]: row for row in (previous or {}).get("results", [])}
+    print(f"\n[OK] Benchmarks at {entry['git_commit'] or 'unknown commit'} ({entry['label'] or 'no label'})")
+    if previous:
+        print(f"     compared with {previous['git_commit'] or 'unknown commit'} ({previous['label'] or 'no label'}, {previous['timestamp']})")
+    for row in entry["results"]:
+        if row["status"] != "ok":
+            print(f"  {row['benchmark']:<18} {row['status']}: {row.get('error', '')}")
+            continue
+        line = (
+            f"  {row['benchmark']:<18} {row['wall_s']:>9.3f} s  {row['peak_rss_mb']:>8.1f} MB  "
+            f"{row['rows_per_s']:>12.1f} {row['rows_unit']}/s"
+        )
+        before = previous_results.get(row["benchmark"])
+        if before and before.get("status") == "ok" and before["wall_s"] > 0:
+            change = (row["wall_s"] - before["wall_s"]) / before["wall_s"] * 100
+            line += f"  ({change:+.1f}% wall vs previous)"
+        print(line)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark window/GC hot paths on synthetic genomes.")
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=BENCHMARKS, help="Benchmarks to run. Default: all")
+    parser.add_argument("--genome-size-mb", type=float, default=20.0, help="Synthetic genome size in Mb. Default: 20")
+    parser.add_argument("--scaffolds", type=int, default=50, help="Number of sequences in the synthetic genome. Default: 50")
+    parser.add_argument("--chromosomes", type=int, default=10, help="How many of the largest sequences get chromosome headers. Default: 10")
+    parser.add_argument("--line-width", type=int, default=80, help="FASTA line width. Default: 80")
+    parser.add_argument("--n-runs-per-mb", type=float, default=5.0, help="Average number of N runs per Mb. Default: 5")
+    parser.add_argument("--mean-n-run-bp", type=int, default=500, help="Mean N run length in bp. Default: 500")
+    parser.add_argument("--gc-fraction", type=float, default=0.42, help="Expected GC fraction of non-N bases. Default: 0.42")
+    parser.add_argument("--softmask-fraction", type=float, default=0.3, help="Fraction of the genome soft-masked (lowercase). Default: 0.3")
+    parser.add_argument("--window-sizes-bp", nargs="+", type=int, default=[1000, 10000, 100000], help="Window sizes for window_build. Default: 1000 10000 100000")
+    parser.add_argument("--genes", type=int, default=2000, help="Synthetic Compleasm single-copy genes. Default: 2000")
+    parser.add_argument("--alignment-sequences", type=int, default=80, help="Sequences in the synthetic alignment. Default: 80")
+    parser.add_argument("--alignment-codons", type=int, default=20000, help="Codons in the synthetic alignment. Default: 20000")
+    parser.add_argument("--alignment-gap-fraction", type=float, default=0.05, help="Fraction of gapped codons per sequence. Default: 0.05")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for synthetic inputs. Default: 1")
+    parser.add_argument("--workdir", default=None, help="Directory in which a fresh temporary directory for synthetic inputs/outputs is created. Default: the system temporary directory")
+    parser.add_argument("--keep-workdir", action="store_true", help="Keep the temporary directory with the synthetic inputs after the run.")
+    parser.add_argument("--history", default=str(REPO_ROOT / "benchmarks" / "benchmark_history.json"), help="JSON history file to append to.")
+    parser.add_argument("--label", default="", help="Free-text label stored with this run, e.g. a branch or change name.")
+    parser.add_argument("--run-one", default=None, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.run_one:
+        run_one(args.run_one)
+        return
+
+    params = {
+        key: getattr(args, key)
+        for key in [
+            "genome_size_mb", "scaffolds", "chromosomes", "line_width", "n_runs_per_mb", "mean_n_run_bp",
+            "gc_fraction", "softmask_fraction", "window_sizes_bp", "genes", "alignment_sequences",
+            "alignment_codons", "alignment_gap_fraction", "seed",
+        ]
+    }
+
+    # always a new directory, so nothing that already exists under --workdir is touched
+    if args.workdir:
+        Path(args.workdir).mkdir(parents=True, exist_ok=True)
+    workdir = Path(tempfile.mkdtemp(prefix="gc_benchmark_", dir=args.workdir))
+
+    try:
+        inputs = prepare_inputs(workdir, args)
+        results = []
+        for name in args.benchmarks:
+            print(f"[INFO] Running {name}", file=sys.stderr)
+            results.append(run_child(name, inputs, params))
+    finally:
+        if args.keep_workdir:
+            print(f"[INFO] Kept {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    entry = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "label": args.label,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "params": params,
+        "results": results,
+    }
+    history_path = Path(args.history)
+    history = read_history(history_path)
+    previous = next((old for old in reversed(history) if old.get("params") == params), None)
+    history.append(entry)
+    write_history(history_path, history)
+    print_comparison(entry, previous)
+    print(f"\n[OK] Appended to {history_path}")
+
+
+if __name__ == "__main__":
+    main()
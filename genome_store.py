@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Shared memory-mapped genome store.
+
+Pipeline stages (00_build_starter_sql_tsvs, 04_build_compleasm_feature_tsvs,
+01a_get_cds_from_compleasm, extract_introns_for_one_ortholog,
+validate_intron_slicing) all slice the same genome FASTAs. pyfaidx re-reads and
+re-decodes line-wrapped text for every slice. A genome store holds each FASTA
+once as newline-stripped bytes, so any slice is a plain offset into one
+memory-mapped file and repeated access from many processes is served from the
+page cache.
+
+Layout, built once per accession:
+  genomes/<accession>/genome_store/
+    genome.u8        sequence bytes (uint8, case and IUPAC codes preserved), records back to back
+    sequences.tsv    sequence_id, sequence_length, offset into genome.u8
+    store.json       source FASTA path, size/mtime, store format version
+
+Bytes are kept as uint8 rather than 2-bit codes because downstream code relies
+on soft-masking case and N/IUPAC codes, which 2-bit packing cannot represent.
+
+Reading:
+  store = open_genome_store(fasta_path)           # None if no current store exists
+  store = open_genome_store(fasta_path, build=True)
+  store["chr1"][100:200]                           # str, same as pyfaidx as_raw=True
+  store.array("chr1", 100, 200)                    # zero-copy numpy uint8 view
+  store.fetch("chr1", 100, 200, strand="-")        # reverse complement as str
+
+GenomeStore supports the subset of the pyfaidx.Fasta(as_raw=True) interface
+these scripts use (keys(), "in", genome[id][start:end], len(genome[id]),
+close()), so it can be passed wherever a pyfaidx genome was.
+
+FastaIndexer builds the pyfaidx .fai from FASTA bytes as they are written
+(genomes.py uses it while extracting downloads), so indexing needs no extra
+read of the genome.
+
+Importing from pipeline scripts: scripts under sql/ and compleasm_database/
+put the repository root on sys.path and import this module directly,
+
+  sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # genome_store.py
+  import genome_store
+
+with no fallback of their own. The module imports without numpy or pyfaidx;
+open_genome_store() then returns None (no store can be read), so callers fall
+back to pyfaidx the same way as when no store has been built.
+
+Build from the command line:
+  python genome_store.py genomes/GCF_035046505.1/ncbi_dataset/data/GCF_035046505.1/GCF_035046505.1_genomic.fna
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # only needed to read stores; open_genome_store() returns None without it
+    np = None
+
+try:
+    import pyfaidx
+except ImportError:  # only needed to build a missing .fai
+    pyfaidx = None
+
+
+STORE_DIRNAME = "genome_store"
+STORE_FORMAT_VERSION = 1
+ACCESSION_DIR_PATTERN = re.compile(r"^GC[AF]_\d+\.\d+$")
+
+COMPLEMENT_TABLE = str.maketrans(
+    "ACGTRYSWKMBDHVNacgtryswkmbdhvn",
+    "TGCAYRSWMKVHDBNtgcayrswmkvhdbn",
+)
+
+COMPLEMENT_LOOKUP = None
+if np is not None:
+    COMPLEMENT_LOOKUP = np.arange(256, dtype=np.uint8)
+    for _base, _complement in zip(b"ACGTRYSWKMBDHVNacgtryswkmbdhvn", b"TGCAYRSWMKVHDBNtgcayrswmkvhdbn"):
+        COMPLEMENT_LOOKUP[_base] = _complement
+
+
+def reverse_complement(seq: str) -> str:
+    """Reverse complement a DNA string, keeping case and IUPAC codes."""
+    return str(seq).translate(COMPLEMENT_TABLE)[::-1]
+
+
+def reverse_complement_array(codes: np.ndarray) -> np.ndarray:
+    """Reverse complement a uint8 sequence view; returns a new array."""
+    return COMPLEMENT_LOOKUP[codes[::-1]]
+
+
+def file_signature(path: Path) -> Optional[Dict[str, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def default_store_dir(fasta_path: Path) -> Path:
+    """genomes/<accession>/genome_store for NCBI Datasets layouts, else <fasta>.genome_store.
+
+    The outermost accession-named ancestor is used, so
+    genomes/GCF_x/ncbi_dataset/data/GCF_x/genomic.fna maps to genomes/GCF_x/genome_store.
+    """
+    fasta_path = Path(fasta_path).resolve()
+    accession_dirs = [parent for parent in fasta_path.parents if ACCESSION_DIR_PATTERN.match(parent.name)]
+    if accession_dirs:
+        return accession_dirs[-1] / STORE_DIRNAME
+    return fasta_path.with_name(fasta_path.name + "." + STORE_DIRNAME)
+
+
+def read_fai(fai_path: Path) -> List[Tuple[str, int, int, int, int]]:
+    entries = []
+    with fai_path.open("r") as handle:
+        for line in handle:
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) >= 5:
+                entries.append((fields[0], int(fields[1]), int(fields[2]), int(fields[3]), int(fields[4])))
+    return entries
+
+
+def write_fai(fai_path: Path, entries: List[Tuple[str, int, int, int, int]]) -> None:
+    tmp_path = fai_path.with_name(fai_path.name + ".tmp")
+    with tmp_path.open("w") as handle:
+        for name, length, offset, line_bases, line_width in entries:
+            handle.write(f"{name}\t{length}\t{offset}\t{line_bases}\t{line_width}\n")
+    os.replace(tmp_path, fai_path)
+
+
+def fai_entry_is_consistent(bad_lines: List[Tuple[int, int]], last_line: int) -> bool:
+    """pyfaidx's check_bad_lines(): off-width lines are only allowed at the end of an entry.
+
+    bad_lines holds (line index, byte length) for every line whose length
+    differs from the entry's first line, and for blank lines. One such line is
+    fine if it is the entry's last line. Two are fine if they are a non-blank
+    line followed by a blank last line.
+    """
+    if not bad_lines:
+        return True
+    if len(bad_lines) == 1:
+        return bad_lines[0][0] == last_line
+    if len(bad_lines) == 2:
+        return (
+            bad_lines[0][0] + 1 == last_line
+            and bad_lines[0][1] > 1
+            and bad_lines[1][0] == last_line
+            and bad_lines[1][1] == 1
+        )
+    return False
+
+
+class FastaIndexer:
+    """Build .fai entries from FASTA bytes as they stream past.
+
+    feed() takes arbitrary chunks (e.g. while copying a FASTA out of a zip), so
+    the index costs no extra read of the file. Line-length rules match
+    pyfaidx's build_index(), so the result is the .fai pyfaidx would write.
+    """
+
+    def __init__(self, label: str = "FASTA") -> None:
+        self.label = label
+        self.entries: List[Tuple[str, int, int, int, int]] = []
+        self.name: Optional[str] = None
+        self.line_number = 0
+        self.offset = 0
+        self.record_offset = 0
+        self.length = 0
+        self.line_bases = 0
+        self.line_width = 0
+        self.bad_lines: List[Tuple[int, int]] = []
+        self.tail = b""
+
+    def feed(self, data: bytes) -> None:
+        lines = (self.tail + data).split(b"\n")
+        self.tail = lines.pop()
+        for line in lines:
+            self._add_line(line, len(line) + 1)
+
+    def finish(self) -> List[Tuple[str, int, int, int, int]]:
+        if self.tail:
+            self._add_line(self.tail, len(self.tail))
+            self.tail = b""
+        self._close_record(self.line_number - 1)
+        if not self.entries:
+            raise ValueError(f"No FASTA records found in {self.label}")
+        return self.entries
+
+    def _close_record(self, last_line: int) -> None:
+        if self.name is None:
+            return
+        if not fai_entry_is_consistent(self.bad_lines, last_line):
+            raise ValueError(
+                f"Line length of FASTA is not consistent: >{self.name} at line "
+                f"{self.bad_lines[0][0] + 1} of {self.label}"
+            )
+        self.entries.append((self.name, self.length, self.record_offset, self.line_bases, self.line_width))
+        self.name = None
+
+    def _add_line(self, line: bytes, n_bytes: int) -> None:
+        line_number = self.line_number
+        self.line_number += 1
+        if line[:1] == b">":
+            self._close_record(line_number - 1)
+            fields = line[1:].decode().rstrip("\r").split()
+            if not fields:
+                raise ValueError(f"Bad sequence name at line {line_number + 1} of {self.label}")
+            self.name = fields[0]
+            self.offset += n_bytes
+            self.record_offset = self.offset
+            self.length = 0
+            self.line_bases = 0
+            self.line_width = 0
+            self.bad_lines = []
+            return
+        n_bases = len(line.rstrip(b"\r"))
+        if not self.line_width:
+            self.line_width = n_bytes
+        if not self.line_bases:
+            self.line_bases = n_bases
+        if n_bytes != self.line_width or n_bytes == 1:
+            self.bad_lines.append((line_number, n_bytes))
+            if len(self.bad_lines) > 2:
+                self._close_record(line_number)
+        self.offset += n_bytes
+        self.length += n_bases
+
+
+def index_fasta_file(fasta_path: Path, chunk_bytes: int = 1 << 20) -> List[Tuple[str, int, int, int, int]]:
+    """.fai entries for a FASTA already on disk, via FastaIndexer (no pyfaidx needed)."""
+    indexer = FastaIndexer(str(fasta_path))
+    with Path(fasta_path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_bytes), b""):
+            indexer.feed(chunk)
+    return indexer.finish()
+
+
+def ensure_fai(fasta_path: Path) -> Path:
+    """Return a current .fai for fasta_path, building it with pyfaidx if needed."""
+    fai_path = Path(f"{fasta_path}.fai")
+    if fai_path.exists() and fai_path.stat().st_mtime >= fasta_path.stat().st_mtime:
+        return fai_path
+    if pyfaidx is None:
+        raise ImportError("pyfaidx is required to index FASTA files. Install with: conda install -c bioconda pyfaidx")
+    pyfaidx.Faidx(str(fasta_path), build_index=True).close()
+    return fai_path
+
+
+def store_is_current(store_dir: Path, fasta_path: Path) -> bool:
+    try:
+        with (store_dir / "store.json").open("r") as handle:
+            meta = json.load(handle)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    return (
+        meta.get("format_version") == STORE_FORMAT_VERSION
+        and meta.get("fasta_path") == str(Path(fasta_path).resolve())
+        and meta.get("fasta_signature") == file_signature(Path(fasta_path))
+        and (store_dir / "genome.u8").exists()
+        and (store_dir / "sequences.tsv").exists()
+    )
+
+
+def build_genome_store(fasta_path: Path, store_dir: Optional[Path] = None) -> Path:
+    """Write a genome store for fasta_path and return its directory.
+
+    Each record is read as one block using the .fai offsets and its newlines
+    are dropped with bytes.translate(), so no per-line Python loop is needed.
+    The store is written to a temporary directory and renamed into place, so
+    concurrent readers never see a partial store.
+    """
+    fasta_path = Path(fasta_path).resolve()
+    store_dir = Path(store_dir) if store_dir is not None else default_store_dir(fasta_path)
+    entries = read_fai(ensure_fai(fasta_path))
+
+    tmp_dir = store_dir.with_name(f"{store_dir.name}.tmp.{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    print(f"[INFO] Building genome store {store_dir} from {fasta_path}", file=sys.stderr)
+
+    rows = []
+    store_offset = 0
+    with fasta_path.open("rb") as fasta, (tmp_dir / "genome.u8").open("wb") as out:
+        for name, length, offset, line_bases, line_width in entries:
+            if line_bases > 0:
+                full_lines, remainder = divmod(length, line_bases)
+                n_bytes = full_lines * line_width + remainder
+            else:
+                n_bytes = 0
+            fasta.seek(offset)
+            data = fasta.read(n_bytes).translate(None, b"\r\n")
+            if len(data) != length:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise ValueError(f"Sequence {name} in {fasta_path} does not match its .fai length ({len(data)} != {length})")
+            out.write(data)
+            rows.append((name, length, store_offset))
+            store_offset += length
+
+    with (tmp_dir / "sequences.tsv").open("w", newline="") as handle:
+        writer = csv.writer(handle, delimiter="\t", lineterminator="\n")
+        writer.writerow(["sequence_id", "sequence_length", "offset"])
+        writer.writerows(rows)
+    with (tmp_dir / "store.json").open("w") as handle:
+        json.dump(
+            {
+                "format_version": STORE_FORMAT_VERSION,
+                "fasta_path": str(fasta_path),
+                "fasta_signature": file_signature(fasta_path),
+                "n_sequences": len(rows),
+                "total_bp": store_offset,
+            },
+            handle,
+            indent=2,
+        )
+
+    if store_dir.exists():
+        shutil.rmtree(store_dir)
+    try:
+        tmp_dir.rename(store_dir)
+    except OSError:
+        # Another process finished the same store first.
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not store_is_current(store_dir, fasta_path):
+            raise
+    return store_dir
+
+
+class GenomeSequence:
+    """One record of a GenomeStore; slicing returns str like pyfaidx as_raw=True."""
+
+    def __init__(self, store: "GenomeStore", name: str, offset: int, length: int) -> None:
+        self.store = store
+        self.name = name
+        self.offset = offset
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def array(self) -> np.ndarray:
+        """Zero-copy uint8 view of the whole sequence."""
+        return self.store.data[self.offset:self.offset + self.length]
+
+    def __getitem__(self, key) -> str:
+        if isinstance(key, slice):
+            return self.array[key].tobytes().decode("ascii", "replace")
+        return chr(self.array[key])
+
+    def __str__(self) -> str:
+        return self[:]
+
+
+class GenomeStore:
+    """Read-only, memory-mapped view of a genome store directory."""
+
+    def __init__(self, store_dir: Path) -> None:
+        self.store_dir = Path(store_dir)
+        self.index: Dict[str, Tuple[int, int]] = {}
+        with (self.store_dir / "sequences.tsv").open("r", newline="") as handle:
+            for row in csv.DictReader(handle, delimiter="\t"):
+                self.index[row["sequence_id"]] = (int(row["offset"]), int(row["sequence_length"]))
+        total_bp = sum(length for _, length in self.index.values())
+        # np.memmap cannot map an empty file.
+        if total_bp:
+            self.data = np.memmap(self.store_dir / "genome.u8", dtype=np.uint8, mode="r")
+        else:
+            self.data = np.zeros(0, dtype=np.uint8)
+
+    def keys(self):
+        return self.index.keys()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __getitem__(self, name: str) -> GenomeSequence:
+        offset, length = self.index[name]
+        return GenomeSequence(self, name, offset, length)
+
+    def array(self, name: str, start0: int = 0, end0: Optional[int] = None) -> np.ndarray:
+        """Zero-copy uint8 view of [start0, end0) on one sequence (clamped like Python slices)."""
+        return self[name].array[start0:end0]
+
+    def fetch(self, name: str, start0: int, end0: int, strand: str = "+") -> str:
+        """Return [start0, end0) as str, reverse complemented when strand is '-'."""
+        codes = self.array(name, start0, end0)
+        if strand == "-":
+            codes = reverse_complement_array(codes)
+        return codes.tobytes().decode("ascii", "replace")
+
+    def close(self) -> None:
+        mmap_handle = getattr(self.data, "_mmap", None)
+        self.data = np.zeros(0, dtype=np.uint8)
+        if mmap_handle is not None:
+            mmap_handle.close()
+
+
+def open_genome_store(
+    fasta_path: Path,
+    store_dir: Optional[Path] = None,
+    build: bool = False,
+) -> Optional[GenomeStore]:
+    """Open the store for fasta_path; build it first when build=True, else None if missing or stale.
+
+    Without numpy no store can be read: returns None, or raises ImportError when build=True.
+    """
+    if np is None:
+        if build:
+            raise ImportError("numpy is required to build and read genome stores. Install with: conda install numpy")
+        return None
+    store_dir = Path(store_dir) if store_dir is not None else default_store_dir(Path(fasta_path))
+    if not store_is_current(store_dir, Path(fasta_path)):
+        if not build:
+            return None
+        build_genome_store(Path(fasta_path), store_dir)
+    return GenomeStore(store_dir)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build memory-mapped genome stores for genomic FASTA files.")
+    parser.add_argument("fasta", nargs="+", help="Genomic FASTA path(s).")
+    parser.add_argument(
+        "--store-dir",
+        default=None,
+        help="Output directory (only with one FASTA). Default: genomes/<accession>/genome_store",
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the store is current.")
+    args = parser.parse_args()
+    if args.store_dir and len(args.fasta) > 1:
+        raise ValueError("--store-dir can only be used with a single FASTA.")
+
+    for fasta in args.fasta:
+        fasta_path = Path(fasta).resolve()
+        store_dir = Path(args.store_dir) if args.store_dir else default_store_dir(fasta_path)
+        if not args.force and store_is_current(store_dir, fasta_path):
+            print(f"[INFO] Genome store is current: {store_dir}", file=sys.stderr)
+            continue
+        build_genome_store(fasta_path, store_dir)
+        print(f"[OK] {store_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,52 @@ import json
 import os
 import shlex
 import shutil
-import subprocess
 import sys
+import threading
+from collections import deque
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Optional
-
-import jsonlines
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# genomes.py is started many times from batch scripts, so modules only some modes need
+# (jsonlines, sqlite3, zipfile, hashlib, subprocess, concurrent.futures, genome_store)
+# are imported inside the methods that use them. benchmarks/benchmark_genomes_startup.py
+# tracks the cold-start time.
+
+LINEAGE_FIELDS = ["phylum", "superorder", "order", "family", "genus", "genus_species"]
+TAXONKIT_DUMP_FILES = ("names.dmp", "nodes.dmp", "merged.dmp", "delnodes.dmp")
+ACCESSION_FILE_KINDS = ["fna", "gff", "lift_gff", "assembly_data_report"]
+EXTRACT_CHUNK_BYTES = 1 << 20
+# per-accession download journal, in order; a rerun resumes after the last completed state
+DOWNLOAD_STATES = ["queued", "downloaded", "verified", "unpacked", "indexed", "cataloged"]
+DOWNLOAD_JOURNAL_COLUMNS = {
+    "state": "TEXT NOT NULL",
+    "zip_sha256": "TEXT NOT NULL DEFAULT ''",
+    "zip_size": "INTEGER NOT NULL DEFAULT 0",
+    "fasta_path": "TEXT NOT NULL DEFAULT ''",
+    "fasta_sha256": "TEXT NOT NULL DEFAULT ''",
+    "fasta_size": "INTEGER NOT NULL DEFAULT 0",
+    "fasta_mtime_ns": "INTEGER NOT NULL DEFAULT 0",
+    "updated_at": "TEXT NOT NULL DEFAULT ''",
+}
+SPECIES_INDEX_FIELDS = [
+    "species_key",
+    "organism_name",
+    "accession",
+    "accession_root",
+    "assembly_name",
+    "source_database",
+    "assembly_level",
+    "refseq_category",
+    "downloaded_at",
+    "status",
+    "replaced_by_accession",
+    "project_count",
+    "notes",
+]
 
 def require_genomes_dir(path: Path) -> Path:
     path = path.resolve()
@@ -38,12 +77,54 @@ def build_species_key(organism_name: str) -> str:
 def now_iso() -> str:
     return datetime.datetime.now().isoformat(timespec="seconds")
 
+def taxonkit_data_dir() -> Path:
+    # same lookup taxonkit uses: $TAXONKIT_DB, else ~/.taxonkit (see setup_taxonkit.sh)
+    return Path(os.environ.get("TAXONKIT_DB") or Path.home() / ".taxonkit")
+
+def taxdump_version(data_dir: Path) -> str:
+    # size + mtime of the dump files; changes whenever setup_taxonkit.sh installs a new taxdump
+    parts = []
+    for name in TAXONKIT_DUMP_FILES:
+        try:
+            stat = (data_dir / name).stat()
+        except FileNotFoundError:
+            parts.append(f"{name}:missing")
+            continue
+        parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return ";".join(parts)
+
 def read_csv_rows(path: Path) -> list[dict[str, str]]:
     if not path.exists():
         return []
     with open(path, "r", newline="", encoding="utf-8") as handle:
         return list(csv.DictReader(handle))
 
+def sha256_file(path: Path) -> str:
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(EXTRACT_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def parse_md5sum_txt(text: str) -> dict[str, str]:
+    # md5sum.txt shipped in NCBI Datasets zips: "<md5>  <member path>"
+    checksums = {}
+    for line in text.splitlines():
+        fields = line.strip().split(None, 1)
+        if len(fields) == 2:
+            checksums[fields[1].lstrip("*").strip()] = fields[0].lower()
+    return checksums
+
+def catalog_json(entry: dict) -> str:
+    # same text jsonlines writes with compact=True
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+def store_value(value) -> str:
+    # genomes_metadata values are stored the way csv.DictWriter writes them
+    return "" if value is None else str(value)
+
 def write_csv_rows(path: Path, fieldnames: list[str], rows: list[dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", newline="", encoding="utf-8") as handle:
@@ -82,7 +163,157 @@ class AssemblyRecord:
     metadata_last_updated: str
     ncbi_search_term: str
     notes: str
-    
+
+METADATA_FIELDS = list(AssemblyRecord.__dataclass_fields__.keys())
+
+# Summary filters applied by every query (see DatasetsCliBackend.summary_command)
+QUERY_ASSEMBLY_LEVELS = ("chromosome", "complete genome")
+
+class DatasetsCliBackend:
+    # NCBI summaries and genome zips from the live datasets CLI
+    name = "datasets CLI"
+
+    def check_available(self) -> None:
+        exit_val = os.system("datasets --help > /dev/null 2>&1")
+        if exit_val != 0:
+            raise RuntimeError("NCBI datasets CLI not found in PATH") # this is better than sys.exit - which is considered unnecessary/extreme
+
+    def summary_command(self, search_term: str, is_accession: bool, out_path: Path) -> str:
+        if is_accession:
+            query_bit = f"accession {shlex.quote(search_term)}"
+        else:
+            query_bit = f"taxon {shlex.quote(search_term)}"
+       
+        return (
+            f"datasets summary genome {query_bit} "
+            f"--assembly-level chromosome --assembly-level complete "
+            f"--as-json-lines > {shlex.quote(str(out_path))}" # store the summary info in the search_term_updates_jsonl
+            )
+
+    def write_summary(self, search_term: str, is_accession: bool, out_path: Path) -> int:
+        return os.system(self.summary_command(search_term, is_accession, out_path))
+
+    def download_command(self, accession: str, zip_path: Path) -> str:
+        return (
+            f"datasets download genome accession {accession} "
+            f"--reference --include genome,gff3 --filename {shlex.quote(str(zip_path))}" # shlex.quote(str()) allows this to be used in the command line argument
+        )
+
+    def download(self, accession: str, zip_path: Path) -> int:
+        return os.system(self.download_command(accession, zip_path))
+
+    def accession_summary(self, accession: str, scratch_dir: Path) -> Optional[dict]:
+        tmp_jsonl = scratch_dir / f"{accession}_retry_summary.jsonl"
+        cmd = (
+            f"datasets summary genome accession {shlex.quote(accession)} "
+            f"--reference --as-json-lines > {shlex.quote(str(tmp_jsonl))}"
+        )
+        exit_val = os.system(cmd)
+        if exit_val != 0 or not tmp_jsonl.exists():
+            return None
+
+        try:
+            with open(tmp_jsonl, "r", encoding="utf-8") as handle:
+                for raw_line in handle:
+                    if not raw_line.strip():
+                        continue
+                    row = json.loads(raw_line)
+                    if row.get("accession", "") == accession:
+                        return row
+        finally:
+            if tmp_jsonl.exists():
+                tmp_jsonl.unlink()
+        return None
+
+class MirrorBackend:
+    # NCBI summaries and genome zips from a local mirror directory, for air-gapped
+    # nodes, regression tests and benchmarks:
+    #   <mirror>/summaries/*.jsonl   datasets summary rows (--as-json-lines output)
+    #   <mirror>/zips/<accession>.zip   datasets download zips
+    # A taxon query uses summaries/<safe_tag(term)>.jsonl when it exists (a saved
+    # datasets summary for that term); otherwise it selects rows whose tax_id equals the
+    # term or whose organism name starts with it, at chromosome/complete level. That
+    # fallback only works for species (summary rows carry no higher ranks), so other
+    # terms without a saved summary are an error rather than an empty result.
+    name = "mirror"
+
+    def __init__(self, mirror_dir: str):
+        self.mirror_dir = Path(mirror_dir).resolve()
+        self.summaries_dir = self.mirror_dir / "summaries"
+        self.zips_dir = self.mirror_dir / "zips"
+        self._rows_by_accession: Optional[dict[str, dict]] = None
+        self._lock = threading.Lock()
+
+    def check_available(self) -> None:
+        if not self.summaries_dir.is_dir() or not self.zips_dir.is_dir():
+            raise RuntimeError(f"Mirror {self.mirror_dir} needs summaries/ and zips/ directories")
+
+    def rows_by_accession(self) -> dict[str, dict]:
+        with self._lock: # rebuild workers may ask for summaries concurrently
+            if self._rows_by_accession is None:
+                rows: dict[str, dict] = {}
+                for path in sorted(self.summaries_dir.glob("*.jsonl")):
+                    with open(path, "r", encoding="utf-8") as handle:
+                        for raw_line in handle:
+                            if not raw_line.strip():
+                                continue
+                            row = json.loads(raw_line)
+                            if row.get("accession", ""):
+                                rows.setdefault(row["accession"], row)
+                self._rows_by_accession = rows
+        return self._rows_by_accession
+
+    def summary_command(self, search_term: str, is_accession: bool, out_path: Path) -> str:
+        return f"mirror summary {search_term!r} from {self.summaries_dir} > {out_path}"
+
+    def write_summary(self, search_term: str, is_accession: bool, out_path: Path) -> int:
+        saved = self.summaries_dir / f"{safe_tag(search_term)}.jsonl"
+        if not is_accession and saved.exists():
+            shutil.copyfile(saved, out_path)
+            return 0
+
+        term = search_term.strip().lower()
+        rows = self.rows_by_accession()
+        if not is_accession:
+            is_species_term = len(term.split()) >= 2 or any(
+                str(row.get("organism", {}).get("tax_id", "")) == search_term for row in rows.values()
+            )
+            if not is_species_term:
+                raise RuntimeError(
+                    f"Mirror {self.mirror_dir} has no saved summary {saved.name} for {search_term!r}. "
+                    "Without one only species names or species tax ids can be matched; save "
+                    f"`datasets summary genome taxon {search_term!r} --as-json-lines` output there."
+                )
+        selected = []
+        for accession, row in rows.items():
+            organism = row.get("organism", {})
+            level = row.get("assembly_info", {}).get("assembly_level", "").lower()
+            if is_accession:
+                if accession == search_term:
+                    selected.append(row)
+            elif level in QUERY_ASSEMBLY_LEVELS and (
+                str(organism.get("tax_id", "")) == search_term
+                or organism.get("organism_name", "").lower().startswith(term)
+            ):
+                selected.append(row)
+        with open(out_path, "w", encoding="utf-8") as handle:
+            for row in selected:
+                handle.write(catalog_json(row) + "\n")
+        return 0
+
+    def download_command(self, accession: str, zip_path: Path) -> str:
+        return f"mirror copy {self.zips_dir / f'{accession}.zip'} -> {zip_path}"
+
+    def download(self, accession: str, zip_path: Path) -> int:
+        src = self.zips_dir / f"{accession}.zip"
+        if not src.exists():
+            return 1
+        shutil.copyfile(src, zip_path)
+        return 0
+
+    def accession_summary(self, accession: str, scratch_dir: Path) -> Optional[dict]:
+        return self.rows_by_accession().get(accession)
+
 class GenomeManagerHybrid:
     def __init__(
         self,
@@ -98,6 +329,12 @@ class GenomeManagerHybrid:
         project_accessions_csv: Optional[str] = None,
         project_accessions_txt: Optional[str] = None,
         project_accessions: Optional[list[str]] = None,        
+        max_parallel_downloads: int = 3,
+        persist_file_index: bool = False,
+        jobs: int = 1,
+        skip_exports: bool = False,
+        export_records_only: bool = False,
+        backend=None,
     ):
         self.genomes_dir = require_genomes_dir(Path(genomes_dir))
         self.records_dir = self.genomes_dir / "records"
@@ -118,11 +355,22 @@ class GenomeManagerHybrid:
         self.project_accessions_csv = project_accessions_csv
         self.project_accessions_txt = project_accessions_txt
         self.project_accessions = project_accessions or []
+        if max_parallel_downloads < 1:
+            raise ValueError("max_parallel_downloads must be at least 1")
+        self.max_parallel_downloads = max_parallel_downloads
+        self.persist_file_index = persist_file_index
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+        self.jobs = jobs
+        self.skip_exports = skip_exports
+        self.export_records_only = export_records_only
+        self.backend = backend or DatasetsCliBackend()
         self.on_colab = ("google.colab" in sys.modules) # I don't understand what this is doing
         self.root_local = self.genomes_dir.parent
         self.root_drive = Path("/content/drive/Othercomputers/macbook/projects")
         
         self.genomes_catalog_jsonl = self.records_dir / "genomes_catalog.jsonl"
+        self.catalog_store_sqlite = self.records_dir / "genomes_catalog.sqlite"
         self.genomes_metadata_csv = self.records_dir / "genomes_metadata.csv"
         self.species_assembly_index = self.records_dir /  "species_assembly_index.csv"
         self.update_history_jsonl = self.records_dir / "assembly_update_history.jsonl"
@@ -130,10 +378,19 @@ class GenomeManagerHybrid:
         self.records_log_txt = self.records_dir / "genome_auto_update_records_log.txt"
         self.updates_jsonl = self.records_dir / f"{self.safe_tag}_updates.jsonl"
         self.download_failures_csv = self.records_dir / "download_failures.csv"
+        self.lineage_cache_json = self.records_dir / "taxonkit_lineage_cache.json"
+        self.accession_files_json = self.records_dir / "accession_files_index.json"
         
         self.data: list[dict] = []
         self.successfully_downloaded_data: list[str] = []
         self.failed_downloads: list[dict[str,str]]=[]
+        self._log_lock = threading.Lock() # download workers log from their own threads
+        self._lineage_cache: Optional[dict[str, dict[str, str]]] = None
+        self._unresolved_taxa: set[str] = set() # taxonkit failed or had no lineage; not retried this run
+        self._store: Optional[sqlite3.Connection] = None
+        self._dirty_exports: set[str] = set() # "metadata" and/or "catalog"
+        self._accession_files: Optional[dict[str, dict]] = None # accession -> {"files": ..., "dir_mtimes": ...}
+        self._datasets_cli_found = False
         self.project_selected_accessions: list[str] = []
         self.rebuild_preview: dict = {
             "local_accessions": [],
@@ -145,41 +402,41 @@ class GenomeManagerHybrid:
             }
         
         
-    def initialize_records(self) -> None:
+    def initialize_records(self, full: bool = True) -> None:
+        # preview/export modes only need records/ itself (the log is created on first write);
+        # download runs also set up project_manifests/ and the catalog export
         self.records_dir.mkdir(parents=True, exist_ok=True)
+        if not full:
+            return
         self.project_manifests_dir.mkdir(parents=True, exist_ok=True)
-        self.genomes_catalog_jsonl.touch(exist_ok=True)
+        if not self.genomes_catalog_jsonl.exists(): # touching it would look like a hand edit to export_edited()
+            self.genomes_catalog_jsonl.touch()
         self.records_log_txt.touch(exist_ok=True)
 
     def log(self, message: str) -> None:
-        with open(self.records_log_txt, "a", encoding="utf-8") as handle:
+        with self._log_lock, open(self.records_log_txt, "a", encoding="utf-8") as handle:
             handle.write(message)
 
     def require_datasets_cli(self) -> None:
-        exit_val = os.system("datasets --help > /dev/null 2>&1")
-        if exit_val != 0:
-            self.log(f"\n\n\n{now_iso()} ***ERROR*** datasets CLI not found in PATH\n")
-            raise RuntimeError("NCBI datasets CLI not found in PATH") # this is better than sys.exit - which is considered unnecessary/extreme
-        self.log(f"\n\n\n{now_iso()} datasets CLI detected\n")
+        if self._datasets_cli_found: # checked once per run; rebuild calls this for every local-only accession
+            return
+        try:
+            self.backend.check_available()
+        except RuntimeError as exc:
+            self.log(f"\n\n\n{now_iso()} ***ERROR*** {exc}\n")
+            raise
+        self._datasets_cli_found = True
+        self.log(f"\n\n\n{now_iso()} {self.backend.name} detected\n")
     
     def build_ncbi_summary_command(self) -> str:
-        if self.is_accession:
-            query_bit = f"accession {shlex.quote(self.search_term)}"
-        else:
-            query_bit = f"taxon {shlex.quote(self.search_term)}"
-       
-        return (
-            f"datasets summary genome {query_bit} "
-            f"--assembly-level chromosome --assembly-level complete "
-            f"--as-json-lines > {shlex.quote(str(self.updates_jsonl))}" # store the summary info in the search_term_updates_jsonl
-            )
+        return self.backend.summary_command(self.search_term, self.is_accession, self.updates_jsonl)
     
     def query_ncbi(self) -> None:
         cmd = self.build_ncbi_summary_command()
         self.log(f"\nChecking NCBI with command:\n{cmd}\n")
         
         os.chdir(self.records_dir)
-        exit_val = os.system(cmd)
+        exit_val = self.backend.write_summary(self.search_term, self.is_accession, self.updates_jsonl)
         if exit_val != 0:
             self.log(f"\n***ERROR*** failed to retrieve NCBI updates: {self.updates_jsonl}\n")
             raise RuntimeError("Failed to retrieve updates from NCBI")
@@ -189,19 +446,193 @@ class GenomeManagerHybrid:
         self._load_new_entries_from_updates()
 
     def _compact_jsonl(self, path: Path) -> None:
+        import jsonlines
+
         tmp = path.with_suffix(".compact.jsonl")
         with jsonlines.open(path, mode = "r") as reader, jsonlines.open(tmp, mode="w", compact=True) as writer:
             for line in reader:
                 writer.write(line)
         os.replace(tmp, path) # used to rename a file or dir from src (tmp) -> dst (path), replaces dst file if it exists
     
-    def _load_new_entries_from_updates(self) -> None:
-        try:
+    def catalog_store(self) -> sqlite3.Connection:
+        # records/genomes_catalog.sqlite is the source of truth for genomes_metadata and the
+        # catalog; genomes_metadata.csv and species_assembly_index.csv are exports regenerated
+        # from it by export_records(), genomes_catalog.jsonl stays append-only (rewritten only
+        # by --export-records)
+        if self._store is not None:
+            return self._store
+
+        import sqlite3
+
+        conn = sqlite3.connect(self.catalog_store_sqlite)
+        columns = ", ".join(f'"{field}" TEXT NOT NULL DEFAULT \'\'' for field in METADATA_FIELDS)
+        with conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS genomes_metadata ({columns}, PRIMARY KEY (accession))")
+            conn.execute("CREATE INDEX IF NOT EXISTS genomes_metadata_species_key ON genomes_metadata (species_key)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS catalog_entries ("
+                "accession TEXT PRIMARY KEY, root_acc TEXT NOT NULL, entry_json TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS catalog_entries_root_acc ON catalog_entries (root_acc)")
+            journal_columns = ", ".join(f"{name} {kind}" for name, kind in DOWNLOAD_JOURNAL_COLUMNS.items())
+            conn.execute(f"CREATE TABLE IF NOT EXISTS download_journal (accession TEXT PRIMARY KEY, {journal_columns})")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS export_signatures ("
+                "file_name TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL)"
+            )
+        self._store = conn
+        self.import_existing_records()
+        return conn
+
+    def import_existing_records(self) -> None:
+        # first run against an existing records/ folder: seed the store from the CSV/JSONL files.
+        # An export edited by hand since it was last written is authoritative again, as the CSV
+        # was before the store existed: its table is replaced, so deleted rows stay deleted.
+        conn = self.catalog_store()
+        metadata_empty = conn.execute("SELECT COUNT(*) FROM genomes_metadata").fetchone()[0] == 0
+        metadata_edited = not metadata_empty and self.export_edited(self.genomes_metadata_csv)
+        if metadata_empty or metadata_edited:
+            rows = read_csv_rows(self.genomes_metadata_csv)
+            if rows or metadata_edited:
+                with conn:
+                    if metadata_edited:
+                        self.log(
+                            f"***WARNING*** {self.genomes_metadata_csv} changed since it was last exported; "
+                            f"replacing genomes_metadata in {self.catalog_store_sqlite} with it\n"
+                        )
+                        self.log_removed_accessions("genomes_metadata", {row.get("accession", "") for row in rows})
+                        conn.execute("DELETE FROM genomes_metadata")
+                    self.upsert_metadata_rows(rows)
+                    self.record_export_signature(self.genomes_metadata_csv)
+                self.log(f"Imported {len(rows)} rows from {self.genomes_metadata_csv} into {self.catalog_store_sqlite}\n")
+
+        catalog_empty = conn.execute("SELECT COUNT(*) FROM catalog_entries").fetchone()[0] == 0
+        catalog_edited = not catalog_empty and self.export_edited(self.genomes_catalog_jsonl)
+        if (catalog_empty or catalog_edited) and self.genomes_catalog_jsonl.exists():
+            entries = []
             with open(self.genomes_catalog_jsonl, "r", encoding="utf-8") as handle:
-                local_text = handle.read()
-        except FileNotFoundError:
-            local_text = ""
-        
+                for raw_line in handle:
+                    if raw_line.strip():
+                        entries.append(json.loads(raw_line))
+            if entries or catalog_edited:
+                with conn:
+                    if catalog_edited:
+                        self.log(
+                            f"***WARNING*** {self.genomes_catalog_jsonl} changed since it was last written; "
+                            f"replacing catalog_entries in {self.catalog_store_sqlite} with it\n"
+                        )
+                        self.log_removed_accessions("catalog_entries", {entry.get("accession", "") for entry in entries})
+                        conn.execute("DELETE FROM catalog_entries")
+                    self.upsert_catalog_entries(entries)
+                    self.record_export_signature(self.genomes_catalog_jsonl)
+                self.log(f"Imported {len(entries)} entries from {self.genomes_catalog_jsonl} into {self.catalog_store_sqlite}\n")
+
+    def log_removed_accessions(self, table: str, kept: set[str]) -> None:
+        cursor = self.catalog_store().execute(f"SELECT accession FROM {table} ORDER BY rowid")
+        removed = [accession for (accession,) in cursor if accession not in kept]
+        if removed:
+            self.log(f"Removed {len(removed)} accessions from {table} that are no longer in the export: {', '.join(removed)}\n")
+
+    def record_export_signature(self, path: Path) -> None:
+        # size and mtime of an export as this script last wrote it; the caller commits
+        stat = path.stat()
+        self.catalog_store().execute(
+            "INSERT INTO export_signatures (file_name, size, mtime_ns) VALUES (?, ?, ?) "
+            "ON CONFLICT (file_name) DO UPDATE SET size = excluded.size, mtime_ns = excluded.mtime_ns",
+            (path.name, stat.st_size, stat.st_mtime_ns),
+        )
+
+    def export_edited(self, path: Path) -> bool:
+        # True when the file changed after this script last wrote it. Files without a
+        # recorded signature (stores from before signatures were kept) are recorded as-is.
+        if not path.exists():
+            return False
+        conn = self.catalog_store()
+        row = conn.execute("SELECT size, mtime_ns FROM export_signatures WHERE file_name = ?", (path.name,)).fetchone()
+        stat = path.stat()
+        if row is None:
+            with conn:
+                self.record_export_signature(path)
+            return False
+        return tuple(row) != (stat.st_size, stat.st_mtime_ns)
+
+    def upsert_metadata_rows(self, rows: list[dict]) -> None:
+        columns = ", ".join(f'"{field}"' for field in METADATA_FIELDS)
+        placeholders = ", ".join("?" for _ in METADATA_FIELDS)
+        updates = ", ".join(f'"{field}" = excluded."{field}"' for field in METADATA_FIELDS if field != "accession")
+        self.catalog_store().executemany(
+            f"INSERT INTO genomes_metadata ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT (accession) DO UPDATE SET {updates}",
+            [[store_value(row.get(field, "")) for field in METADATA_FIELDS] for row in rows],
+        )
+        self._dirty_exports.add("metadata")
+
+    def upsert_catalog_entries(self, entries: list[dict]) -> None:
+        self.catalog_store().executemany(
+            "INSERT INTO catalog_entries (accession, root_acc, entry_json) VALUES (?, ?, ?) "
+            "ON CONFLICT (accession) DO UPDATE SET entry_json = excluded.entry_json",
+            [
+                (entry["accession"], root_acc(entry["accession"]), catalog_json(entry))
+                for entry in entries
+                if entry.get("accession", "")
+            ],
+        )
+
+    def metadata_rows(self) -> list[dict[str, str]]:
+        # rowid order is insertion order, which is the row order the CSV always had
+        columns = ", ".join(f'"{field}"' for field in METADATA_FIELDS)
+        cursor = self.catalog_store().execute(f"SELECT {columns} FROM genomes_metadata ORDER BY rowid")
+        return [dict(zip(METADATA_FIELDS, values)) for values in cursor]
+
+    def catalog_accessions(self) -> set[str]:
+        return {accession for (accession,) in self.catalog_store().execute("SELECT accession FROM catalog_entries")}
+
+    def cataloged_versions(self, accession: str) -> list[str]:
+        cursor = self.catalog_store().execute(
+            "SELECT accession FROM catalog_entries WHERE root_acc = ? ORDER BY rowid", (root_acc(accession),)
+        )
+        return [row[0] for row in cursor]
+
+    def export_records(self) -> None:
+        if not self._dirty_exports:
+            return
+        if self.skip_exports:
+            self.log(
+                "Skipping CSV/JSONL exports (--skip-exports); regenerate them with --export-records\n"
+            )
+            return
+
+        conn = self.catalog_store()
+        with conn:
+            if "metadata" in self._dirty_exports:
+                metadata_rows = self.metadata_rows()
+                write_csv_rows(self.genomes_metadata_csv, METADATA_FIELDS, metadata_rows)
+                self.update_species_index(metadata_rows)
+                self.record_export_signature(self.genomes_metadata_csv)
+            if "catalog" in self._dirty_exports:
+                tmp = self.genomes_catalog_jsonl.with_suffix(".export.jsonl")
+                with open(tmp, "w", encoding="utf-8") as handle:
+                    for (entry_json,) in conn.execute("SELECT entry_json FROM catalog_entries ORDER BY rowid"):
+                        handle.write(entry_json + "\n")
+                os.replace(tmp, self.genomes_catalog_jsonl)
+                self.record_export_signature(self.genomes_catalog_jsonl)
+        self.log(f"Exported {', '.join(sorted(self._dirty_exports))} records from {self.catalog_store_sqlite}\n")
+        self._dirty_exports.clear()
+
+    def append_catalog_entries(self, entries: list[dict]) -> None:
+        # genomes_catalog.jsonl is append-only between --export-records runs
+        if self.skip_exports or not entries:
+            return
+        conn = self.catalog_store()
+        with conn:
+            with open(self.genomes_catalog_jsonl, "a", encoding="utf-8") as handle:
+                for entry in entries:
+                    handle.write(catalog_json(entry) + "\n")
+            self.record_export_signature(self.genomes_catalog_jsonl)
+
+    def _load_new_entries_from_updates(self) -> None:
+        known_accessions = self.catalog_accessions()
+
         self.data = [] # this will hold the accessions returned by the search term summary command
         with open(self.updates_jsonl, "r", encoding="utf-8") as handle:
             for raw_line in handle:
@@ -209,10 +640,16 @@ class GenomeManagerHybrid:
                     continue # continue onto the next
                 row = json.loads(raw_line)
                 acc = row.get("accession", "")
-                if acc and acc in local_text: # prevent local genomes from being in self.data
+                if acc and acc in known_accessions: # prevent local genomes from being in self.data
                     continue
+                older_versions = self.cataloged_versions(acc) if acc else []
+                if older_versions:
+                    self.log(
+                        f"New version {acc} of cataloged assembly "
+                        f"{', '.join(older_versions)}\n"
+                    )
                 self.data.append(row)
-                
+
     def log_species_with_multiple_accessions(self) -> None:
         seen: dict[str, list[str]] = {} # this will be a dict that is able to keep track of all accessions in the given search term. key[value[key[value]]] organism[value[organism_name[""]]]
         for genome in self.data:
@@ -233,60 +670,281 @@ class GenomeManagerHybrid:
     def accession_root(self, accession: str) -> Path:
         return self.genomes_dir / accession
     
-    def download_new_data(self) -> None:
-        for entry in self.data:
-            accession = entry.get("accession", "")
-            if not accession:
-                continue
-            
-            acc_root = self.accession_root(accession)
-            acc_root.mkdir(parents=True, exist_ok=True)
-            
-            zip_path = self.genomes_dir / f"{accession}.zip"
-            cmd = (
-                f"datasets download genome accession {accession} "
-                f"--reference --include genome,gff3 --filename {shlex.quote(str(zip_path))}" # shlex.quote(str()) allows this to be used in the command line argument
+    def build_download_command(self, accession: str, zip_path: Path) -> str:
+        return self.backend.download_command(accession, zip_path)
+
+    def download_journal_row(self, accession: str) -> Optional[dict]:
+        columns = ["accession", *DOWNLOAD_JOURNAL_COLUMNS]
+        row = self.catalog_store().execute(
+            f"SELECT {', '.join(columns)} FROM download_journal WHERE accession = ?", (accession,)
+        ).fetchone()
+        return dict(zip(columns, row)) if row else None
+
+    def set_download_state(self, accession: str, state: str, conn=None, **fields) -> None:
+        # committed immediately, so an interrupted run still knows how far each accession got.
+        # Worker threads pass their own connection; sqlite3 connections stay on their thread.
+        if state not in DOWNLOAD_STATES:
+            raise ValueError(f"Unknown download state: {state}")
+        if state == "queued":
+            fields = {name: "" if "TEXT" in kind else 0 for name, kind in DOWNLOAD_JOURNAL_COLUMNS.items()}
+        fields.update({"state": state, "updated_at": now_iso()})
+        columns = ["accession", *fields]
+        updates = ", ".join(f"{name} = excluded.{name}" for name in fields)
+        store = conn if conn is not None else self.catalog_store()
+        with store:
+            store.execute(
+                f"INSERT INTO download_journal ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)}) "
+                f"ON CONFLICT (accession) DO UPDATE SET {updates}",
+                [accession, *fields.values()],
             )
 
+    def fasta_matches_journal(self, row: dict) -> bool:
+        # size/mtime rule out most changes cheaply; the checksum catches the rest
+        fasta_path = Path(row["fasta_path"])
+        try:
+            stat = fasta_path.stat()
+        except (FileNotFoundError, OSError):
+            return False
+        if stat.st_size != row["fasta_size"] or stat.st_mtime_ns != row["fasta_mtime_ns"]:
+            return False
+        if row["fasta_sha256"] and sha256_file(fasta_path) != row["fasta_sha256"]:
+            self.log(f"***WARNING*** {fasta_path} no longer matches its journaled checksum; redoing the download/unpack\n")
+            return False
+        return True
+
+    def resume_stage(self, accession: str, zip_path: Path) -> str:
+        # "done" (nothing to redo), "index" (FASTA unpacked, .fai missing),
+        # "extract" (verified zip still on disk) or "download"
+        row = self.download_journal_row(accession)
+        state = row["state"] if row else ""
+        if state not in DOWNLOAD_STATES or state == "queued":
+            return "download"
+        position = DOWNLOAD_STATES.index(state)
+        if position >= DOWNLOAD_STATES.index("unpacked") and self.fasta_matches_journal(row):
+            if position >= DOWNLOAD_STATES.index("indexed") and Path(f"{row['fasta_path']}.fai").exists():
+                return "done"
+            return "index"
+        if row["zip_sha256"] and zip_path.exists() and zip_path.stat().st_size == row["zip_size"]:
+            return "extract"
+        return "download"
+
+    def mark_cataloged(self, accessions: list[str]) -> None:
+        for accession in accessions:
+            self.set_download_state(accession, "cataloged")
+
+    def _download_accession(self, accession: str, zip_path: Path, cmd: str) -> tuple[int, str, str]:
+        # runs in a worker thread; the backend (datasets subprocess or file copy) releases the GIL.
+        # The zip checksum is taken and journaled here too, so hashing overlaps with other
+        # downloads and a zip that finishes before the main thread reaches it is not
+        # fetched again after an interruption. Returns (exit code, zip sha256, error note);
+        # exceptions become a failed download, as a non-zero exit code always was, instead
+        # of escaping future.result() and stopping the batch.
+        import sqlite3
+
+        try:
+            acc_root = self.accession_root(accession)
+            acc_root.mkdir(parents=True, exist_ok=True)
             self.log(f"\nDownloading {accession}\n{cmd}\n")
-            exit_val = os.system(cmd)
+            exit_val = self.backend.download(accession, zip_path)
+            if exit_val != 0 or not zip_path.exists():
+                return exit_val, "", ""
+            zip_sha256 = sha256_file(zip_path)
+            conn = sqlite3.connect(self.catalog_store_sqlite, timeout=60)
+            try:
+                self.set_download_state(
+                    accession, "downloaded", conn=conn, zip_sha256=zip_sha256, zip_size=zip_path.stat().st_size
+                )
+            finally:
+                conn.close()
+        except Exception as exc:
+            return 1, "", f"download failed: {type(exc).__name__}: {exc}"
+        return exit_val, zip_sha256, ""
+
+    def verify_download(self, accession: str, zip_path: Path, recheck_checksum: bool) -> None:
+        import zipfile
+
+        row = self.download_journal_row(accession) or {}
+        if recheck_checksum:
+            actual = sha256_file(zip_path)
+            if actual != row.get("zip_sha256"):
+                raise ValueError(
+                    f"{zip_path.name} checksum changed since download "
+                    f"(journal {row.get('zip_sha256')}, found {actual})"
+                )
+        with zipfile.ZipFile(zip_path) as archive:
+            if not any(
+                self.classify_accession_file(accession, Path(name).name) == "fna"
+                for name in archive.namelist()
+            ):
+                raise ValueError(f"{zip_path.name} contains no genomic FASTA for {accession}")
+
+    def extract_download(self, accession: str, zip_path: Path, acc_root: Path) -> dict:
+        # Stream only the members the pipeline uses (genome FASTA, GFF, assembly_data_report)
+        # to their final paths under acc_root. Each member is checked against the zip's
+        # md5sum.txt, and the FASTA is hashed and indexed from the same bytes as they are
+        # written, so the genome is never read back just to checksum or index it.
+        import hashlib
+        import zipfile
+
+        from genome_store import FastaIndexer # numpy is only needed when unpacking
+
+        acc_root_resolved = acc_root.resolve()
+        result = {"files": [], "fasta_path": None, "fai_entries": [], "fasta_sha256": ""}
+        with zipfile.ZipFile(zip_path) as archive:
+            names = set(archive.namelist())
+            md5sums = {}
+            for name in names:
+                if Path(name).name == "md5sum.txt":
+                    md5sums = parse_md5sum_txt(archive.read(name).decode("utf-8", "replace"))
+            members = [
+                (info, self.classify_accession_file(accession, Path(info.filename).name))
+                for info in archive.infolist()
+                if not info.is_dir()
+            ]
+            members = [(info, kind) for info, kind in members if kind]
+            if not any(kind == "fna" for _, kind in members):
+                raise ValueError(f"{zip_path.name} contains no genomic FASTA for {accession}")
+
+            for info, kind in members:
+                dst = (acc_root / info.filename).resolve()
+                if acc_root_resolved not in dst.parents:
+                    raise ValueError(f"Refusing to extract {info.filename} outside {acc_root}")
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                tmp = dst.with_name(dst.name + ".part")
+                md5 = hashlib.md5()
+                sha256 = hashlib.sha256() if kind == "fna" else None
+                indexer = FastaIndexer(f"{zip_path.name}:{info.filename}") if kind == "fna" else None
+                with archive.open(info) as src, open(tmp, "wb") as out:
+                    while True:
+                        chunk = src.read(EXTRACT_CHUNK_BYTES)
+                        if not chunk:
+                            break
+                        out.write(chunk)
+                        md5.update(chunk)
+                        if indexer is not None:
+                            indexer.feed(chunk)
+                            sha256.update(chunk)
+                expected_md5 = md5sums.get(info.filename)
+                if expected_md5 and expected_md5 != md5.hexdigest():
+                    tmp.unlink()
+                    raise ValueError(f"md5 mismatch for {info.filename} in {zip_path.name}")
+                os.replace(tmp, dst)
+                result["files"].append(dst)
+                if indexer is not None:
+                    result["fasta_path"] = dst
+                    result["fai_entries"] = indexer.finish()
+                    result["fasta_sha256"] = sha256.hexdigest()
+        return result
+
+    def _finish_download(self, accession: str, zip_path: Path, cmd: str, stage: str, download_result) -> None:
+        from genome_store import index_fasta_file, write_fai
+
+        acc_root = self.accession_root(accession)
+        self.forget_accession_files(accession)
+        if stage == "done":
+            self.successfully_downloaded_data.append(accession)
+            self.log(f"Resumed {accession}: already downloaded, verified, unpacked and indexed\n")
+            return
+        if stage == "download":
+            exit_val, _, error_note = download_result
             if exit_val != 0:
                 self.log(f"***ERROR*** failed to download {accession}\n")
                 self.append_download_failure(
                     accession=accession,
                     stage="download",
                     command=cmd,
-                    error_note=f"datasets download failed with exit code {exit_val}",
+                    error_note=error_note or f"datasets download failed with exit code {exit_val}",
                 )
                 self.failed_downloads.append({
                     "accession": accession,
                     "stage": "download",
-                    "error": f"exit code {exit_val}"
-                })                
-                continue
-            try:
-                shutil.unpack_archive(str(zip_path), str(acc_root))
-                self.successfully_downloaded_data.append(accession)
-                self.log(f"Successfully downloaded and unpacked {accession} -> {acc_root}\n")
-            except Exception as exc:
-                self.log(f"***ERROR*** failed to unpack {accession}: {exc}\n")
-                if acc_root.exists(): # clean up the folder that was made during the attempt.
-                    self.log(f"WARNING I'm removing the folder {acc_root} I initially created.")
-                    shutil.rmtree(acc_root)
-                self.append_download_failure(
-                    accession=accession,
-                    stage="unpack",
-                    command=cmd,
-                    error_note=str(exc),
-                    )
-                self.failed_downloads.append({
-                    "accession": accession,
-                    "stage": "unpack",
-                    "error": str(exc)  
-                    })
-            finally:
-                if zip_path.exists():
-                    zip_path.unlink()
+                    "error": error_note or f"exit code {exit_val}"
+                })
+                return
+        else:
+            self.log(f"Resuming {accession} at stage '{stage}' from the download journal\n")
+
+        try:
+            if stage == "index":
+                fasta_path = Path(self.download_journal_row(accession)["fasta_path"])
+                fai_entries = index_fasta_file(fasta_path)
+            else:
+                self.verify_download(accession, zip_path, recheck_checksum=(stage == "extract"))
+                self.set_download_state(accession, "verified")
+                extracted = self.extract_download(accession, zip_path, acc_root)
+                fasta_path = extracted["fasta_path"]
+                fai_entries = extracted["fai_entries"]
+                fasta_stat = fasta_path.stat()
+                self.set_download_state(
+                    accession,
+                    "unpacked",
+                    fasta_path=str(fasta_path),
+                    fasta_sha256=extracted["fasta_sha256"],
+                    fasta_size=fasta_stat.st_size,
+                    fasta_mtime_ns=fasta_stat.st_mtime_ns,
+                )
+            # written after the FASTA so its mtime is not older than the FASTA's
+            write_fai(Path(f"{fasta_path}.fai"), fai_entries)
+            self.set_download_state(accession, "indexed")
+            self.successfully_downloaded_data.append(accession)
+            self.log(f"Successfully downloaded and unpacked {accession} -> {acc_root}\n")
+        except Exception as exc:
+            self.log(f"***ERROR*** failed to unpack {accession}: {exc}\n")
+            if acc_root.exists(): # clean up the folder that was made during the attempt.
+                self.log(f"WARNING I'm removing the folder {acc_root} I initially created.")
+                shutil.rmtree(acc_root)
+            self.set_download_state(accession, "queued")
+            self.append_download_failure(
+                accession=accession,
+                stage="unpack",
+                command=cmd,
+                error_note=str(exc),
+                )
+            self.failed_downloads.append({
+                "accession": accession,
+                "stage": "unpack",
+                "error": str(exc)
+                })
+        # the zip is kept only when the run dies mid-unpack, so a rerun can resume from it
+        if zip_path.exists():
+            zip_path.unlink()
+
+    def download_new_data(self) -> None:
+        # Downloads run in a bounded thread pool (at most max_parallel_downloads in flight).
+        # Results are unpacked on this thread in self.data order while later downloads
+        # continue, so successes, failures and download_failures.csv rows come out in the
+        # same order as a serial run. Accessions the download journal shows as already
+        # downloaded/unpacked/indexed skip the stages they completed.
+        accessions = [entry.get("accession", "") for entry in self.data]
+        accessions = [accession for accession in accessions if accession]
+        if not accessions:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        pending: deque = deque()
+        queued = iter(accessions)
+        with ThreadPoolExecutor(max_workers=self.max_parallel_downloads) as pool:
+            while True:
+                while len(pending) < self.max_parallel_downloads:
+                    accession = next(queued, None)
+                    if accession is None:
+                        break
+                    zip_path = self.genomes_dir / f"{accession}.zip"
+                    cmd = self.build_download_command(accession, zip_path)
+                    stage = self.resume_stage(accession, zip_path)
+                    future = None
+                    if stage == "download":
+                        self.set_download_state(accession, "queued")
+                        future = pool.submit(self._download_accession, accession, zip_path, cmd)
+                    pending.append((accession, zip_path, cmd, stage, future))
+                if not pending:
+                    break
+
+                accession, zip_path, cmd, stage, future = pending.popleft()
+                download_result = future.result() if future is not None else None
+                self._finish_download(accession, zip_path, cmd, stage, download_result)
 
     def inspect_accession_root(self, accession: str) -> dict:
         accession_root = self.accession_root(accession)
@@ -378,28 +1036,115 @@ class GenomeManagerHybrid:
             f"download_failures.csv\n"
         )
 
-    def find_accession_files(self, accession: str) -> tuple[str, str, str]:
+    def classify_accession_file(self, accession: str, name: str) -> Optional[str]:
+        if name.endswith("genomic.fna") and accession in name:
+            return "fna"
+        if name.endswith(".gff") and "lift" not in name:
+            return "gff"
+        if name.endswith("lift.gff"):
+            return "lift_gff"
+        if name == "assembly_data_report.jsonl":
+            return "assembly_data_report"
+        return None
+
+    def scan_accession_root(self, accession: str) -> dict:
+        # one os.scandir walk of the accession tree; DirEntry.is_dir()/is_file() come from
+        # the directory listing itself, so no per-file stat calls are needed
         acc_root = self.accession_root(accession)
-        if not acc_root.exists(): # remember ... if false fasle, if block triggers - if false true, if block does not trigger
-            return "","",""
-        
-        fna_path = ""
-        gff_path = ""
-        lift_gff_path = ""
-        
-        for path in acc_root.rglob("*"):
-            if not path.is_file(): # if false false i.e. the path is not a file skip
+        files = dict.fromkeys(ACCESSION_FILE_KINDS, "")
+        dir_mtimes: dict[str, int] = {}
+        stack = [acc_root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as handle:
+                    entries = sorted(handle, key=lambda entry: entry.name)
+                if self.persist_file_index:
+                    dir_mtimes[os.path.relpath(directory, self.genomes_dir)] = directory.stat().st_mtime_ns
+            except FileNotFoundError:
                 continue
-            
-            name = path.name
-            if name.endswith("genomic.fna") and accession in name:
-                fna_path = str(path)
-            elif name.endswith(".gff") and "lift" not in name:
-                gff_path = str(path)
-            elif name.endswith("lift.gff"):
-                lift_gff_path = str(path)
-        return fna_path, gff_path, lift_gff_path
-        
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    subdirs.append(Path(entry.path))
+                elif entry.is_file():
+                    kind = self.classify_accession_file(accession, entry.name)
+                    if kind:
+                        files[kind] = os.path.relpath(entry.path, self.genomes_dir)
+            stack.extend(reversed(subdirs))
+        return {"files": files, "dir_mtimes": dir_mtimes}
+
+    def accession_entry_is_current(self, entry: dict) -> bool:
+        dir_mtimes = entry.get("dir_mtimes") or {}
+        if not dir_mtimes:
+            return False
+        for rel_dir, mtime_ns in dir_mtimes.items():
+            try:
+                if (self.genomes_dir / rel_dir).stat().st_mtime_ns != mtime_ns:
+                    return False
+            except FileNotFoundError:
+                return False
+        return True
+
+    def accession_files_index(self) -> dict[str, dict]:
+        # accession -> file index for every local accession root, built in a single walk and
+        # shared by build_assembly_record / inspect_accession_root / build_local_only_record.
+        # With persist_file_index, entries whose directory mtimes are unchanged are reused
+        # from records/accession_files_index.json instead of walked again.
+        if self._accession_files is not None:
+            return self._accession_files
+
+        persisted: dict[str, dict] = {}
+        if self.persist_file_index and self.accession_files_json.exists():
+            try:
+                with open(self.accession_files_json, "r", encoding="utf-8") as handle:
+                    persisted = json.load(handle)
+            except (OSError, json.JSONDecodeError):
+                persisted = {}
+
+        index: dict[str, dict] = {}
+        reused = 0
+        for accession in self.discover_local_accessions():
+            entry = persisted.get(accession)
+            if entry and self.accession_entry_is_current(entry):
+                index[accession] = entry
+                reused += 1
+            else:
+                index[accession] = self.scan_accession_root(accession)
+        self._accession_files = index
+
+        if self.persist_file_index:
+            self.log(f"Accession file index: reused {reused}, scanned {len(index) - reused} accession roots\n")
+            self.save_accession_files_index()
+        return index
+
+    def save_accession_files_index(self) -> None:
+        if self._accession_files is None or not self.records_dir.exists():
+            return
+        tmp = self.accession_files_json.with_suffix(".tmp.json")
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(self._accession_files, handle, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp, self.accession_files_json)
+
+    def forget_accession_files(self, accession: str) -> None:
+        if self._accession_files is not None:
+            self._accession_files.pop(accession, None)
+
+    def accession_file_paths(self, accession: str) -> dict[str, str]:
+        index = self.accession_files_index()
+        if accession not in index:
+            if not self.accession_root(accession).exists():
+                return dict.fromkeys(ACCESSION_FILE_KINDS, "")
+            index[accession] = self.scan_accession_root(accession)
+        return {
+            kind: str(self.genomes_dir / rel_path) if rel_path else ""
+            for kind, rel_path in index[accession]["files"].items()
+        }
+
+    def find_accession_files(self, accession: str) -> tuple[str, str, str]:
+        paths = self.accession_file_paths(accession)
+        return paths["fna"], paths["gff"], paths["lift_gff"]
+
     def to_local_and_drive(self, abs_path: str) -> tuple[str, str]:
         if not abs_path:
             return "", ""
@@ -413,31 +1158,95 @@ class GenomeManagerHybrid:
         drive_ver = self.root_drive / rel
         return str(local_ver), str(drive_ver)
         
-    def get_lineage(self, taxon_id: str) -> dict[str, str]:
-        empty = {
-            "phylum": "",
-            "superorder": "",
-            "order": "",
-            "family": "",
-            "genus": "",
-            "genus_species": "",
+    def load_lineage_cache(self) -> dict[str, dict[str, str]]:
+        if self._lineage_cache is not None:
+            return self._lineage_cache
+
+        self._lineage_cache = {}
+        if not self.lineage_cache_json.exists():
+            return self._lineage_cache
+        try:
+            with open(self.lineage_cache_json, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, json.JSONDecodeError) as exc:
+            self.log(f"***WARNING*** ignoring unreadable lineage cache {self.lineage_cache_json}: {exc}\n")
+            return self._lineage_cache
+
+        if payload.get("taxdump_version") != taxdump_version(taxonkit_data_dir()):
+            self.log("Taxonkit taxdump changed since the lineage cache was written; resolving lineages again.\n")
+            return self._lineage_cache
+        self._lineage_cache = payload.get("lineages", {})
+        return self._lineage_cache
+
+    def save_lineage_cache(self) -> None:
+        payload = {
+            "taxdump_version": taxdump_version(taxonkit_data_dir()),
+            "lineages": self.load_lineage_cache(),
         }
-        if not taxon_id:
-            return empty
+        tmp = self.lineage_cache_json.with_suffix(".tmp.json")
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, sort_keys=True)
+        os.replace(tmp, self.lineage_cache_json)
+
+    def resolve_lineages(self, taxon_ids: list[str]) -> None:
+        # one taxonkit pipeline for every taxon id not already in the on-disk cache; ids it
+        # fails on are remembered for the run so get_lineage() does not rerun it per record
+        import subprocess
+
+        cache = self.load_lineage_cache()
+        missing = sorted({
+            str(taxon_id) for taxon_id in taxon_ids
+            if taxon_id and str(taxon_id) not in cache and str(taxon_id) not in self._unresolved_taxa
+        })
+        if not missing:
+            return
 
         lineage_cmd = (
-            f'echo {taxon_id} | taxonkit lineage | '
-            f'taxonkit reformat -f "{{p}}\t{{c}}\t{{o}}\t{{f}}\t{{g}}\t{{s}}"'
+            'taxonkit lineage | '
+            'taxonkit reformat -f "{p}\t{c}\t{o}\t{f}\t{g}\t{s}"'
         )
         try:
-            output = subprocess.check_output(lineage_cmd, shell=True, text=True).strip()
-            fields = output.split("\t")
+            output = subprocess.run(
+                lineage_cmd,
+                shell=True,
+                input="\n".join(missing) + "\n",
+                text=True,
+                capture_output=True,
+                check=True,
+            ).stdout
+        except subprocess.CalledProcessError as exc:
+            self.log(
+                f"***WARNING*** taxonkit failed for {len(missing)} taxon ids: {exc.stderr.strip()}\n"
+                "Their lineage fields are left empty for this run.\n"
+            )
+            self._unresolved_taxa.update(missing)
+            return
+
+        for line in output.splitlines():
+            fields = line.split("\t")
+            if not fields[0].strip():
+                continue
             cleaned = [fields[i].strip("{}") if i < len(fields) and fields[i] else "" for i in range(2, 8)]
-            return dict(zip(empty.keys(), cleaned))
-        except subprocess.CalledProcessError:
+            cache[fields[0].strip()] = dict(zip(LINEAGE_FIELDS, cleaned))
+        self._unresolved_taxa.update(taxon_id for taxon_id in missing if taxon_id not in cache)
+        self.log(f"Resolved {len(missing)} taxon lineages with taxonkit\n")
+        self.save_lineage_cache()
+
+    def get_lineage(self, taxon_id: str) -> dict[str, str]:
+        empty = dict.fromkeys(LINEAGE_FIELDS, "")
+        if not taxon_id:
             return empty
 
-    def build_assembly_record(self, entry: dict) -> AssemblyRecord:
+        self.resolve_lineages([taxon_id])
+        return dict(self.load_lineage_cache().get(str(taxon_id), empty))
+
+    def apply_lineages(self, records: list[AssemblyRecord]) -> None:
+        self.resolve_lineages([record.taxon_id for record in records])
+        for record in records:
+            for field, value in self.get_lineage(record.taxon_id).items():
+                setattr(record, field, value)
+
+    def build_assembly_record(self, entry: dict, resolve_lineage: bool = True) -> AssemblyRecord:
         accession = entry.get("accession", "")
         organism_name = entry.get("organism", {}).get("organism_name", "")
         taxon_id = str(entry.get("organism", {}).get("tax_id", ""))
@@ -448,7 +1257,8 @@ class GenomeManagerHybrid:
         refseq_category = assembly_info.get("refseq_category", "")
         source_database = "RefSeq" if accession.startswith("GCF_") else "GenBank"
         species_key = build_species_key(organism_name)
-        lineage = self.get_lineage(taxon_id)
+        # callers building many records pass resolve_lineage=False and batch it with apply_lineages()
+        lineage = self.get_lineage(taxon_id) if resolve_lineage else dict.fromkeys(LINEAGE_FIELDS, "")
         
         found_fna, found_gff, found_lift = self.find_accession_files(accession)
         local_fna, drive_fna = self.to_local_and_drive(found_fna)
@@ -505,11 +1315,12 @@ class GenomeManagerHybrid:
             "new_accession": new_accession,
             "reason": reason,
             }
+        import jsonlines
+
         with jsonlines.open(self.update_history_jsonl, mode="a", compact=True) as writer:
             writer.write(payload)
             
-    def update_species_index(self) -> None:
-        metadata_rows = read_csv_rows(self.genomes_metadata_csv)
+    def update_species_index(self, metadata_rows: list[dict[str, str]]) -> None:
         species_rows = []
         
         for row in metadata_rows:
@@ -529,67 +1340,59 @@ class GenomeManagerHybrid:
                 "project_count": "0",
                 "notes": "",
                 })
-        fieldnames = [
-            "species_key",
-            "organism_name",
-            "accession",
-            "accession_root",
-            "assembly_name",
-            "source_database",
-            "assembly_level",
-            "refseq_category",
-            "downloaded_at",
-            "status",
-            "replaced_by_accession",
-            "project_count",
-            "notes",
-        ]                
-        write_csv_rows(self.species_assembly_index, fieldnames, species_rows)        
+        write_csv_rows(self.species_assembly_index, SPECIES_INDEX_FIELDS, species_rows)        
                 
     def update_metadata_tables(self) -> None:
-        existing_rows = read_csv_rows(self.genomes_metadata_csv)
-        rows_by_accession = {row["accession"]: row for row in existing_rows}
+        # row-level upserts in one transaction instead of rereading and rewriting the CSV
+        conn = self.catalog_store()
+        self.resolve_lineages([
+            str(entry.get("organism", {}).get("tax_id", ""))
+            for entry in self.data
+            if entry.get("accession", "") in self.successfully_downloaded_data
+        ])
         
-        for entry in self.data:
-            accession = entry.get("accession", "")
-            if accession not in self.successfully_downloaded_data:
-                continue
-
-            record = self.build_assembly_record(entry)
-            new_row = asdict(record)
-            species_key = record.species_key
-            
-            for row in existing_rows:
-                if row.get("species_key") == species_key and row.get("accession") != accession:
-                    row["is_current_for_species"] = "False"
-                    row["replaced_by_accession"] = accession
+        with conn:
+            for entry in self.data:
+                accession = entry.get("accession", "")
+                if accession not in self.successfully_downloaded_data:
+                    continue
 
+                record = self.build_assembly_record(entry)
+                new_row = asdict(record)
+                species_key = record.species_key
+
+                superseded = conn.execute(
+                    "SELECT accession FROM genomes_metadata WHERE species_key = ? AND accession != ? ORDER BY rowid",
+                    (species_key, accession),
+                ).fetchall()
+                for (old_accession,) in superseded:
                     self.append_update_event(
                         species_key=species_key,
                         organism_name=record.organism_name,
-                        old_accession=row.get("accession", ""),
+                        old_accession=old_accession,
                         new_accession=accession,
                         reason="New assembly for same species discovered"
                     )
-
-            if accession in rows_by_accession:
-                rows_by_accession[accession].update(new_row)
-            else:
-                existing_rows.append(new_row)
-                rows_by_accession[accession] = new_row
-        fieldnames = list(AssemblyRecord.__dataclass_fields__.keys())
-        write_csv_rows(self.genomes_metadata_csv, fieldnames, existing_rows)
-        self.update_species_index()
+                conn.execute(
+                    "UPDATE genomes_metadata SET is_current_for_species = 'False', replaced_by_accession = ? "
+                    "WHERE species_key = ? AND accession != ?",
+                    (accession, species_key, accession),
+                )
+                self._dirty_exports.add("metadata")
+                self.upsert_metadata_rows([new_row])
+        self.export_records()
 
     def append_successful_entries_to_catalog(self) -> None:
         if not self.successfully_downloaded_data:
             return
 
-        with jsonlines.open(self.genomes_catalog_jsonl, mode="a", compact=True) as writer:
-            for entry in self.data:
-                accession = entry.get("accession", "")
-                if accession in self.successfully_downloaded_data:
-                    writer.write(entry)
+        entries = [
+            entry for entry in self.data
+            if entry.get("accession", "") in self.successfully_downloaded_data
+        ]
+        with self.catalog_store():
+            self.upsert_catalog_entries(entries)
+        self.append_catalog_entries(entries)
 
     def project_manifest_path(self) -> Optional[Path]:
         if not self.project_name:
@@ -641,7 +1444,7 @@ class GenomeManagerHybrid:
             self.log("No accessions selected for project manifest. \n")
             return
         
-        metadata_rows = read_csv_rows(self.genomes_metadata_csv)
+        metadata_rows = self.metadata_rows()
         selected_rows = []
 
         for row in metadata_rows:
@@ -752,43 +1555,15 @@ class GenomeManagerHybrid:
         return self.project_selected_accessions
         
     def load_catalog_entries_by_accession(self) -> dict[str, dict]:
-        by_accession: dict[str, dict] = {}
-        if not self.genomes_catalog_jsonl.exists():
-            return by_accession
-        
-        with open(self.genomes_catalog_jsonl, "r", encoding="utf-8") as handle:
-            for raw_line in handle:
-                if not raw_line.strip():
-                    continue
-                row = json.loads(raw_line)
-                accession = row.get("accession", "").strip()
-                if accession:
-                    by_accession[accession] = row
-        return by_accession
+        return {
+            accession: json.loads(entry_json)
+            for accession, entry_json in self.catalog_store().execute(
+                "SELECT accession, entry_json FROM catalog_entries ORDER BY rowid"
+            )
+        }
         
     def fetch_summary_for_accession(self, accession: str) -> dict:
-        tmp_jsonl = self.records_dir / f"{accession}_retry_summary.jsonl"
-        cmd = (
-            f"datasets summary genome accession {shlex.quote(accession)} "
-            f"--reference --as-json-lines > {shlex.quote(str(tmp_jsonl))}"
-        )
-        exit_val = os.system(cmd)
-        if exit_val != 0 or not tmp_jsonl.exists():
-            return {"accession": accession}
-
-        try:
-            with open(tmp_jsonl, "r", encoding="utf-8") as handle:
-                for raw_line in handle:
-                    if not raw_line.strip():
-                        continue
-                    row = json.loads(raw_line)
-                    if row.get("accession", "") == accession:
-                        return row
-        finally:
-            if tmp_jsonl.exists():
-                tmp_jsonl.unlink()
-
-        return {"accession": accession}
+        return self.backend.accession_summary(accession, self.records_dir) or {"accession": accession}
 
     def trash_dir(self) -> Path:
         path = self.genomes_dir / "trash"
@@ -806,12 +1581,14 @@ class GenomeManagerHybrid:
                 )
             return dst
         shutil.move(str(src), str(dst))
+        self.forget_accession_files(accession)
         self.log(
             f"Moved accession root to trash: {src} -> {dst} | reason: {reason}")
         return dst
         
     def backup_metadata(self) -> None:
-        if not self.genomes_metadata_csv.exists():
+        metadata_rows = self.metadata_rows()
+        if not metadata_rows:
             return
 
         if self.dry_run_rebuild:
@@ -822,14 +1599,11 @@ class GenomeManagerHybrid:
 
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = self.trash_dir() / f"genomes_metadata__{timestamp}.csv"
-        shutil.copy2(self.genomes_metadata_csv, backup_path)
+        write_csv_rows(backup_path, METADATA_FIELDS, metadata_rows)
         self.log(f"Backed up genomes_metadata.csv -> {backup_path}\n")
 
     def current_metadata_accessions(self) -> list[str]:
-        if not self.genomes_metadata_csv.exists():
-            return []
-
-        rows = read_csv_rows(self.genomes_metadata_csv)
+        rows = self.metadata_rows()
         accessions = []
         seen = set()
 
@@ -895,7 +1669,7 @@ class GenomeManagerHybrid:
 
         self.log("===== END DRY-RUN PREVIEW =====\n\n")
  
-    def build_local_only_record(self, accession: str) -> Optional[AssemblyRecord]:
+    def build_local_only_record(self, accession: str, resolve_lineage: bool = True) -> Optional[AssemblyRecord]:
         inspection = self.inspect_accession_root(accession)
         accession_root = inspection["accession_root"]
         found_fna = inspection["found_fna"]
@@ -924,7 +1698,7 @@ class GenomeManagerHybrid:
             summary = None
         
         if summary:
-            record = self.build_assembly_record(summary)
+            record = self.build_assembly_record(summary, resolve_lineage=resolve_lineage)
             
             # Preserve the file paths actually found on disk during rebuild
             record.path_to_fna = local_fna
@@ -978,20 +1752,31 @@ class GenomeManagerHybrid:
         self.rebuild_preview["local_accessions"] = list(local_accessions)
 
         catalog_by_accession = self.load_catalog_entries_by_accession()
-        rebuilt_records: list[dict] = []
+        self.accession_files_index() # one walk, shared read-only by the workers below
 
-        for accession in local_accessions:
+        def build_record(accession: str) -> Optional[AssemblyRecord]:
             entry = catalog_by_accession.get(accession)
-
             if entry:
-                record = self.build_assembly_record(entry)
-            else:
-                record = self.build_local_only_record(accession)
-
-            if record is None:
-                continue
+                return self.build_assembly_record(entry, resolve_lineage=False)
+            return self.build_local_only_record(accession, resolve_lineage=False)
+
+        if self.jobs > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # the per-accession work is datasets summary subprocesses, so threads are enough.
+            # pool.map keeps local_accessions order; broken roots are reported from worker
+            # threads, so put the preview lists back into that order too.
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                built = list(pool.map(build_record, local_accessions))
+            position = {accession: i for i, accession in enumerate(local_accessions)}
+            self.rebuild_preview["broken_accessions"].sort(key=position.get)
+            self.rebuild_preview["would_trash"].sort(key=lambda item: position[item["accession"]])
+        else:
+            built = [build_record(accession) for accession in local_accessions]
 
-            rebuilt_records.append(asdict(record))
+        records: list[AssemblyRecord] = [record for record in built if record is not None]
+        self.apply_lineages(records)
+        rebuilt_records: list[dict] = [asdict(record) for record in records]
 
         grouped: dict[str, list[dict]] = {}
         for row in rebuilt_records:
@@ -1033,28 +1818,34 @@ class GenomeManagerHybrid:
             return
 
         self.backup_metadata()
-        fieldnames = list(AssemblyRecord.__dataclass_fields__.keys())
-        write_csv_rows(self.genomes_metadata_csv, fieldnames, rebuilt_records)
-        self.update_species_index()
+        with self.catalog_store() as conn:
+            conn.execute("DELETE FROM genomes_metadata")
+            self.upsert_metadata_rows(rebuilt_records)
+        self.export_records()
 
         self.log(
             f"Rebuilt genomes metadata from local accession folders. "
             f"Found {len(local_accessions)} accession directories.\n"
         )
 
-    def run(self) -> None:
-        self.initialize_records()
+    def run_export_records(self) -> None:
+        self.initialize_records(full=False)
+        self.catalog_store()
+        self._dirty_exports.update({"metadata", "catalog"})
+        self.export_records()
 
-        if self.dry_run_rebuild:
-            self.rebuild_genomes_metadata()
-            return
+    def run_rebuild_preview(self) -> None:
+        self.initialize_records(full=False)
+        self.rebuild_genomes_metadata()
 
-        if self.rebuild_metadata:
-            self.rebuild_genomes_metadata()
-            if self.project_name:
-                self.write_project_manifest()
-            return
+    def run_rebuild(self) -> None:
+        self.initialize_records(full=False)
+        self.rebuild_genomes_metadata()
+        if self.project_name:
+            self.write_project_manifest()
 
+    def run_update(self) -> None:
+        self.initialize_records()
         self.require_datasets_cli()
 
         if self.retry_failures:
@@ -1069,6 +1860,7 @@ class GenomeManagerHybrid:
         self.download_new_data()
         self.append_successful_entries_to_catalog()
         self.update_metadata_tables()
+        self.mark_cataloged(self.successfully_downloaded_data)
 
         if self.retry_failures:
             self.remove_resolved_failures(self.successfully_downloaded_data)
@@ -1076,6 +1868,16 @@ class GenomeManagerHybrid:
         if self.project_name:
             self.write_project_manifest()
 
+    def run(self) -> None:
+        if self.export_records_only:
+            self.run_export_records()
+        elif self.dry_run_rebuild:
+            self.run_rebuild_preview()
+        elif self.rebuild_metadata:
+            self.run_rebuild()
+        else:
+            self.run_update()
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -1162,6 +1964,61 @@ def parse_args() -> argparse.Namespace:
         )
     )
 
+    parser.add_argument(
+        "--max-parallel-downloads",
+        type=int,
+        default=3,
+        help=(
+            "Number of datasets downloads kept in flight at once. Unpacking "
+            "overlaps with later downloads. Use 1 for the old serial behavior."
+        )
+    )
+
+    parser.add_argument(
+        "--persist-file-index",
+        action="store_true",
+        help=(
+            "Keep the accession file index in records/accession_files_index.json "
+            "and only re-walk accession folders whose directory mtimes changed"
+        )
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of accessions processed at once by --rebuild-metadata / "
+            "--dry-run-rebuild (datasets summary lookups, file discovery)"
+        )
+    )
+
+    parser.add_argument(
+        "--skip-exports",
+        action="store_true",
+        help=(
+            "Only update records/genomes_catalog.sqlite; do not regenerate "
+            "genomes_metadata.csv or species_assembly_index.csv, or append to genomes_catalog.jsonl"
+        )
+    )
+    parser.add_argument(
+        "--export-records",
+        action="store_true",
+        help=(
+            "Regenerate genomes_metadata.csv, species_assembly_index.csv and "
+            "genomes_catalog.jsonl from records/genomes_catalog.sqlite and exit"
+        )
+    )
+
+    parser.add_argument(
+        "--mirror-dir",
+        default=None,
+        help=(
+            "Read NCBI summaries and genome zips from a local mirror directory "
+            "(summaries/*.jsonl, zips/<accession>.zip) instead of the datasets CLI"
+        )
+    )
+
     return parser.parse_args()
     
     
@@ -1189,6 +2046,12 @@ def main() -> None:
         project_accessions_csv=args.project_accessions_csv,
         project_accessions_txt=args.project_accessions_txt,
         project_accessions=args.project_accessions,
+        max_parallel_downloads=args.max_parallel_downloads,
+        persist_file_index=args.persist_file_index,
+        jobs=args.jobs,
+        skip_exports=args.skip_exports,
+        export_records_only=args.export_records,
+        backend=MirrorBackend(args.mirror_dir) if args.mirror_dir else None,
     )
     mgr.run()
 
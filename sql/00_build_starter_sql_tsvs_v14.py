@@ -22,6 +22,11 @@ Version v13 updates:
   - Builds window tables for chromosomes and scaffolds by default so scaffold-level assemblies
     such as Sphenodon punctatus are retained for downstream exploration.
 
+Window engine:
+  - Each selected sequence is read once into a uint8 base-class array. Base counts for every
+    window size and step are differences of per-class prefix sums, so adding window sizes no
+    longer re-slices the FASTA. Output is identical to counting each window with base_counts().
+
 Default project behavior:
   - Uses mass_predicts_dna_dynamics_with_s_punctatus_manifest.csv
   - Selects these five genomes by default:
@@ -51,6 +56,12 @@ Example:
 
 Optional MySQL loading:
   python 00_build_starter_sql_tsvs.py ... --load-sql --mysql-db gc3_dynamics --mysql-user root
+
+Optional Parquet window chunks (requires pyarrow):
+  python 00_build_starter_sql_tsvs.py ... --format parquet
+  Window tables are written as typed *.parquet chunks with the same partitioning, plus
+  <table>/_metadata so arrow::open_dataset() or pyarrow.dataset can filter keep_flag = 1
+  without reading every chunk.
 """
 
 from __future__ import annotations
@@ -59,20 +70,40 @@ import argparse
 import csv
 import gzip
 import getpass
+import hashlib
 import json
 import math
+import os
 import re
-import statistics
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 try:
     import pyfaidx
 except ImportError:  # handled later with a clear error if sequences are requested
     pyfaidx = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for --format parquet
+    pa = None
+    pc = None
+    pq = None
+
+# genome_store.py lives at the repository root (see its docstring for this import).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import genome_store
+from genome_store import file_signature, read_fai, write_fai
+
 
 DEFAULT_ACCESSIONS = [
     "GCA_039797435.1",
@@ -135,6 +166,7 @@ SEQUENCE_TYPE_AUDIT_COLUMNS = [
     "component_sequence_count_match",
     "audit_status",
     "assembly_report_path",
+    "sequence_type_rule_hits",
 ]
 
 
@@ -261,10 +293,74 @@ WINDOW_CHUNK_MANIFEST_COLUMNS = [
     "standard_window_size_bp",
     "step_size_bp",
     "n_rows",
+    "fingerprint",
+    "first_sequence_pk",
+    "window_pk_start",
+    "sequence_summary_pk_start",
+    "genome_summary_pk",
+    "species_pk",
 ]
 
+# Columns of window_chunk_manifest.tsv that pin where a chunk's PKs start.
+# A chunk whose fingerprint is unchanged but whose layout differs is
+# renumbered in place by --incremental instead of being recomputed.
+WINDOW_CHUNK_LAYOUT_COLUMNS = [
+    "run_pk",
+    "genome_pk",
+    "window_set_pk",
+    "first_sequence_pk",
+    "window_pk_start",
+    "sequence_summary_pk_start",
+    "genome_summary_pk",
+    "species_pk",
+]
+
+WINDOW_TABLES = ["genomic_windows", "gc_window_stats", "sequence_summary", "genome_summary"]
+
+# Bump when window counting or summary logic changes so --incremental
+# rebuilds every chunk instead of reusing output from older code.
+WINDOW_ENGINE_VERSION = "v14_prefix_sum_2"
+
 FASTA_SUFFIXES = (".fna", ".fa", ".fasta")
 
+# Window chunk formats. TSV chunks are what 01_load_starter_sql_tsvs loads into
+# MySQL; Parquet chunks are typed, columnar copies for R/pandas exploration.
+CHUNK_FORMAT_SUFFIXES = {
+    "tsv": ".tsv.gz",
+    "parquet": ".parquet",
+}
+
+PARQUET_ROW_GROUP_ROWS = 131072
+
+WINDOW_STRING_COLUMNS = {"tiling_type", "mask_mode"}
+
+WINDOW_FLOAT_COLUMNS = {
+    "callable_frac",
+    "gc_prop",
+    "mean_gc",
+    "weighted_mean_gc",
+    "sd_gc",
+    "var_gc",
+    "median_gc",
+    "mad_gc",
+    "iqr_gc",
+    "q05_gc",
+    "q25_gc",
+    "q75_gc",
+    "q95_gc",
+    "mean_callable_fraction",
+    "median_callable_fraction",
+    "largest_seq_fraction",
+}
+
+WINDOW_INT8_COLUMNS = {"keep_flag"}
+
+# Bump when infer_sequence_type() rules change so cached FASTA header scans
+# re-classify their stored descriptions (the FASTA itself is not re-read).
+SEQUENCE_TYPE_RULES_VERSION = "v4"
+
+FASTA_HEADER_CACHE_COLUMNS = ["sequence_id", "sequence_length", "sequence_type", "sequence_type_rule", "description"]
+
 
 def normalize_species_name(value: str) -> str:
     """Normalize species names to lower-case genus_species style."""
@@ -372,15 +468,61 @@ def write_tsv_gz(path: Path, columns: Sequence[str], rows: Iterable[Dict[str, ob
     return count
 
 
-def chunk_filename(table: str, run_pk: int, genome_pk: int, accession: str, window_size_bp: int, step_size_bp: int) -> str:
+def chunk_filename(
+    table: str,
+    run_pk: int,
+    genome_pk: int,
+    accession: str,
+    window_size_bp: int,
+    step_size_bp: int,
+    chunk_format: str = "tsv",
+) -> str:
     """Standard chunk filename for one table × accession × window-size combination."""
     accession_token = sanitize_filename_token(accession)
     return (
         f"{table}__run_{run_pk}__genome_pk_{genome_pk}__"
-        f"accession_{accession_token}__window_{window_size_bp}bp__step_{step_size_bp}bp.tsv.gz"
+        f"accession_{accession_token}__window_{window_size_bp}bp__step_{step_size_bp}bp"
+        f"{CHUNK_FORMAT_SUFFIXES[chunk_format]}"
     )
 
 
+def require_pyarrow() -> None:
+    if pq is None:
+        raise ImportError("pyarrow is required for --format parquet. Install with: conda install -c conda-forge pyarrow")
+
+
+def parquet_schema(columns: Sequence[str]):
+    """Typed Arrow schema for a window table; every column is nullable like the SQL NULLs."""
+    require_pyarrow()
+    fields = []
+    for column in columns:
+        if column in WINDOW_STRING_COLUMNS:
+            fields.append(pa.field(column, pa.string()))
+        elif column in WINDOW_FLOAT_COLUMNS:
+            fields.append(pa.field(column, pa.float64()))
+        elif column in WINDOW_INT8_COLUMNS:
+            fields.append(pa.field(column, pa.int8()))
+        else:
+            fields.append(pa.field(column, pa.int64()))
+    return pa.schema(fields)
+
+
+def parquet_value(column: str, value: object) -> object:
+    """Convert one write_tsv()-style value to its typed Parquet value (None for SQL NULL)."""
+    if column in WINDOW_STRING_COLUMNS:
+        text = sql_null_if_blank(value)
+        return None if text == r"\N" else text
+    value_type = type(value)
+    if value_type is int or value_type is float:
+        if value != value:
+            return None
+        return float(value) if column in WINDOW_FLOAT_COLUMNS else int(value)
+    text = sql_pk(value) if column in PK_LIKE_COLUMNS else sql_null_if_blank(value)
+    if text == r"\N":
+        return None
+    return float(text) if column in WINDOW_FLOAT_COLUMNS else int(float(text))
+
+
 def write_window_chunk(
     output_dir: Path,
     table: str,
@@ -391,12 +533,142 @@ def write_window_chunk(
     accession: str,
     window_size_bp: int,
     step_size_bp: int,
+    chunk_format: str = "tsv",
 ) -> Tuple[str, int]:
     """Write one compressed chunk into output_dir/<table>/ and return relative path/count."""
-    filename = chunk_filename(table, run_pk, genome_pk, accession, window_size_bp, step_size_bp)
-    path = output_dir / table / filename
-    n_rows = write_tsv_gz(path, columns, rows)
-    return str(path.relative_to(output_dir)), n_rows
+    if chunk_format == "tsv":
+        filename = chunk_filename(table, run_pk, genome_pk, accession, window_size_bp, step_size_bp)
+        path = output_dir / table / filename
+        n_rows = write_tsv_gz(path, columns, rows)
+        return str(path.relative_to(output_dir)), n_rows
+    writer = WindowChunkWriter(
+        output_dir, table, columns, run_pk, genome_pk, accession, window_size_bp, step_size_bp, chunk_format
+    )
+    for row in rows:
+        writer.write_dict(row)
+    return writer.close()
+
+
+def format_tsv_value(value: object, is_pk: bool) -> str:
+    """write_tsv() formatting for one value, with a fast path for plain numbers."""
+    value_type = type(value)
+    if value_type is int:
+        return str(value)
+    if value_type is float and not is_pk and value == value:
+        return str(value)
+    return sql_pk(value) if is_pk else sql_null_if_blank(value)
+
+
+class WindowChunkWriter:
+    """Stream rows into one compressed window chunk as they are produced.
+
+    Rows are tuples in column order rather than dicts, so a chunk never has
+    to be held in memory. TSV formatting matches write_tsv_gz(). Parquet
+    chunks are buffered column-wise and flushed as zstd row groups of
+    PARQUET_ROW_GROUP_ROWS rows, so per-row-group statistics stay useful for
+    filter pushdown.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        table: str,
+        columns: Sequence[str],
+        run_pk: int,
+        genome_pk: int,
+        accession: str,
+        window_size_bp: int,
+        step_size_bp: int,
+        chunk_format: str = "tsv",
+    ) -> None:
+        self.output_dir = output_dir
+        self.table = table
+        self.columns = list(columns)
+        self.chunk_format = chunk_format
+        self.path = output_dir / table / chunk_filename(
+            table, run_pk, genome_pk, accession, window_size_bp, step_size_bp, chunk_format
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.pk_flags = [column in PK_LIKE_COLUMNS for column in self.columns]
+        self.n_rows = 0
+        if chunk_format == "parquet":
+            self._schema = parquet_schema(self.columns)
+            self._buffers: List[List[object]] = [[] for _ in self.columns]
+            self._parquet_writer = pq.ParquetWriter(str(self.path), self._schema, compression="zstd")
+        else:
+            self._handle = gzip.open(self.path, "wt", newline="")
+            self._writer = csv.writer(self._handle, delimiter="\t", lineterminator="\n")
+            self._writer.writerow(self.columns)
+
+    def write(self, row: Sequence[object]) -> None:
+        if self.chunk_format == "parquet":
+            for buffer, column, value in zip(self._buffers, self.columns, row):
+                buffer.append(parquet_value(column, value))
+            if len(self._buffers[0]) >= PARQUET_ROW_GROUP_ROWS:
+                self._flush_parquet()
+        else:
+            self._writer.writerow([format_tsv_value(value, is_pk) for value, is_pk in zip(row, self.pk_flags)])
+        self.n_rows += 1
+
+    def _flush_parquet(self) -> None:
+        if not self._buffers[0]:
+            return
+        arrays = [pa.array(buffer, type=field.type) for buffer, field in zip(self._buffers, self._schema)]
+        self._parquet_writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        self._buffers = [[] for _ in self.columns]
+
+    def write_dict(self, row: Dict[str, object]) -> None:
+        self.write([row.get(column, r"\N") for column in self.columns])
+
+    def close(self) -> Tuple[str, int]:
+        """Close the chunk and return its path relative to output_dir and row count."""
+        if self.chunk_format == "parquet":
+            self._flush_parquet()
+            self._parquet_writer.close()
+        else:
+            self._handle.close()
+        return str(self.path.relative_to(self.output_dir)), self.n_rows
+
+
+def iter_window_chunk_rows(path: Path) -> Iterable[Dict[str, object]]:
+    """Yield rows from a TSV or Parquet window chunk as dicts."""
+    if path.name.endswith(CHUNK_FORMAT_SUFFIXES["parquet"]):
+        require_pyarrow()
+        for batch in pq.ParquetFile(str(path)).iter_batches():
+            yield from batch.to_pylist()
+        return
+    with gzip.open(path, "rt", newline="") as handle:
+        yield from csv.DictReader(handle, delimiter="\t")
+
+
+def write_parquet_dataset_metadata(output_dir: Path, chunk_manifest_rows: Sequence[Dict[str, object]]) -> None:
+    """Write <table>/_common_metadata and <table>/_metadata for Parquet window chunks.
+
+    _metadata holds every chunk's row-group footer (with min/max statistics),
+    so Arrow/dplyr/pandas can open output_dir/<table> as one dataset and skip
+    row groups for filters such as keep_flag = 1 without opening each file.
+    """
+    require_pyarrow()
+    paths_by_table: Dict[str, List[str]] = {}
+    for row in chunk_manifest_rows:
+        chunk_path = str(row["chunk_path"])
+        if chunk_path.endswith(CHUNK_FORMAT_SUFFIXES["parquet"]):
+            paths_by_table.setdefault(str(row["table_name"]), []).append(chunk_path)
+
+    for table, chunk_paths in paths_by_table.items():
+        table_dir = output_dir / table
+        collector = []
+        schema = None
+        for chunk_path in chunk_paths:
+            path = output_dir / chunk_path
+            metadata = pq.read_metadata(str(path))
+            metadata.set_file_path(str(path.relative_to(table_dir)))
+            collector.append(metadata)
+            if schema is None:
+                schema = pq.read_schema(str(path))
+        pq.write_metadata(schema, str(table_dir / "_common_metadata"))
+        pq.write_metadata(schema, str(table_dir / "_metadata"), metadata_collector=collector)
+        print(f"[INFO] Wrote Parquet dataset metadata for {table} ({len(chunk_paths)} chunks)", file=sys.stderr)
 
 def build_species_pk_lookup(natural_history_rows: Sequence[Dict[str, str]]) -> Dict[str, str]:
     lookup: Dict[str, str] = {}
@@ -734,8 +1006,16 @@ def find_fasta(accession: str, fasta_path_lookup: Dict[str, Path]) -> Path:
     return fasta_path
 
 
-def load_genome(input_fasta: Path):
-    """Index/load a genome FASTA with pyfaidx, matching load_genome_pyfaidx.py behavior."""
+def load_genome(input_fasta: Path, build_store: bool = False):
+    """Open a genome, preferring the shared memory-mapped genome store.
+
+    A current genomes/<accession>/genome_store is used when present (and built
+    first when build_store is True); otherwise the FASTA is indexed/loaded with
+    pyfaidx, matching load_genome_pyfaidx.py behavior.
+    """
+    store = genome_store.open_genome_store(input_fasta, build=build_store)
+    if store is not None:
+        return store
     if pyfaidx is None:
         raise ImportError("pyfaidx is required. Install with: conda install -c bioconda pyfaidx")
     try:
@@ -748,6 +1028,188 @@ def get_sequence(genome_object, sequence_id: str, start_1_based: int, end_1_base
     end_0_based = int(end_1_based)
     return genome_object[sequence_id][start_0_based:end_0_based]
 
+# Header text rules for infer_sequence_type(), highest priority first. They are
+# compiled into one alternation with a named group per rule; see
+# classify_normalized_sequence_text() for why priority order matters.
+SEQUENCE_TYPE_TEXT_RULES = [
+    (
+        "mitochondrial_text",
+        [
+            r"\bmitochondrion\b",
+            r"\bmitochondrial\b",
+            r"\bmitogenome\b",
+            r"\bmt\s+genome\b",
+            r"\bmtdna\b",
+            r"\bchrm\b",
+            r"\bchr\s*m\b",
+            r"\bchromosome\s+m\b",
+            r"\bmitochondrial\s+chromosome\b",
+        ],
+    ),
+    # These labels are strong evidence that a record is not a named nuclear
+    # chromosome, even if the organism name or other prose contains "chromosome".
+    (
+        "explicit_scaffold_text",
+        [
+            r"\bunplaced\b",
+            r"\bunlocalized\b",
+            r"\bscaffold\b",
+            r"\bscaf\b",
+            r"\bcontig\b",
+            r"\bctg\b",
+        ],
+    ),
+    (
+        "chromosome_text",
+        [
+            r"\bchromosome\s+[0-9ivxlcdmxyzw]+\b",
+            r"\bchromosome\b",
+            r"\bchrom\s+[0-9ivxlcdmxyzw]+\b",
+            r"\bchr\s*[0-9ivxlcdmxyzw]+\b",
+            r"\bmicrochromosome\b",
+            r"\bmacrochromosome\b",
+            r"\blinkage\s+group\b",
+            r"\blg\s*[0-9a-z]+\b",
+            r"\bsex\s+chromosome\b",
+        ],
+    ),
+    (
+        "wgs_text",
+        [
+            r"\bwhole\s+genome\s+shotgun\s+sequence\b",
+            r"\bwgs\s+sequence\b",
+            r"\bshotgun\s+sequence\b",
+            r"\bgenomic\s+scaffold\b",
+            r"\bgenomic\s+contig\b",
+        ],
+    ),
+]
+
+# Zero-width lookahead so every start position is tried; a rule hidden by an
+# overlapping match can only be hidden by a higher-priority rule.
+SEQUENCE_TYPE_TEXT_PATTERN = re.compile(
+    "(?=" + "|".join(f"(?P<{name}>{'|'.join(patterns)})" for name, patterns in SEQUENCE_TYPE_TEXT_RULES) + ")"
+)
+SEQUENCE_TYPE_TEXT_RULE_NAMES = [name for name, _ in SEQUENCE_TYPE_TEXT_RULES]
+
+HEADER_PUNCTUATION_PATTERN = re.compile(r"[_\-:;,\[\]\(\)=]+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+DIGIT_RUN_PATTERN = re.compile(r"[0-9]+")
+WGS_ACCESSION_PATTERN = re.compile(r"^[A-Z]{4,6}\d{6,}\.\d+$")
+
+CHROMOSOME_ACCESSION_PREFIXES = ("NC_", "CM_", "OX_", "OW_", "CP_")
+SCAFFOLD_ACCESSION_PREFIXES = ("NW_", "NT_", "NZ_")
+
+SEQUENCE_TYPE_RULE_NAMES = [
+    "mitochondrial_text",
+    "chromosome_accession_prefix",
+    "scaffold_accession_prefix",
+    "explicit_scaffold_text",
+    "chromosome_text",
+    "wgs_text",
+    "wgs_accession",
+    "no_rule",
+]
+
+
+def accession_prefix_class(seq_upper: str) -> str:
+    if seq_upper.startswith(CHROMOSOME_ACCESSION_PREFIXES):
+        return "chromosome_accession_prefix"
+    if seq_upper.startswith(SCAFFOLD_ACCESSION_PREFIXES):
+        return "scaffold_accession_prefix"
+    if WGS_ACCESSION_PATTERN.match(seq_upper):
+        return "wgs_accession"
+    return ""
+
+
+def normalize_sequence_text(seq_name: str, description: str) -> str:
+    """Lowercase, punctuation-free header text with digit runs collapsed to one digit.
+
+    No rule depends on how many digits a run has, only on whether a digit is
+    present, so "scaffold_1" and "scaffold_48211" share one cache entry.
+    """
+    text = f"{seq_name} {description}".lower().replace("|", " ")
+    text = HEADER_PUNCTUATION_PATTERN.sub(" ", text)
+    text = WHITESPACE_PATTERN.sub(" ", text).strip()
+    return DIGIT_RUN_PATTERN.sub("0", text)
+
+
+@lru_cache(maxsize=65536)
+def classify_normalized_sequence_text(prefix_class: str, text: str) -> Tuple[str, str]:
+    """Return (sequence_type, rule_name) for a prefix class and normalized header text.
+
+    Only the highest-priority text rule present matters, so the single
+    alternation is scanned once and the best rule index is kept.
+    """
+    best = len(SEQUENCE_TYPE_TEXT_RULE_NAMES)
+    for match in SEQUENCE_TYPE_TEXT_PATTERN.finditer(text):
+        best = min(best, SEQUENCE_TYPE_TEXT_RULE_NAMES.index(match.lastgroup))
+        if best == 0:
+            break
+    text_rule = SEQUENCE_TYPE_TEXT_RULE_NAMES[best] if best < len(SEQUENCE_TYPE_TEXT_RULE_NAMES) else ""
+
+    if text_rule == "mitochondrial_text":
+        return "mitochondrion", text_rule
+
+    # Accession-prefix fallbacks are useful because pyfaidx sequence IDs often
+    # only contain the accession, not the full NCBI description.
+    # NC_ can be nuclear chromosome or mitochondrial; mitochondrial text above
+    # must be checked first.
+    if prefix_class == "chromosome_accession_prefix":
+        return "chromosome", prefix_class
+    if prefix_class == "scaffold_accession_prefix":
+        return "scaffold", prefix_class
+
+    # Some GenBank chromosome-scale records have project-style accessions rather
+    # than CM_/NC_ prefixes. If the header says chromosome, trust that before
+    # broad WGS wording such as "whole genome shotgun sequence".
+    if text_rule == "explicit_scaffold_text":
+        return "scaffold", text_rule
+    if text_rule == "chromosome_text":
+        return "chromosome", text_rule
+    if text_rule == "wgs_text":
+        return "scaffold", text_rule
+
+    # Generic WGS contig/scaffold accessions such as JAAAAA010000001.1 are not
+    # chromosome-level unless the header supplied chromosome evidence above.
+    if prefix_class == "wgs_accession":
+        return "scaffold", prefix_class
+
+    return "unclassified", "no_rule"
+
+
+def classify_sequence_type(seq_name: str, description: str = "") -> Tuple[str, str]:
+    """Return (sequence_type, rule_name) for one FASTA record."""
+    return classify_normalized_sequence_text(
+        accession_prefix_class(str(seq_name).upper()),
+        normalize_sequence_text(seq_name, description),
+    )
+
+
+def classify_sequence_types(
+    records: Iterable[Tuple[str, str]],
+) -> Tuple[List[Tuple[str, str]], Dict[str, int]]:
+    """Classify all (sequence_id, description) records of a genome at once.
+
+    Returns one (sequence_type, rule_name) per record plus per-rule hit counts
+    for sequence_type_audit.
+    """
+    results = [classify_sequence_type(seq_name, description) for seq_name, description in records]
+    return results, rule_hit_counts(rule for _, rule in results)
+
+
+def rule_hit_counts(rules: Iterable[str]) -> Dict[str, int]:
+    counts = {name: 0 for name in SEQUENCE_TYPE_RULE_NAMES}
+    for rule in rules:
+        counts[rule] = counts.get(rule, 0) + 1
+    return counts
+
+
+def format_rule_hits(counts: Dict[str, int]) -> str:
+    """Compact 'rule=count;...' text for sequence_type_audit, skipping zero counts."""
+    return ";".join(f"{name}={count}" for name, count in counts.items() if count) or r"\N"
+
+
 def infer_sequence_type(seq_name: str, description: str = "") -> str:
     """
     Infer sequence type from both FASTA sequence ID and full FASTA header.
@@ -764,94 +1226,150 @@ def infer_sequence_type(seq_name: str, description: str = "") -> str:
     and chromosome-level accession prefixes are evaluated before broad WGS
     wording. Explicit unplaced/unlocalized/scaffold/contig labels still win
     over generic chromosome wording when they are present.
+
+    The rules live in SEQUENCE_TYPE_TEXT_RULES and are applied by
+    classify_sequence_type(), which also reports which rule decided.
     """
-    raw_text = f"{seq_name} {description}"
-    text = raw_text.lower()
-    text = text.replace("|", " ")
-    text = re.sub(r"[_\-:;,\[\]\(\)=]+", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    seq_upper = str(seq_name).upper()
-
-    def has_any(patterns: Sequence[str]) -> bool:
-        return any(re.search(pattern, text) for pattern in patterns)
-
-    mitochondrial_patterns = [
-        r"\bmitochondrion\b",
-        r"\bmitochondrial\b",
-        r"\bmitogenome\b",
-        r"\bmt\s+genome\b",
-        r"\bmtdna\b",
-        r"\bchrm\b",
-        r"\bchr\s*m\b",
-        r"\bchromosome\s+m\b",
-        r"\bmitochondrial\s+chromosome\b",
-    ]
+    return classify_sequence_type(seq_name, description)[0]
 
-    # These labels are strong evidence that a record is not a named nuclear
-    # chromosome, even if the organism name or other prose contains "chromosome".
-    explicit_scaffold_patterns = [
-        r"\bunplaced\b",
-        r"\bunlocalized\b",
-        r"\bscaffold\b",
-        r"\bscaf\b",
-        r"\bcontig\b",
-        r"\bctg\b",
-    ]
 
-    chromosome_patterns = [
-        r"\bchromosome\s+[0-9ivxlcdmxyzw]+\b",
-        r"\bchromosome\b",
-        r"\bchrom\s+[0-9ivxlcdmxyzw]+\b",
-        r"\bchr\s*[0-9ivxlcdmxyzw]+\b",
-        r"\bmicrochromosome\b",
-        r"\bmacrochromosome\b",
-        r"\blinkage\s+group\b",
-        r"\blg\s*[0-9a-z]+\b",
-        r"\bsex\s+chromosome\b",
-    ]
+def fai_is_current(fasta_path: Path, fai_path: Path) -> bool:
+    """Same staleness rule as pyfaidx: an index older than its FASTA is rebuilt."""
+    try:
+        return fai_path.stat().st_mtime >= fasta_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
 
-    broad_wgs_scaffold_patterns = [
-        r"\bwhole\s+genome\s+shotgun\s+sequence\b",
-        r"\bwgs\s+sequence\b",
-        r"\bshotgun\s+sequence\b",
-        r"\bgenomic\s+scaffold\b",
-        r"\bgenomic\s+contig\b",
-    ]
 
-    if has_any(mitochondrial_patterns):
-        return "mitochondrion"
+def headers_from_fai(fasta_path: Path, entries: Sequence[Tuple[str, int, int, int, int]]) -> List[str]:
+    """Read each record's defline by seeking back from its .fai offset, without scanning sequence data.
 
-    # Accession-prefix fallbacks are useful because pyfaidx sequence IDs often
-    # only contain the accession, not the full NCBI description.
-    # NC_ can be nuclear chromosome or mitochondrial; mitochondrial text above
-    # must be checked first.
-    if seq_upper.startswith(("NC_", "CM_", "OX_", "OW_", "CP_")):
-        return "chromosome"
+    The defline is the line ending at the record's offset, so it is found by
+    searching backwards for the ">" that starts it. Unlike recomputing where
+    the previous record's bases end, this holds for every layout pyfaidx
+    accepts (longer or shorter last lines, trailing blank lines).
+    """
+    headers = []
+    with fasta_path.open("rb") as handle:
+        for name, _, offset, _, _ in entries:
+            window = 4096
+            while True:
+                start = max(0, offset - window)
+                handle.seek(start)
+                block = handle.read(offset - start)
+                line_start = block.rfind(b"\n>", 0, len(block) - 1)
+                if line_start >= 0:
+                    defline = block[line_start + 2:]
+                    break
+                if start == 0:
+                    if block[:1] != b">":
+                        raise ValueError(f"No defline found before >{name} in {fasta_path}")
+                    defline = block[1:]
+                    break
+                window *= 4
+            headers.append(defline.decode().rstrip("\r\n"))
+    return headers
+
+
+def fasta_header_cache_path(cache_dir: Path, accession: str) -> Path:
+    return cache_dir / f"{sanitize_filename_token(accession)}.fasta_headers.json"
+
+
+def read_fasta_header_cache(cache_path: Path, fasta_path: Path) -> Optional[List[List[object]]]:
+    """Return cached FASTA_HEADER_CACHE_COLUMNS rows if still valid."""
+    try:
+        with cache_path.open("r") as handle:
+            cache = json.load(handle)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if (
+        cache.get("fasta_path") != str(fasta_path)
+        or cache.get("fasta_signature") != file_signature(fasta_path)
+        or cache.get("columns") != FASTA_HEADER_CACHE_COLUMNS
+    ):
+        return None
+    records = cache.get("sequences", [])
+    if cache.get("sequence_type_rules_version") != SEQUENCE_TYPE_RULES_VERSION:
+        records = classified_header_records(
+            [(sequence_id, length) for sequence_id, length, _, _, _ in records],
+            [description for _, _, _, _, description in records],
+        )
+        write_fasta_header_cache(cache_path, fasta_path, records)
+    return records
 
-    if seq_upper.startswith(("NW_", "NT_", "NZ_")):
-        return "scaffold"
 
-    # Some GenBank chromosome-scale records have project-style accessions rather
-    # than CM_/NC_ prefixes. If the header says chromosome, trust that before
-    # broad WGS wording such as "whole genome shotgun sequence".
-    has_explicit_scaffold = has_any(explicit_scaffold_patterns)
-    has_chromosome = has_any(chromosome_patterns)
+def classified_header_records(
+    names_and_lengths: Sequence[Tuple[str, int]],
+    descriptions: Sequence[str],
+) -> List[List[object]]:
+    """Build FASTA_HEADER_CACHE_COLUMNS rows, classifying the whole genome in one batch."""
+    classified, _ = classify_sequence_types(
+        (name, description) for (name, _), description in zip(names_and_lengths, descriptions)
+    )
+    return [
+        [name, length, sequence_type, rule, description]
+        for (name, length), (sequence_type, rule), description in zip(names_and_lengths, classified, descriptions)
+    ]
 
-    if has_explicit_scaffold:
-        return "scaffold"
 
-    if has_chromosome:
-        return "chromosome"
+def write_fasta_header_cache(cache_path: Path, fasta_path: Path, records: Sequence[Sequence[object]]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with tmp_path.open("w") as handle:
+        json.dump(
+            {
+                "fasta_path": str(fasta_path),
+                "fasta_signature": file_signature(fasta_path),
+                "sequence_type_rules_version": SEQUENCE_TYPE_RULES_VERSION,
+                "columns": FASTA_HEADER_CACHE_COLUMNS,
+                "sequences": [list(record) for record in records],
+            },
+            handle,
+        )
+    os.replace(tmp_path, cache_path)
 
-    if has_any(broad_wgs_scaffold_patterns):
-        return "scaffold"
 
-    # Generic WGS contig/scaffold accessions such as JAAAAA010000001.1 are not
-    # chromosome-level unless the header supplied chromosome evidence above.
-    if re.match(r"^[A-Z]{4,6}\d{6,}\.\d+$", seq_upper):
-        return "scaffold"
+def scan_genome_sequences(
+    accession: str,
+    fasta_path: Path,
+    max_sequences_per_genome: Optional[int] = None,
+    header_cache_dir: Optional[Path] = None,
+) -> List[Tuple[str, int, str, str]]:
+    """Return (sequence_id, sequence_length, sequence_type, sequence_type_rule) for one genome FASTA.
+
+    Sequence IDs, lengths and deflines come from an existing, current .fai plus
+    one seek per record; otherwise the FASTA is indexed once with
+    genome_store.index_fasta_file (pyfaidx's layout rules) and the .fai is
+    written for pyfaidx to reuse. With header_cache_dir, the result is cached
+    as <accession>.fasta_headers.json keyed on the FASTA size/mtime, so later
+    runs do not touch the FASTA at all.
+    """
+    cache_path = fasta_header_cache_path(header_cache_dir, accession) if header_cache_dir is not None else None
+    records = read_fasta_header_cache(cache_path, fasta_path) if cache_path is not None else None
+
+    if records is None:
+        fai_path = Path(f"{fasta_path}.fai")
+        if fai_is_current(fasta_path, fai_path):
+            print(f"[INFO] Reading headers for {accession} from {fai_path}", file=sys.stderr)
+            entries = read_fai(fai_path)
+            headers = headers_from_fai(fasta_path, entries)
+        else:
+            print(f"[INFO] Indexing {accession}: {fasta_path}", file=sys.stderr)
+            entries = genome_store.index_fasta_file(fasta_path)
+            headers = headers_from_fai(fasta_path, entries)
+            write_fai(fai_path, entries)
+        records = classified_header_records([(name, length) for name, length, _, _, _ in entries], headers)
+        if cache_path is not None:
+            write_fasta_header_cache(cache_path, fasta_path, records)
+    else:
+        print(f"[INFO] Using cached FASTA headers for {accession}: {cache_path}", file=sys.stderr)
 
-    return "unclassified"
+    if max_sequences_per_genome is not None:
+        records = records[:max_sequences_per_genome]
+    return [
+        (str(sequence_id), int(length), str(sequence_type), str(rule))
+        for sequence_id, length, sequence_type, rule, _ in records
+    ]
 
 
 def build_sequences_rows(
@@ -860,33 +1378,50 @@ def build_sequences_rows(
     fasta_path_lookup: Dict[str, Path],
     start_pk: int = 1,
     max_sequences_per_genome: Optional[int] = None,
+    workers: int = 1,
+    header_cache_dir: Optional[Path] = None,
 ) -> List[Dict[str, object]]:
+    """Build sequences rows; with workers > 1 FASTAs are scanned in a process pool.
+
+    See scan_genome_sequences() for how IDs, lengths and types are read and cached.
+
+    sequence_pk values are assigned after all scans finish, in manifest order,
+    so parallel and serial runs produce the same rows.
+    """
     rows: List[Dict[str, object]] = []
     sequence_pk = start_pk
 
-    for manifest_row in manifest_rows:
-        accession = manifest_row["accession"]
-        genome_pk = accession_to_genome_pk[accession]
-        fasta_path = find_fasta(accession, fasta_path_lookup)
-        print(f"[INFO] Loading {accession}: {fasta_path}", file=sys.stderr)
-        genome = load_genome(fasta_path)
-
-        sequence_ids = list(genome.keys())
-        if max_sequences_per_genome is not None:
-            sequence_ids = sequence_ids[:max_sequences_per_genome]
+    scan_args = [
+        (
+            manifest_row["accession"],
+            find_fasta(manifest_row["accession"], fasta_path_lookup),
+            max_sequences_per_genome,
+            header_cache_dir,
+        )
+        for manifest_row in manifest_rows
+    ]
+    if workers > 1 and len(scan_args) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scans = list(executor.map(scan_genome_sequences, *zip(*scan_args)))
+    else:
+        scans = [scan_genome_sequences(*args) for args in scan_args]
 
-        for sequence_id in sequence_ids:
+    for (accession, _, _, _), records in zip(scan_args, scans):
+        genome_pk = accession_to_genome_pk[accession]
+        for sequence_id, sequence_length, sequence_type, sequence_type_rule in records:
             rows.append(
                 {
                     "sequence_pk": sequence_pk,
                     "genome_pk": genome_pk,
                     "sequence_id": sequence_id,
-                    "sequence_length": len(genome[sequence_id]),
-                    "sequence_type": infer_sequence_type(sequence_id, getattr(genome[sequence_id], "long_name", ""),),
-                    "gc": r"\N",}
+                    "sequence_length": sequence_length,
+                    "sequence_type": sequence_type,
+                    "gc": r"\N",
+                    # Not a sequences column; summarized in sequence_type_audit.
+                    "sequence_type_rule": sequence_type_rule,
+                }
             )
             sequence_pk += 1
-        genome.close()
     return rows
 
 
@@ -984,15 +1519,20 @@ def build_sequence_type_audit_rows(
       - ncbi_total_chromosomes should usually match n_chromosome_inferred.
       - ncbi_number_scaffolds is reported for reference, but may include
         chromosome-scale scaffolds, so it is not used as a hard pass/fail check.
+      - sequence_type_rule_hits counts which classify_sequence_type() rule
+        decided each record, e.g. "chromosome_text=12;wgs_accession=3401".
     """
     genome_pk_to_accession = {
         int(row["genome_pk"]): str(row["accession_id"]) for row in genomes_rows
     }
 
     counts: Dict[int, Dict[str, int]] = {}
+    rules_by_genome: Dict[int, List[str]] = {}
     for row in sequences_rows:
         genome_pk = int(row["genome_pk"])
         seq_type = str(row.get("sequence_type", "unclassified"))
+        if "sequence_type_rule" in row:
+            rules_by_genome.setdefault(genome_pk, []).append(str(row["sequence_type_rule"]))
         if genome_pk not in counts:
             counts[genome_pk] = {
                 "n_fasta_sequences": 0,
@@ -1052,6 +1592,7 @@ def build_sequence_type_audit_rows(
                 "chromosome_count_match": chromosome_match,
                 "component_sequence_count_match": component_match,
                 "audit_status": audit_status,
+                "sequence_type_rule_hits": format_rule_hits(rule_hit_counts(rules_by_genome.get(genome_pk, []))),
             }
         )
 
@@ -1103,64 +1644,245 @@ def base_counts(sequence: str) -> Dict[str, int]:
     }
 
 
-def quantile(values: Sequence[float], q: float) -> object:
-    """Linear-interpolated quantile with SQL NULL for empty input."""
-    vals = sorted(float(v) for v in values if v is not None)
-    if not vals:
+# Byte -> base class lookup for the vectorized window engine. Upper- and
+# lower-case letters share a class, matching base_counts() which upper-cases
+# each window before counting. Class 6 collects every other byte.
+BASE_CLASS_ORDER = ("a_count", "c_count", "g_count", "t_count", "n_count", "gap_bp")
+OTHER_BASE_CLASS = len(BASE_CLASS_ORDER)
+BASE_CLASS_LOOKUP = np.full(256, OTHER_BASE_CLASS, dtype=np.uint8)
+for _class_index, _bases in enumerate(("Aa", "Cc", "Gg", "Tt", "Nn", "-")):
+    for _base in _bases:
+        BASE_CLASS_LOOKUP[ord(_base)] = _class_index
+
+
+def window_start_positions(seq_len: int, step_bp: int, start_offset_bp: int) -> np.ndarray:
+    """0-based window starts, identical to range(max(0, offset), seq_len, step)."""
+    return np.arange(max(0, int(start_offset_bp)), int(seq_len), int(step_bp), dtype=np.int64)
+
+
+def sequence_base_classes(genome_object, sequence_id: str) -> np.ndarray:
+    """Read one sequence once and return a uint8 base-class code per position."""
+    if isinstance(genome_object, genome_store.GenomeStore):
+        return BASE_CLASS_LOOKUP[genome_object.array(sequence_id)]
+    raw = str(genome_object[sequence_id][:]).encode("ascii", "replace")
+    return BASE_CLASS_LOOKUP[np.frombuffer(raw, dtype=np.uint8)]
+
+
+def multi_scale_window_counts(
+    base_classes: np.ndarray,
+    seq_len: int,
+    window_specs: Sequence[Tuple[int, int]],
+    start_offset_bp: int,
+) -> List[Dict[str, np.ndarray]]:
+    """Count bases for every window of every (size, step) spec in one pass.
+
+    All window starts and ends across all specs are merged into one sorted
+    boundary array. Per-class counts are summed between consecutive
+    boundaries with np.add.reduceat and turned into prefix sums, so every
+    window count is a difference of two prefix-sum lookups. Prefix sums are
+    only materialized at boundaries rather than per base, which keeps memory
+    proportional to the sequence length (one uint8 code per base) instead of
+    six int64 arrays per base.
+
+    Returned arrays per spec:
+      start0/end0:     0-based half-open window coordinates from seq_len
+      fragment_bp:     bases actually present in the FASTA for the window
+      a_count ... gap_bp: per-class counts, as base_counts() would report
+    """
+    actual_len = int(base_classes.shape[0])
+    windows: List[Tuple[np.ndarray, np.ndarray]] = []
+    boundary_parts = [np.array([0, actual_len], dtype=np.int64)]
+    for size_bp, step_bp in window_specs:
+        start0 = window_start_positions(seq_len, step_bp, start_offset_bp)
+        end0 = np.minimum(start0 + int(size_bp), int(seq_len))
+        windows.append((start0, end0))
+        # pyfaidx truncates slices past the end of the record, so clip the
+        # count boundaries to the bases that are really there.
+        boundary_parts.append(np.minimum(start0, actual_len))
+        boundary_parts.append(np.minimum(end0, actual_len))
+    boundaries = np.unique(np.concatenate(boundary_parts))
+
+    prefix_by_class: Dict[str, np.ndarray] = {}
+    for class_index, column in enumerate(BASE_CLASS_ORDER):
+        prefix = np.zeros(boundaries.shape[0], dtype=np.int64)
+        if actual_len > 0:
+            segment_sums = np.add.reduceat(base_classes == class_index, boundaries[:-1], dtype=np.int64)
+            np.cumsum(segment_sums, out=prefix[1:])
+        prefix_by_class[column] = prefix
+
+    results: List[Dict[str, np.ndarray]] = []
+    for start0, end0 in windows:
+        lo = np.searchsorted(boundaries, np.minimum(start0, actual_len))
+        hi = np.searchsorted(boundaries, np.minimum(end0, actual_len))
+        counts: Dict[str, np.ndarray] = {
+            "start0": start0,
+            "end0": end0,
+            "fragment_bp": boundaries[hi] - boundaries[lo],
+        }
+        for column in BASE_CLASS_ORDER:
+            prefix = prefix_by_class[column]
+            counts[column] = prefix[hi] - prefix[lo]
+        results.append(counts)
+    return results
+
+
+def window_count_tuples(counts: Dict[str, np.ndarray]) -> Iterable[Tuple[object, ...]]:
+    """Yield base_counts()-equivalent values per window as plain Python tuples.
+
+    Tuple order matches GC_WINDOW_STATS_COLUMNS without the leading window_pk.
+    """
+    a = counts["a_count"]
+    c = counts["c_count"]
+    g = counts["g_count"]
+    t = counts["t_count"]
+    n = counts["n_count"]
+    gap = counts["gap_bp"]
+    fragment_bp = counts["fragment_bp"]
+    callable_bp = a + c + g + t
+    gc_bp = g + c
+    other = fragment_bp - (callable_bp + n + gap)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gc_prop = np.where(callable_bp > 0, gc_bp / np.maximum(callable_bp, 1), np.nan)
+        callable_frac = np.where(fragment_bp > 0, callable_bp / np.maximum(fragment_bp, 1), np.nan)
+
+    for values in zip(
+        a.tolist(), c.tolist(), g.tolist(), t.tolist(), n.tolist(), other.tolist(), callable_bp.tolist(),
+        gc_bp.tolist(), gc_prop.tolist(), callable_frac.tolist(), gap.tolist(), fragment_bp.tolist(),
+    ):
+        a_i, c_i, g_i, t_i, n_i, other_i, callable_i, gc_i, gc_prop_i, callable_frac_i, gap_i, fragment_i = values
+        yield (
+            a_i,
+            c_i,
+            g_i,
+            t_i,
+            n_i,
+            other_i,
+            callable_i,
+            gc_i,
+            gc_prop_i if callable_i > 0 else r"\N",
+            callable_frac_i if fragment_i > 0 else r"\N",
+            n_i,
+            gap_i,
+        )
+
+
+def sorted_quantile(sorted_values: np.ndarray, q: float) -> object:
+    """Linear-interpolated quantile of an already sorted array, SQL NULL when empty."""
+    n_values = int(sorted_values.shape[0])
+    if n_values == 0:
         return r"\N"
-    if len(vals) == 1:
-        return vals[0]
-    pos = (len(vals) - 1) * q
+    if n_values == 1:
+        return float(sorted_values[0])
+    pos = (n_values - 1) * q
     lo = math.floor(pos)
     hi = math.ceil(pos)
     if lo == hi:
-        return vals[lo]
-    return vals[lo] * (hi - pos) + vals[hi] * (pos - lo)
+        return float(sorted_values[lo])
+    return float(sorted_values[lo]) * (hi - pos) + float(sorted_values[hi]) * (pos - lo)
 
 
-def median_abs_deviation(values: Sequence[float]) -> object:
-    vals = [float(v) for v in values if v is not None]
-    if not vals:
-        return r"\N"
-    med = statistics.median(vals)
-    return statistics.median([abs(v - med) for v in vals])
-
-
-def summarize_gc_values(gc_values: Sequence[float], callable_fracs: Sequence[float], callable_bps: Sequence[int], gap_bps: Sequence[int]) -> Dict[str, object]:
-    """Summary stats used by sequence_summary and genome_summary."""
-    vals = [float(v) for v in gc_values if v is not None]
-    call_fracs = [float(v) for v in callable_fracs if v is not None]
-    total_callable = sum(int(v) for v in callable_bps)
-    weighted_mean = r"\N"
-    if total_callable > 0 and vals:
-        weighted_mean = sum(float(gc) * int(bp) for gc, bp in zip(gc_values, callable_bps) if gc is not None) / total_callable
-
-    if vals:
-        mean_gc = statistics.mean(vals)
-        var_gc = statistics.variance(vals) if len(vals) > 1 else 0.0
-        sd_gc = math.sqrt(var_gc)
-        median_gc = statistics.median(vals)
-        iqr_gc = quantile(vals, 0.75) - quantile(vals, 0.25) if len(vals) > 0 else r"\N"
-    else:
-        mean_gc = weighted_mean_gc = sd_gc = var_gc = median_gc = iqr_gc = r"\N"
+def unsorted_median(values: np.ndarray) -> float:
+    """Median by selection (np.partition) instead of a full sort."""
+    n_values = int(values.shape[0])
+    mid = n_values // 2
+    if n_values % 2:
+        return float(np.partition(values, mid)[mid])
+    lower, upper = np.partition(values, [mid - 1, mid])[mid - 1:mid + 1]
+    return (float(lower) + float(upper)) / 2
 
-    return {
-        "mean_gc": mean_gc if vals else r"\N",
-        "weighted_mean_gc": weighted_mean,
-        "sd_gc": sd_gc if vals else r"\N",
-        "var_gc": var_gc if vals else r"\N",
-        "median_gc": median_gc if vals else r"\N",
-        "mad_gc": median_abs_deviation(vals),
-        "iqr_gc": iqr_gc if vals else r"\N",
-        "q05_gc": quantile(vals, 0.05),
-        "q25_gc": quantile(vals, 0.25),
-        "q75_gc": quantile(vals, 0.75),
-        "q95_gc": quantile(vals, 0.95),
-        "mean_callable_fraction": statistics.mean(call_fracs) if call_fracs else r"\N",
-        "median_callable_fraction": statistics.median(call_fracs) if call_fracs else r"\N",
-        "callable_bp_total": total_callable,
-        "gap_bp_total": sum(int(v) for v in gap_bps),
-    }
+
+class GcWindowAccumulator:
+    """Single-pass summary statistics for kept-window GC values.
+
+    Used for both sequence_summary and genome_summary. Mean and variance use
+    Welford's update, the callable-weighted mean uses exact integer GC and
+    callable base totals, and quantiles/MAD come from one sorted NumPy copy
+    of the stored values when summary() is called. Sequence accumulators are
+    folded into the genome accumulator with merge() rather than re-added.
+    """
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.callable_frac_mean = 0.0
+        self.gc_bp_total = 0
+        self.callable_bp_total = 0
+        self.gap_bp_total = 0
+        self.gc_values = array("d")
+        self.callable_fracs = array("d")
+
+    def add(self, gc_prop: float, callable_frac: float, gc_bp: int, callable_bp: int, gap_bp: int) -> None:
+        self.n += 1
+        delta = gc_prop - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (gc_prop - self.mean)
+        self.callable_frac_mean += (callable_frac - self.callable_frac_mean) / self.n
+        self.gc_bp_total += gc_bp
+        self.callable_bp_total += callable_bp
+        self.gap_bp_total += gap_bp
+        self.gc_values.append(gc_prop)
+        self.callable_fracs.append(callable_frac)
+
+    def merge(self, other: "GcWindowAccumulator") -> None:
+        """Fold another accumulator in (Chan et al. pairwise update)."""
+        if other.n == 0:
+            return
+        n_total = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n_total
+        self.mean += delta * other.n / n_total
+        self.callable_frac_mean += (other.callable_frac_mean - self.callable_frac_mean) * other.n / n_total
+        self.n = n_total
+        self.gc_bp_total += other.gc_bp_total
+        self.callable_bp_total += other.callable_bp_total
+        self.gap_bp_total += other.gap_bp_total
+        self.gc_values.extend(other.gc_values)
+        self.callable_fracs.extend(other.callable_fracs)
+
+    def summary(self) -> Dict[str, object]:
+        """Summary stats used by sequence_summary and genome_summary."""
+        if self.n == 0:
+            return {
+                "mean_gc": r"\N",
+                "weighted_mean_gc": r"\N",
+                "sd_gc": r"\N",
+                "var_gc": r"\N",
+                "median_gc": r"\N",
+                "mad_gc": r"\N",
+                "iqr_gc": r"\N",
+                "q05_gc": r"\N",
+                "q25_gc": r"\N",
+                "q75_gc": r"\N",
+                "q95_gc": r"\N",
+                "mean_callable_fraction": r"\N",
+                "median_callable_fraction": r"\N",
+                "callable_bp_total": self.callable_bp_total,
+                "gap_bp_total": self.gap_bp_total,
+            }
+
+        vals = np.sort(np.frombuffer(self.gc_values, dtype=np.float64))
+        median_gc = sorted_quantile(vals, 0.5)
+        q25_gc = sorted_quantile(vals, 0.25)
+        q75_gc = sorted_quantile(vals, 0.75)
+        var_gc = self.m2 / (self.n - 1) if self.n > 1 else 0.0
+        return {
+            "mean_gc": self.mean,
+            "weighted_mean_gc": (self.gc_bp_total / self.callable_bp_total) if self.callable_bp_total > 0 else r"\N",
+            "sd_gc": math.sqrt(var_gc),
+            "var_gc": var_gc,
+            "median_gc": median_gc,
+            "mad_gc": unsorted_median(np.abs(vals - median_gc)),
+            "iqr_gc": q75_gc - q25_gc,
+            "q05_gc": sorted_quantile(vals, 0.05),
+            "q25_gc": q25_gc,
+            "q75_gc": q75_gc,
+            "q95_gc": sorted_quantile(vals, 0.95),
+            "mean_callable_fraction": self.callable_frac_mean,
+            "median_callable_fraction": unsorted_median(np.frombuffer(self.callable_fracs, dtype=np.float64)),
+            "callable_bp_total": self.callable_bp_total,
+            "gap_bp_total": self.gap_bp_total,
+        }
 
 
 def build_analysis_run_rows(run_pk: int, analysis_name: str, mask_mode: str, min_callable_frac: float, notes: str) -> List[Dict[str, object]]:
@@ -1177,6 +1899,405 @@ def build_analysis_run_rows(run_pk: int, analysis_name: str, mask_mode: str, min
     }]
 
 
+def count_windows(seq_len: int, step_bp: int, start_offset_bp: int) -> int:
+    """Number of windows build_window_tables() writes for one sequence and step."""
+    return len(range(max(0, int(start_offset_bp)), int(seq_len), int(step_bp)))
+
+
+def sequence_list_digest(selected_sequences: Sequence[Dict[str, object]]) -> str:
+    """Digest of the sequence IDs/lengths that feed one genome's window sets."""
+    digest = hashlib.sha1()
+    for row in selected_sequences:
+        digest.update(f"{row['sequence_id']}\t{row['sequence_length']}\n".encode())
+    return digest.hexdigest()
+
+
+def window_chunk_fingerprint(
+    fasta_path: Path,
+    sequence_digest: str,
+    size_bp: int,
+    step_bp: int,
+    start_offset_bp: int,
+    min_callable_frac: float,
+    tiling_type: str,
+    mask_mode: str,
+    seq_scope: str,
+    chunk_format: str = "tsv",
+) -> str:
+    """Content fingerprint for one accession x window-size chunk set.
+
+    Covers everything that changes chunk contents apart from PK numbering:
+    the FASTA and its .fai (size/mtime), the selected sequences, window
+    parameters, and the summary labels written into the chunks.
+    """
+    payload = {
+        "engine": WINDOW_ENGINE_VERSION,
+        "fasta": str(fasta_path),
+        "fasta_signature": file_signature(fasta_path),
+        "faidx_signature": file_signature(Path(f"{fasta_path}.fai")),
+        "sequences": sequence_digest,
+        "window_size_bp": int(size_bp),
+        "step_size_bp": int(step_bp),
+        "start_offset_bp": int(start_offset_bp),
+        "min_callable_frac": float(min_callable_frac),
+        "tiling_type": tiling_type,
+        "mask_mode": mask_mode,
+        "seq_scope": seq_scope,
+        "chunk_format": chunk_format,
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def window_chunk_layout(
+    spec: Dict[str, object],
+    run_pk: int,
+    genome_pk: int,
+    species_pk: object,
+    first_sequence_pk: object,
+) -> Dict[str, object]:
+    """PK starting points recorded in window_chunk_manifest.tsv for one window set."""
+    return {
+        "run_pk": run_pk,
+        "genome_pk": genome_pk,
+        "window_set_pk": spec["window_set_pk"],
+        "first_sequence_pk": first_sequence_pk,
+        "window_pk_start": spec["window_pk_start"],
+        "sequence_summary_pk_start": spec["sequence_summary_pk_start"],
+        "genome_summary_pk": spec["genome_summary_pk"],
+        "species_pk": species_pk,
+    }
+
+
+def read_previous_window_chunk_manifest(output_dir: Path) -> Dict[Tuple[str, int, int], Dict[str, Dict[str, str]]]:
+    """Index an existing window_chunk_manifest.tsv by (accession, window size, step)."""
+    path = output_dir / "window_chunk_manifest.tsv"
+    if not path.exists():
+        return {}
+    previous: Dict[Tuple[str, int, int], Dict[str, Dict[str, str]]] = {}
+    for row in read_table(path, delimiter="\t"):
+        if not row.get("fingerprint") or row["fingerprint"] == r"\N":
+            continue
+        key = (row["accession_id"], int(row["standard_window_size_bp"]), int(row["step_size_bp"]))
+        previous.setdefault(key, {})[row["table_name"]] = row
+    return previous
+
+
+def renumber_window_chunk(
+    src: Path,
+    dst: Path,
+    table: str,
+    previous: Dict[str, str],
+    current: Dict[str, object],
+) -> int:
+    """Copy one chunk to dst, shifting its PK columns from the previous layout to the current one."""
+
+    def shift(column: str) -> int:
+        old = sql_pk(previous.get(column))
+        new = sql_pk(current.get(column))
+        if old == r"\N" or new == r"\N":
+            return 0
+        return int(new) - int(old)
+
+    window_delta = shift("window_pk_start")
+    sequence_delta = shift("first_sequence_pk")
+    sequence_summary_delta = shift("sequence_summary_pk_start")
+
+    offsets_by_table = {
+        "genomic_windows": {"window_pk": window_delta, "sequence_pk": sequence_delta},
+        "gc_window_stats": {"window_pk": window_delta},
+        "sequence_summary": {"sequence_summary_pk": sequence_summary_delta, "sequence_pk": sequence_delta},
+        "genome_summary": {},
+    }
+    constants_by_table = {
+        "genomic_windows": ["window_set_pk"],
+        "gc_window_stats": [],
+        "sequence_summary": ["run_pk", "genome_pk"],
+        "genome_summary": ["genome_summary_pk", "run_pk", "genome_pk", "species_pk"],
+    }
+    offsets = offsets_by_table[table]
+    constants = {column: sql_pk(current[column]) for column in constants_by_table[table]}
+    dst.parent.mkdir(parents=True, exist_ok=True)
+
+    if dst.name.endswith(CHUNK_FORMAT_SUFFIXES["parquet"]):
+        require_pyarrow()
+        data = pq.read_table(str(src))
+        for column, delta in offsets.items():
+            index = data.schema.get_field_index(column)
+            data = data.set_column(index, column, pc.add(data.column(column), pa.scalar(delta, pa.int64())))
+        for column, value in constants.items():
+            index = data.schema.get_field_index(column)
+            typed = None if value == r"\N" else int(value)
+            data = data.set_column(index, column, pa.array([typed] * data.num_rows, type=pa.int64()))
+        pq.write_table(data, str(dst), compression="zstd", row_group_size=PARQUET_ROW_GROUP_ROWS)
+        return data.num_rows
+
+    count = 0
+    with gzip.open(src, "rt", newline="") as in_handle, gzip.open(dst, "wt", newline="") as out_handle:
+        reader = csv.reader(in_handle, delimiter="\t")
+        writer = csv.writer(out_handle, delimiter="\t", lineterminator="\n")
+        header = next(reader)
+        writer.writerow(header)
+        column_offsets = [(index, offsets[column]) for index, column in enumerate(header) if column in offsets]
+        column_constants = [(index, constants[column]) for index, column in enumerate(header) if column in constants]
+        for row in reader:
+            for index, delta in column_offsets:
+                if row[index] != r"\N":
+                    row[index] = str(int(row[index]) + delta)
+            for index, value in column_constants:
+                row[index] = value
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def sequence_gc_from_window_chunks(output_dir: Path, chunk_paths: Dict[str, str]) -> Dict[int, object]:
+    """Recover sequences.gc for one window set from its written chunks.
+
+    Matches the value build_genome_window_chunks() computes: GC among callable
+    bases over every window of each sequence listed in sequence_summary.
+    """
+    totals: Dict[int, List[int]] = {}
+    for row in iter_window_chunk_rows(output_dir / chunk_paths["sequence_summary"]):
+        totals[int(row["sequence_pk"])] = [0, 0]
+    for window_row, gc_row in zip(
+        iter_window_chunk_rows(output_dir / chunk_paths["genomic_windows"]),
+        iter_window_chunk_rows(output_dir / chunk_paths["gc_window_stats"]),
+    ):
+        total = totals.setdefault(int(window_row["sequence_pk"]), [0, 0])
+        total[0] += int(gc_row["gc_bp"])
+        total[1] += int(gc_row["callable_bp"])
+    return {
+        sequence_pk: (gc_bp / callable_bp) if callable_bp > 0 else r"\N"
+        for sequence_pk, (gc_bp, callable_bp) in totals.items()
+    }
+
+
+def build_genome_window_chunks(
+    genome_pk: int,
+    accession: str,
+    species_pk: object,
+    fasta_path: Path,
+    first_sequence_pk: object,
+    selected_sequences: Sequence[Dict[str, object]],
+    window_specs: Sequence[Dict[str, object]],
+    run_pk: int,
+    min_callable_frac: float,
+    tiling_type: str,
+    start_offset_bp: int,
+    mask_mode: str,
+    output_dir: Path,
+    chunk_format: str = "tsv",
+    build_genome_store: bool = False,
+) -> Tuple[List[Dict[str, object]], Dict[int, object]]:
+    """Write window chunks for one genome, using pre-allocated PKs per window set.
+
+    Sequences are read one at a time and their windows are streamed into
+    open chunk writers for every window set, so peak memory is bounded by the
+    largest sequence rather than the whole genome.
+
+    This is the unit of work for --workers. Each window spec carries fixed PK
+    starting points from build_window_tables(), so genomes can be processed
+    in any order or in separate processes without changing the output.
+    Only the specs passed in are computed; --incremental passes just the
+    window sets whose fingerprint changed.
+    """
+    chunk_manifest_rows: List[Dict[str, object]] = []
+    sequence_gc_by_pk: Dict[int, object] = {}
+
+    print(f"[INFO] Building window chunks for {accession}: {fasta_path}", file=sys.stderr)
+    genome = load_genome(fasta_path, build_store=build_genome_store)
+
+    # One open writer per table and window set. Rows go straight to disk as
+    # each sequence is processed, so memory is bounded by one sequence.
+    states: List[Dict[str, object]] = []
+    for spec in window_specs:
+        size_bp = int(spec["size_bp"])
+        step_bp = int(spec["step_bp"])
+        states.append({
+            "size_bp": size_bp,
+            "step_bp": step_bp,
+            "window_set_pk": int(spec["window_set_pk"]),
+            "window_pk": int(spec["window_pk_start"]),
+            "sequence_summary_pk": int(spec["sequence_summary_pk_start"]),
+            "writers": {
+                table: WindowChunkWriter(
+                    output_dir, table, columns, run_pk, genome_pk, accession, size_bp, step_bp, chunk_format
+                )
+                for table, columns in [
+                    ("genomic_windows", GENOMIC_WINDOWS_COLUMNS),
+                    ("gc_window_stats", GC_WINDOW_STATS_COLUMNS),
+                    ("sequence_summary", SEQUENCE_SUMMARY_COLUMNS),
+                ]
+            },
+            "genome_stats": GcWindowAccumulator(),
+            "genome_total_windows": 0,
+            "genome_kept_windows": 0,
+            "genome_sequence_bp_used": 0,
+            "largest_sequence_bp": 0,
+            "seq_count_used": 0,
+        })
+
+    for seq_row in selected_sequences:
+        sequence_pk = int(seq_row["sequence_pk"])
+        sequence_id = str(seq_row["sequence_id"])
+        seq_len = int(seq_row["sequence_length"])
+        if sequence_id not in genome:
+            print(f"[WARN] Sequence {sequence_id} not found in FASTA for {accession}; skipping.", file=sys.stderr)
+            continue
+
+        # Read the sequence once and derive every window size/step from the
+        # same prefix sums.
+        base_classes = sequence_base_classes(genome, sequence_id)
+        counts_by_spec = multi_scale_window_counts(
+            base_classes,
+            seq_len=seq_len,
+            window_specs=[(state["size_bp"], state["step_bp"]) for state in states],
+            start_offset_bp=start_offset_bp,
+        )
+        del base_classes
+
+        for state, window_counts in zip(states, counts_by_spec):
+            size_bp = state["size_bp"]
+            current_window_set_pk = state["window_set_pk"]
+            window_pk = state["window_pk"]
+            window_writer = state["writers"]["genomic_windows"]
+            gc_writer = state["writers"]["gc_window_stats"]
+            state["seq_count_used"] += 1
+            state["genome_sequence_bp_used"] += seq_len
+            state["largest_sequence_bp"] = max(state["largest_sequence_bp"], seq_len)
+
+            seq_stats = GcWindowAccumulator()
+            # v13: whole-sequence GC, calculated from all windows for this sequence.
+            # This intentionally includes terminal short windows and N-rich windows.
+            # GC is calculated among callable A/C/G/T bases, so N/gap/other bases
+            # do not enter the denominator.
+            seq_all_callable_bp = 0
+            seq_all_gc_bp = 0
+            seq_total_windows = 0
+            seq_kept_windows = 0
+            seq_excluded_missing = 0
+            seq_excluded_short = 0
+
+            window_rank = 0
+            for window_start_0, window_end_0, counts in zip(
+                window_counts["start0"].tolist(),
+                window_counts["end0"].tolist(),
+                window_count_tuples(window_counts),
+            ):
+                width_actual = window_end_0 - window_start_0
+                window_rank += 1
+                seq_total_windows += 1
+
+                callable_bp = counts[6]
+                gc_bp = counts[7]
+                gc_prop = counts[8] if counts[8] != r"\N" else None
+                callable_frac = counts[9] if counts[9] != r"\N" else 0.0
+                gap_bp = counts[11]
+                seq_all_callable_bp += callable_bp
+                seq_all_gc_bp += gc_bp
+                keep_flag = 1 if (width_actual == size_bp and callable_frac >= min_callable_frac and gc_prop is not None) else 0
+                if keep_flag:
+                    seq_kept_windows += 1
+                    seq_stats.add(gc_prop, callable_frac, gc_bp, callable_bp, gap_bp)
+                else:
+                    if width_actual < size_bp:
+                        seq_excluded_short += 1
+                    else:
+                        seq_excluded_missing += 1
+
+                start_bp = window_start_0 + 1
+                end_bp = window_end_0
+                window_writer.write((
+                    window_pk,
+                    current_window_set_pk,
+                    sequence_pk,
+                    window_rank,
+                    start_bp,
+                    end_bp,
+                    (start_bp + end_bp) // 2,
+                    size_bp,
+                    width_actual,
+                    callable_frac,
+                    keep_flag,
+                ))
+                gc_writer.write((window_pk,) + counts)
+                window_pk += 1
+
+            state["window_pk"] = window_pk
+            state["genome_total_windows"] += seq_total_windows
+            state["genome_kept_windows"] += seq_kept_windows
+            state["genome_stats"].merge(seq_stats)
+
+            sequence_gc_by_pk[sequence_pk] = (seq_all_gc_bp / seq_all_callable_bp) if seq_all_callable_bp > 0 else r"\N"
+
+            seq_summary = seq_stats.summary()
+            state["writers"]["sequence_summary"].write_dict({
+                "sequence_summary_pk": state["sequence_summary_pk"],
+                "run_pk": run_pk,
+                "sequence_pk": sequence_pk,
+                "genome_pk": genome_pk,
+                "standard_window_size_bp": size_bp,
+                "step_size_bp": state["step_bp"],
+                "tiling_type": tiling_type,
+                "mask_mode": mask_mode,
+                "n_windows_total": seq_total_windows,
+                "n_windows_kept": seq_kept_windows,
+                "n_windows_excluded_missing": seq_excluded_missing,
+                "n_windows_excluded_short": seq_excluded_short,
+                **seq_summary,
+            })
+            state["sequence_summary_pk"] += 1
+        del counts_by_spec
+    genome.close()
+
+    for spec, state in zip(window_specs, states):
+        size_bp = state["size_bp"]
+        step_bp = state["step_bp"]
+        genome_summary_writer = WindowChunkWriter(
+            output_dir, "genome_summary", GENOME_SUMMARY_COLUMNS, run_pk, genome_pk, accession, size_bp, step_bp,
+            chunk_format,
+        )
+        genome_summary = state["genome_stats"].summary()
+        genome_summary.pop("median_callable_fraction", None)
+        genome_sequence_bp_used = state["genome_sequence_bp_used"]
+        genome_summary_writer.write_dict({
+            "genome_summary_pk": int(spec["genome_summary_pk"]),
+            "run_pk": run_pk,
+            "genome_pk": genome_pk,
+            "species_pk": species_pk,
+            "standard_window_size_bp": size_bp,
+            "step_size_bp": step_bp,
+            "tiling_type": tiling_type,
+            "mask_mode": mask_mode,
+            "n_windows_total": state["genome_total_windows"],
+            "n_windows_kept": state["genome_kept_windows"],
+            **genome_summary,
+            "seq_count_used": state["seq_count_used"],
+            "largest_seq_fraction": (state["largest_sequence_bp"] / genome_sequence_bp_used) if genome_sequence_bp_used > 0 else r"\N",
+        })
+
+        writers = dict(state["writers"])
+        writers["genome_summary"] = genome_summary_writer
+        for table in WINDOW_TABLES:
+            rel_path, n_rows = writers[table].close()
+            chunk_manifest_rows.append({
+                "table_name": table,
+                "chunk_path": rel_path,
+                "run_pk": run_pk,
+                "genome_pk": genome_pk,
+                "accession_id": accession,
+                "window_set_pk": state["window_set_pk"],
+                "standard_window_size_bp": size_bp,
+                "step_size_bp": step_bp,
+                "n_rows": n_rows,
+                "fingerprint": spec["fingerprint"],
+                **window_chunk_layout(spec, run_pk, genome_pk, species_pk, first_sequence_pk),
+            })
+            print(f"[INFO] Wrote {rel_path} ({n_rows} rows)", file=sys.stderr)
+
+    return chunk_manifest_rows, sequence_gc_by_pk
+
+
 def build_window_tables(
     manifest_rows: Sequence[Dict[str, str]],
     genomes_rows: Sequence[Dict[str, object]],
@@ -1195,6 +2316,10 @@ def build_window_tables(
     start_window_pk: int = 1,
     start_sequence_summary_pk: int = 1,
     start_genome_summary_pk: int = 1,
+    workers: int = 1,
+    incremental: bool = False,
+    chunk_format: str = "tsv",
+    build_genome_store: bool = False,
 ) -> Tuple[List[Dict[str, object]], List[Dict[str, object]], Dict[int, object]]:
     """Build window_set rows, write window-derived chunks, and return sequence GC values.
 
@@ -1207,9 +2332,31 @@ def build_window_tables(
       output_dir/sequence_summary/*.tsv.gz
       output_dir/genome_summary/*.tsv.gz
 
-    Coordinates are 1-based inclusive in the SQL tables. pyfaidx slicing is 0-based,
-    so start/end are converted at slice time only.
+    Coordinates are 1-based inclusive in the SQL tables. Window counts are
+    computed on 0-based half-open coordinates by multi_scale_window_counts(),
+    which reads each sequence once for all window sizes, and start/end are
+    converted when rows are written.
+
+    With workers > 1, genomes are dispatched to a process pool. PK ranges are
+    assigned up front in genome_pk order, so chunks and returned rows are
+    identical to a serial run.
+
+    Every chunk set is recorded in window_chunk_manifest.tsv with a content
+    fingerprint (see window_chunk_fingerprint()) and its PK layout. With
+    incremental=True, a window set whose fingerprint matches the previous
+    manifest is not recomputed: it is kept as-is when its PKs are unchanged,
+    or rewritten with shifted PKs when earlier genomes changed the layout.
+    Chunks from the previous manifest that are no longer produced are removed.
+
+    With chunk_format="parquet", the same chunks are written as typed, zstd
+    compressed Parquet files (*.parquet) with the same partitioning, and each
+    table directory gets _metadata/_common_metadata files so the directory
+    can be opened as one dataset with row-group filter pushdown.
     """
+    if chunk_format not in CHUNK_FORMAT_SUFFIXES:
+        raise ValueError(f"Unknown chunk format {chunk_format!r}; expected one of {sorted(CHUNK_FORMAT_SUFFIXES)}.")
+    if chunk_format == "parquet":
+        require_pyarrow()
     window_sizes = parse_positive_int_list(window_sizes_bp)
     if step_sizes_bp is None:
         step_sizes = list(window_sizes)
@@ -1241,16 +2388,26 @@ def build_window_tables(
     # to here
     genome_pk_to_accession = {int(row["genome_pk"]): str(row["accession_id"]) for row in genomes_rows}
     genome_pk_to_species_pk = {int(row["genome_pk"]): row.get("species_pk", r"\N") for row in genomes_rows}
+    genome_pk_to_first_sequence_pk: Dict[int, int] = {}
     sequence_by_genome: Dict[int, List[Dict[str, object]]] = {}
     for row in sequences_rows:
+        genome_pk_to_first_sequence_pk.setdefault(int(row["genome_pk"]), int(row["sequence_pk"]))
         seq_type = str(row.get("sequence_type", "")).lower()
         if allowed_types and seq_type not in allowed_types:
             continue
         sequence_by_genome.setdefault(int(row["genome_pk"]), []).append(row)
 
+    previous_manifest = read_previous_window_chunk_manifest(output_dir) if incremental else {}
+
+    # Pre-allocate deterministic PK ranges per genome. Window counts depend
+    # only on sequence lengths, so every genome knows its starting PKs before
+    # any FASTA is opened and parallel output matches a serial run.
     window_set_rows: List[Dict[str, object]] = []
-    chunk_manifest_rows: List[Dict[str, object]] = []
-    sequence_gc_by_pk: Dict[int, object] = {}
+    genome_jobs: List[Dict[str, object]] = []
+    reused_chunk_rows: Dict[int, List[Dict[str, object]]] = {}
+    renumber_tasks: List[Tuple[Path, Path, str, Dict[str, str], Dict[str, object]]] = []
+    gc_from_chunks: List[int] = []
+    window_set_chunk_paths: Dict[int, Dict[str, str]] = {}
 
     window_set_pk = start_window_set_pk
     window_pk = start_window_pk
@@ -1259,15 +2416,43 @@ def build_window_tables(
 
     for genome_pk in sorted(genome_pk_to_accession):
         accession = genome_pk_to_accession[genome_pk]
+        species_pk = genome_pk_to_species_pk.get(genome_pk, r"\N")
+        first_sequence_pk = genome_pk_to_first_sequence_pk.get(genome_pk, r"\N")
         fasta_path = find_fasta(accession, fasta_path_lookup)
-        print(f"[INFO] Building window chunks for {accession}: {fasta_path}", file=sys.stderr)
-        genome = load_genome(fasta_path)
-        selected_sequences = sequence_by_genome.get(genome_pk, [])
+        selected_sequences = [
+            {
+                "sequence_pk": int(row["sequence_pk"]),
+                "sequence_id": str(row["sequence_id"]),
+                "sequence_length": int(row["sequence_length"]),
+            }
+            for row in sequence_by_genome.get(genome_pk, [])
+        ]
+        sequence_digest = sequence_list_digest(selected_sequences)
 
+        specs_to_build: List[Dict[str, object]] = []
         for size_bp, step_bp in zip(window_sizes, step_sizes):
-            current_window_set_pk = window_set_pk
+            spec: Dict[str, object] = {
+                "size_bp": size_bp,
+                "step_bp": step_bp,
+                "window_set_pk": window_set_pk,
+                "window_pk_start": window_pk,
+                "sequence_summary_pk_start": sequence_summary_pk,
+                "genome_summary_pk": genome_summary_pk,
+                "fingerprint": window_chunk_fingerprint(
+                    fasta_path,
+                    sequence_digest,
+                    size_bp,
+                    step_bp,
+                    start_offset_bp,
+                    min_callable_frac,
+                    tiling_type,
+                    mask_mode,
+                    seq_scope,
+                    chunk_format,
+                ),
+            }
             window_set_rows.append({
-                "window_set_pk": current_window_set_pk,
+                "window_set_pk": window_set_pk,
                 "run_pk": run_pk,
                 "genome_pk": genome_pk,
                 "tiling_type": tiling_type,
@@ -1277,174 +2462,128 @@ def build_window_tables(
                 "seq_scope": seq_scope,
                 "notes": f"Window chunks written by accession/window size for sequence_type in {sorted(allowed_types)}; created for GC variance decay analyses.",
             })
-            window_set_pk += 1
 
-            genomic_window_rows: List[Dict[str, object]] = []
-            gc_window_rows: List[Dict[str, object]] = []
-            sequence_summary_rows: List[Dict[str, object]] = []
-            genome_summary_rows: List[Dict[str, object]] = []
-
-            genome_gc_values: List[float] = []
-            genome_callable_fracs: List[float] = []
-            genome_callable_bps: List[int] = []
-            genome_gap_bps: List[int] = []
-            genome_total_windows = 0
-            genome_kept_windows = 0
-            genome_sequence_bp_used = 0
-            largest_sequence_bp = 0
-            seq_count_used = 0
-
-            for seq_row in selected_sequences:
-                sequence_pk = int(seq_row["sequence_pk"])
-                sequence_id = str(seq_row["sequence_id"])
-                seq_len = int(seq_row["sequence_length"])
-                if sequence_id not in genome:
-                    print(f"[WARN] Sequence {sequence_id} not found in FASTA for {accession}; skipping.", file=sys.stderr)
-                    continue
-                seq_count_used += 1
-                genome_sequence_bp_used += seq_len
-                largest_sequence_bp = max(largest_sequence_bp, seq_len)
-
-                seq_gc_values: List[float] = []
-                seq_callable_fracs: List[float] = []
-                seq_callable_bps: List[int] = []
-                seq_gap_bps: List[int] = []
-                # v13: whole-sequence GC, calculated from all windows for this sequence.
-                # This intentionally includes terminal short windows and N-rich windows.
-                # GC is calculated among callable A/C/G/T bases, so N/gap/other bases
-                # do not enter the denominator.
-                seq_all_callable_bp = 0
-                seq_all_gc_bp = 0
-                seq_total_windows = 0
-                seq_kept_windows = 0
-                seq_excluded_missing = 0
-                seq_excluded_short = 0
-
-                window_rank = 0
-                start0 = max(0, int(start_offset_bp))
-                for window_start_0 in range(start0, seq_len, step_bp):
-                    window_end_0 = min(window_start_0 + size_bp, seq_len)
-                    if window_end_0 <= window_start_0:
-                        continue
-                    width_actual = window_end_0 - window_start_0
-                    window_rank += 1
-                    seq_total_windows += 1
-                    genome_total_windows += 1
-                    start_1_based = window_start_0 + 1
-                    end_1_based = window_end_0
-
-                    seq_fragment = get_sequence(genome, sequence_id, start_1_based, end_1_based)
-                    counts = base_counts(str(seq_fragment))
-                    callable_frac = counts["callable_frac"] if counts["callable_frac"] != r"\N" else 0.0
-                    gc_prop = counts["gc_prop"] if counts["gc_prop"] != r"\N" else None
-                    seq_all_callable_bp += int(counts["callable_bp"])
-                    seq_all_gc_bp += int(counts["gc_bp"])
-                    keep_flag = 1 if (width_actual == size_bp and callable_frac >= min_callable_frac and gc_prop is not None) else 0
-                    if keep_flag:
-                        seq_kept_windows += 1
-                        genome_kept_windows += 1
-                        seq_gc_values.append(float(gc_prop))
-                        seq_callable_fracs.append(float(callable_frac))
-                        seq_callable_bps.append(int(counts["callable_bp"]))
-                        seq_gap_bps.append(int(counts["gap_bp"]))
-                        genome_gc_values.append(float(gc_prop))
-                        genome_callable_fracs.append(float(callable_frac))
-                        genome_callable_bps.append(int(counts["callable_bp"]))
-                        genome_gap_bps.append(int(counts["gap_bp"]))
-                    else:
-                        if width_actual < size_bp:
-                            seq_excluded_short += 1
-                        else:
-                            seq_excluded_missing += 1
-
-                    start_bp = window_start_0 + 1
-                    end_bp = window_end_0
-                    genomic_window_rows.append({
-                        "window_pk": window_pk,
-                        "window_set_pk": current_window_set_pk,
-                        "sequence_pk": sequence_pk,
-                        "window_rank": window_rank,
-                        "start_bp": start_bp,
-                        "end_bp": end_bp,
-                        "mid_bp": (start_bp + end_bp) // 2,
-                        "standard_width_bp": size_bp,
-                        "width_actual_bp": width_actual,
-                        "callable_frac": callable_frac,
-                        "keep_flag": keep_flag,
+            previous = previous_manifest.get((accession, size_bp, step_bp), {})
+            reusable = (
+                set(previous) == set(WINDOW_TABLES)
+                and all(row["fingerprint"] == spec["fingerprint"] for row in previous.values())
+                and all((output_dir / row["chunk_path"]).exists() for row in previous.values())
+            )
+            if reusable:
+                layout = window_chunk_layout(spec, run_pk, genome_pk, species_pk, first_sequence_pk)
+                chunk_rows: List[Dict[str, object]] = []
+                for table in WINDOW_TABLES:
+                    previous_row = previous[table]
+                    rel_path = str(
+                        (output_dir / table / chunk_filename(
+                            table, run_pk, genome_pk, accession, size_bp, step_bp, chunk_format
+                        ))
+                        .relative_to(output_dir)
+                    )
+                    same_layout = rel_path == previous_row["chunk_path"] and all(
+                        sql_pk(previous_row.get(column)) == sql_pk(layout[column])
+                        for column in WINDOW_CHUNK_LAYOUT_COLUMNS
+                    )
+                    if not same_layout:
+                        renumber_tasks.append((
+                            output_dir / previous_row["chunk_path"],
+                            output_dir / rel_path,
+                            table,
+                            previous_row,
+                            layout,
+                        ))
+                    chunk_rows.append({
+                        "table_name": table,
+                        "chunk_path": rel_path,
+                        "accession_id": accession,
+                        "standard_window_size_bp": size_bp,
+                        "step_size_bp": step_bp,
+                        "n_rows": previous_row["n_rows"],
+                        "fingerprint": spec["fingerprint"],
+                        **layout,
                     })
-                    counts["window_pk"] = window_pk
-                    gc_window_rows.append(counts)
-                    window_pk += 1
+                reused_chunk_rows[window_set_pk] = chunk_rows
+                window_set_chunk_paths[window_set_pk] = {row["table_name"]: row["chunk_path"] for row in chunk_rows}
+            else:
+                specs_to_build.append(spec)
+
+            window_set_pk += 1
+            window_pk += sum(count_windows(row["sequence_length"], step_bp, start_offset_bp) for row in selected_sequences)
+            sequence_summary_pk += len(selected_sequences)
+            genome_summary_pk += 1
 
-                sequence_gc_by_pk[sequence_pk] = (seq_all_gc_bp / seq_all_callable_bp) if seq_all_callable_bp > 0 else r"\N"
+        # sequences.gc comes from the last window set. If that set is reused,
+        # recover the values from its chunks instead of recomputing the genome.
+        last_window_set_pk = window_set_pk - 1
+        if last_window_set_pk in reused_chunk_rows:
+            gc_from_chunks.append(last_window_set_pk)
 
-                seq_summary = summarize_gc_values(seq_gc_values, seq_callable_fracs, seq_callable_bps, seq_gap_bps)
-                sequence_summary_rows.append({
-                    "sequence_summary_pk": sequence_summary_pk,
-                    "run_pk": run_pk,
-                    "sequence_pk": sequence_pk,
-                    "genome_pk": genome_pk,
-                    "standard_window_size_bp": size_bp,
-                    "step_size_bp": step_bp,
-                    "tiling_type": tiling_type,
-                    "mask_mode": mask_mode,
-                    "n_windows_total": seq_total_windows,
-                    "n_windows_kept": seq_kept_windows,
-                    "n_windows_excluded_missing": seq_excluded_missing,
-                    "n_windows_excluded_short": seq_excluded_short,
-                    **seq_summary,
-                })
-                sequence_summary_pk += 1
-
-            genome_summary = summarize_gc_values(genome_gc_values, genome_callable_fracs, genome_callable_bps, genome_gap_bps)
-            genome_summary.pop("median_callable_fraction", None)
-            genome_summary_rows.append({
-                "genome_summary_pk": genome_summary_pk,
-                "run_pk": run_pk,
+        if specs_to_build:
+            genome_jobs.append({
                 "genome_pk": genome_pk,
-                "species_pk": genome_pk_to_species_pk.get(genome_pk, r"\N"),
-                "standard_window_size_bp": size_bp,
-                "step_size_bp": step_bp,
+                "accession": accession,
+                "species_pk": species_pk,
+                "fasta_path": fasta_path,
+                "first_sequence_pk": first_sequence_pk,
+                "selected_sequences": selected_sequences,
+                "window_specs": specs_to_build,
+                "run_pk": run_pk,
+                "min_callable_frac": min_callable_frac,
                 "tiling_type": tiling_type,
+                "start_offset_bp": start_offset_bp,
                 "mask_mode": mask_mode,
-                "n_windows_total": genome_total_windows,
-                "n_windows_kept": genome_kept_windows,
-                **genome_summary,
-                "seq_count_used": seq_count_used,
-                "largest_seq_fraction": (largest_sequence_bp / genome_sequence_bp_used) if genome_sequence_bp_used > 0 else r"\N",
+                "output_dir": output_dir,
+                "chunk_format": chunk_format,
+                "build_genome_store": build_genome_store,
             })
-            genome_summary_pk += 1
+        else:
+            print(f"[INFO] Reusing window chunks for {accession}; fingerprints unchanged.", file=sys.stderr)
+
+    # Move chunks that only need renumbering out of the way first, so freshly
+    # built chunks can take over their old filenames without clobbering them.
+    staged_renumber_tasks = []
+    for src, dst, table, previous_row, layout in renumber_tasks:
+        staged = src.with_name(src.name + ".renumber")
+        src.replace(staged)
+        staged_renumber_tasks.append((staged, dst, table, previous_row, layout))
+
+    if workers > 1 and len(genome_jobs) > 1:
+        print(f"[INFO] Building window chunks with {workers} worker processes.", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(build_genome_window_chunks, **job) for job in genome_jobs]
+            genome_results = [future.result() for future in futures]
+    else:
+        genome_results = [build_genome_window_chunks(**job) for job in genome_jobs]
 
-            for table, columns, rows_for_table in [
-                ("genomic_windows", GENOMIC_WINDOWS_COLUMNS, genomic_window_rows),
-                ("gc_window_stats", GC_WINDOW_STATS_COLUMNS, gc_window_rows),
-                ("sequence_summary", SEQUENCE_SUMMARY_COLUMNS, sequence_summary_rows),
-                ("genome_summary", GENOME_SUMMARY_COLUMNS, genome_summary_rows),
-            ]:
-                rel_path, n_rows = write_window_chunk(
-                    output_dir=output_dir,
-                    table=table,
-                    columns=columns,
-                    rows=rows_for_table,
-                    run_pk=run_pk,
-                    genome_pk=genome_pk,
-                    accession=accession,
-                    window_size_bp=size_bp,
-                    step_size_bp=step_bp,
-                )
-                chunk_manifest_rows.append({
-                    "table_name": table,
-                    "chunk_path": rel_path,
-                    "run_pk": run_pk,
-                    "genome_pk": genome_pk,
-                    "accession_id": accession,
-                    "window_set_pk": current_window_set_pk,
-                    "standard_window_size_bp": size_bp,
-                    "step_size_bp": step_bp,
-                    "n_rows": n_rows,
-                })
-                print(f"[INFO] Wrote {rel_path} ({n_rows} rows)", file=sys.stderr)
-        genome.close()
+    for staged, dst, table, previous_row, layout in staged_renumber_tasks:
+        n_rows = renumber_window_chunk(staged, dst, table, previous_row, layout)
+        staged.unlink()
+        print(f"[INFO] Renumbered {dst.relative_to(output_dir)} ({n_rows} rows)", file=sys.stderr)
+
+    chunk_rows_by_window_set: Dict[int, List[Dict[str, object]]] = dict(reused_chunk_rows)
+    sequence_gc_by_pk: Dict[int, object] = {}
+    for genome_chunk_manifest_rows, genome_sequence_gc_by_pk in genome_results:
+        for row in genome_chunk_manifest_rows:
+            chunk_rows_by_window_set.setdefault(int(row["window_set_pk"]), []).append(row)
+        sequence_gc_by_pk.update(genome_sequence_gc_by_pk)
+    for reused_window_set_pk in gc_from_chunks:
+        sequence_gc_by_pk.update(sequence_gc_from_window_chunks(output_dir, window_set_chunk_paths[reused_window_set_pk]))
+
+    chunk_manifest_rows: List[Dict[str, object]] = []
+    for row in window_set_rows:
+        chunk_manifest_rows.extend(chunk_rows_by_window_set.get(int(row["window_set_pk"]), []))
+
+    if incremental:
+        current_paths = {str(row["chunk_path"]) for row in chunk_manifest_rows}
+        for tables in previous_manifest.values():
+            for row in tables.values():
+                stale = output_dir / row["chunk_path"]
+                if row["chunk_path"] not in current_paths and stale.exists():
+                    stale.unlink()
+                    print(f"[INFO] Removed stale chunk {row['chunk_path']}", file=sys.stderr)
+
+    if chunk_format == "parquet":
+        write_parquet_dataset_metadata(output_dir, chunk_manifest_rows)
 
     return window_set_rows, chunk_manifest_rows, sequence_gc_by_pk
 
@@ -1591,6 +2730,53 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--mask-mode", default="raw_fasta_N_excluded", help="analysis_run/window summary mask_mode. Default: raw_fasta_N_excluded")
     parser.add_argument("--tiling-type", default="non_overlapping", help="window_set tiling_type. Default: non_overlapping")
     parser.add_argument("--start-offset-bp", type=int, default=0, help="0-based offset for first window start. Default: 0")
+    parser.add_argument(
+        "--header-cache-dir",
+        default="genomes/records/fasta_header_cache",
+        help=(
+            "Directory for cached per-accession FASTA header scans (sequence IDs, lengths, deflines, "
+            "inferred types). Relative names are placed under genomes/records/. Pass an empty string "
+            "to disable. Default: genomes/records/fasta_header_cache"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes for FASTA scanning and window building. Each accession "
+            "is one unit of work; PKs are pre-allocated so output matches a serial run. Default: 1"
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Reuse window chunks listed in the existing window_chunk_manifest.tsv when their content "
+            "fingerprint (FASTA/.fai size and mtime, window size/step/offset, mask mode, sequence scope) "
+            "is unchanged. Only PKs are rewritten when the layout shifted."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        dest="chunk_format",
+        choices=sorted(CHUNK_FORMAT_SUFFIXES),
+        default="tsv",
+        help=(
+            "File format for window chunks. tsv writes *.tsv.gz for 01_load_starter_sql_tsvs; parquet writes "
+            "typed, zstd-compressed *.parquet chunks plus per-table _metadata for Arrow/dplyr/pandas. "
+            "Requires pyarrow. Default: tsv"
+        ),
+    )
+    parser.add_argument(
+        "--genome-store",
+        action="store_true",
+        help=(
+            "Build a memory-mapped genome store (genomes/<accession>/genome_store, see genome_store.py) "
+            "for each genome that lacks one and read windows from it. Existing current stores are always "
+            "used; later compleasm/intron scripts reuse them too."
+        ),
+    )
     parser.add_argument("--load-sql", action="store_true", help="Load generated TSVs into MySQL after writing them.")
     parser.add_argument("--mysql-db", default="gc3_dynamics", help="MySQL database name for --load-sql.")
     parser.add_argument("--mysql-user", default="root", help="MySQL user for --load-sql.")
@@ -1601,11 +2787,18 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
+    if args.workers < 1:
+        raise ValueError("--workers must be at least 1.")
+    if args.chunk_format == "parquet":
+        require_pyarrow()
+        if args.load_sql:
+            raise ValueError("--load-sql loads TSV output; rerun with --format tsv to load window chunks into MySQL.")
     genomes_dir = Path(args.genomes_dir).resolve()
     manifest_path = Path(args.manifest)
     natural_history_path = Path(args.natural_history)
     species_name_audit_path = Path(args.species_name_audit)
     output_dir = Path(args.output_dir)
+    header_cache_dir = Path(args.header_cache_dir) if args.header_cache_dir else None
     genomes_metadata_path = Path(args.genomes_metadata) if args.genomes_metadata else None
 
     # Resolve relative paths against genomes_dir, not the shell working directory.
@@ -1618,6 +2811,9 @@ def main() -> None:
     if not species_name_audit_path.is_absolute():
         species_name_audit_path = genomes_dir / "records/sql_tsvs" / species_name_audit_path.name
 
+    if header_cache_dir is not None and not header_cache_dir.is_absolute():
+        header_cache_dir = genomes_dir / "records" / header_cache_dir.name
+
     if not output_dir.is_absolute():
         output_dir = genomes_dir / "records/sql_tsvs"
 
@@ -1669,6 +2865,8 @@ def main() -> None:
         fasta_path_lookup=accession_to_fasta_path,
         start_pk=args.sequence_pk_start,
         max_sequences_per_genome=args.max_sequences_per_genome,
+        workers=args.workers,
+        header_cache_dir=header_cache_dir,
     )
     sequence_type_audit_rows = build_sequence_type_audit_rows(
         sequences_rows,
@@ -1711,6 +2909,10 @@ def main() -> None:
             start_offset_bp=args.start_offset_bp,
             mask_mode=args.mask_mode,
             output_dir=output_dir,
+            workers=args.workers,
+            incremental=args.incremental,
+            chunk_format=args.chunk_format,
+            build_genome_store=args.genome_store,
         )
         for seq_row in sequences_rows:
             sequence_pk = int(seq_row["sequence_pk"])
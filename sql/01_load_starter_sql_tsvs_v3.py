@@ -26,6 +26,30 @@ Reload from scratch:
     --mysql-db gc3_dynamics \
     --mysql-user root \
     --truncate
+
+Parallel reload of chunked tables (each table is committed once all of its
+chunks have loaded; orphans are re-checked after the load):
+  python 01_load_starter_sql_tsvs.py \
+    --tsv-dir /Users/rossoaa/projects/genomes/records/sql_tsvs \
+    --mysql-db gc3_dynamics \
+    --mysql-user root \
+    --truncate --load-workers 4 --relax-load-checks
+
+Reload the window tables while queries keep using the current ones (loads into
+staging tables, builds their indexes once, then swaps them in with RENAME TABLE):
+  python 01_load_starter_sql_tsvs.py \
+    --tsv-dir /Users/rossoaa/projects/genomes/records/sql_tsvs \
+    --mysql-db gc3_dynamics \
+    --mysql-user root \
+    --truncate --staged-window-load
+
+Append new genomes without reloading unchanged ones (compares
+window_chunk_manifest.tsv with the window_chunk_load_ledger table):
+  python 01_load_starter_sql_tsvs.py \
+    --tsv-dir /Users/rossoaa/projects/genomes/records/sql_tsvs \
+    --mysql-db gc3_dynamics \
+    --mysql-user root \
+    --incremental
 """
 
 from __future__ import annotations
@@ -34,11 +58,20 @@ import argparse
 import csv
 import getpass
 import gzip
+import hashlib
+import json
+import os
+import queue
 import shutil
 import sys
 import tempfile
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 try:
     import pymysql
@@ -134,6 +167,88 @@ OPTIONAL_FILES = ["analysis_run"]
 # they must not be read together with chunks because that produces duplicate PKs.
 CHUNKABLE_TABLES = {"genomic_windows", "gc_window_stats", "sequence_summary", "genome_summary"}
 
+# Primary key of each table; every PK/FK is an integer surrogate key.
+PK_COLUMNS: Dict[str, str] = {
+    "natural_history": "species_pk",
+    "species_name_audit": "species_name_audit_pk",
+    "genomes": "genome_pk",
+    "sequences": "sequence_pk",
+    "analysis_run": "run_pk",
+    "window_set": "window_set_pk",
+    "genomic_windows": "window_pk",
+    "gc_window_stats": "window_pk",
+    "sequence_summary": "sequence_summary_pk",
+    "genome_summary": "genome_summary_pk",
+}
+
+# Orphan checks run by validate_relationships, in report order:
+#   (child table, child column, parent table, NULL allowed, skip when parent has no keys)
+FK_RULES: List[Tuple[str, str, str, bool, bool]] = [
+    ("genomes", "species_pk", "natural_history", True, True),
+    ("species_name_audit", "species_pk", "natural_history", True, True),
+    ("sequences", "genome_pk", "genomes", False, False),
+    ("window_set", "genome_pk", "genomes", False, False),
+    ("window_set", "run_pk", "analysis_run", False, True),
+    ("genomic_windows", "window_set_pk", "window_set", False, False),
+    ("genomic_windows", "sequence_pk", "sequences", False, False),
+    ("gc_window_stats", "window_pk", "genomic_windows", False, False),
+    ("sequence_summary", "sequence_pk", "sequences", False, False),
+    ("sequence_summary", "genome_pk", "genomes", False, False),
+    ("sequence_summary", "run_pk", "analysis_run", False, True),
+    ("genome_summary", "genome_pk", "genomes", False, False),
+    ("genome_summary", "species_pk", "natural_history", True, True),
+    ("genome_summary", "run_pk", "analysis_run", False, True),
+]
+
+# --staged-window-load loads these into <table>__staging without secondary
+# indexes, builds the indexes once, and swaps them in with one RENAME TABLE.
+STAGED_TABLES = ["genomic_windows", "gc_window_stats"]
+
+# --incremental: the builder's chunk manifest, and the table recording which
+# version of each (table, accession, window size, step) chunk is loaded.
+WINDOW_CHUNK_MANIFEST = "window_chunk_manifest.tsv"
+LOAD_LEDGER_TABLE = "window_chunk_load_ledger"
+LOAD_LEDGER_DDL = f"""
+CREATE TABLE IF NOT EXISTS `{LOAD_LEDGER_TABLE}` (
+  `table_name` VARCHAR(64) NOT NULL,
+  `accession_id` VARCHAR(64) NOT NULL,
+  `standard_window_size_bp` BIGINT NOT NULL,
+  `step_size_bp` BIGINT NOT NULL,
+  `run_pk` BIGINT NOT NULL,
+  `genome_pk` BIGINT NOT NULL,
+  `window_set_pk` BIGINT NOT NULL,
+  `chunk_path` VARCHAR(512) NOT NULL,
+  `n_rows` BIGINT NOT NULL,
+  `signature` CHAR(64) NOT NULL,
+  `loaded_at` DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`table_name`, `accession_id`, `standard_window_size_bp`, `step_size_bp`)
+)
+"""
+LEDGER_KEY_COLUMNS = ["table_name", "accession_id", "standard_window_size_bp", "step_size_bp"]
+LEDGER_COLUMNS = LEDGER_KEY_COLUMNS + ["run_pk", "genome_pk", "window_set_pk", "chunk_path", "n_rows", "signature"]
+
+# Manifest columns that change a chunk's rows: its content fingerprint plus the
+# PK layout, since --incremental builds renumber unchanged chunks in place.
+CHUNK_SIGNATURE_COLUMNS = [
+    "chunk_path", "n_rows", "fingerprint", "run_pk", "genome_pk", "window_set_pk",
+    "first_sequence_pk", "window_pk_start", "sequence_summary_pk_start", "genome_summary_pk", "species_pk",
+]
+
+# Deletes the rows of one previously loaded chunk, using its ledger row as params.
+# Run in TRUNCATE_ORDER so gc_window_stats goes before its genomic_windows rows.
+CHUNK_DELETE_SQL = {
+    "gc_window_stats": "DELETE gcs FROM gc_window_stats gcs JOIN genomic_windows gw ON gw.window_pk = gcs.window_pk WHERE gw.window_set_pk = %(window_set_pk)s",
+    "genomic_windows": "DELETE FROM genomic_windows WHERE window_set_pk = %(window_set_pk)s",
+    "sequence_summary": "DELETE FROM sequence_summary WHERE run_pk = %(run_pk)s AND genome_pk = %(genome_pk)s AND standard_window_size_bp = %(standard_window_size_bp)s AND step_size_bp = %(step_size_bp)s",
+    "genome_summary": "DELETE FROM genome_summary WHERE run_pk = %(run_pk)s AND genome_pk = %(genome_pk)s AND standard_window_size_bp = %(standard_window_size_bp)s AND step_size_bp = %(step_size_bp)s",
+}
+
+# Rows parsed per batch while streaming key columns for validation.
+VALIDATION_BATCH_ROWS = 250_000
+
+# Copy buffer for decompressing .tsv.gz chunks into the LOCAL INFILE stream.
+GZIP_STREAM_CHUNK_BYTES = 1024 * 1024
+
 NULL_VALUES = {"", r"\N", "NULL", "null", "None", "none", "NaN", "nan", "NA", "na"}
 
 
@@ -211,6 +326,29 @@ def iter_tsv_rows(path: Path):
             yield dict(row)
 
 
+def iter_tsv_columns(path: Path, columns: Sequence[str]):
+    """Yield tuples holding only ``columns`` from each row of a TSV.
+
+    Key-only variant of iter_tsv_rows for validation: no per-row dict, and short
+    rows yield "" for the missing columns like DictReader's None.
+    """
+    if not path.exists():
+        raise FileNotFoundError(path)
+    with open_text(path) as handle:
+        reader = csv.reader(handle, delimiter="\t")
+        header = next(reader, None)
+        if not header:
+            raise ValueError(f"No header found in {path}")
+        missing = [col for col in columns if col not in header]
+        if missing:
+            raise ValueError(f"{path} has no column(s): {', '.join(missing)}")
+        indexes = [header.index(col) for col in columns]
+        for row in reader:
+            if not row:
+                continue
+            yield tuple(row[i] if i < len(row) else "" for i in indexes)
+
+
 def existing_tables(tsv_dir: Path, include_audit: bool = False) -> List[str]:
     tables = []
     for table in LOAD_ORDER:
@@ -251,130 +389,153 @@ def validate_headers(tsv_dir: Path, tables: Sequence[str]) -> None:
         raise ValueError("\n".join(errors))
 
 
-def read_table_files(tsv_dir: Path, table: str) -> List[Dict[str, str]]:
-    rows: List[Dict[str, str]] = []
-    for path in table_input_files(tsv_dir, table):
-        rows.extend(read_tsv(path))
-    return rows
+class MissingRefs:
+    """Orphan counter for one child column, fed batch by batch.
+
+    Keeps the total count plus the first few distinct values in first-seen order,
+    which is all the report needs.
+    """
 
-def ids(rows: Iterable[Dict[str, str]], column: str) -> Set[str]:
-    return {clean(row.get(column)) for row in rows if not is_null(row.get(column))}
-
-
-def find_missing_refs(
-    child_rows: Sequence[Dict[str, str]],
-    child_table: str,
-    child_col: str,
-    parent_ids: Set[str],
-    parent_table: str,
-    allow_null: bool = False,
-    max_examples: int = 10,
-) -> List[str]:
-    missing: List[str] = []
-    for row in child_rows:
-        val = clean(row.get(child_col))
-        if is_null(val):
-            if not allow_null:
-                missing.append(r"\N")
+    def __init__(self, child_table: str, child_col: str, parent_table: str, max_examples: int = 10):
+        self.child_table = child_table
+        self.child_col = child_col
+        self.parent_table = parent_table
+        self.max_examples = max_examples
+        self.count = 0
+        self.examples: List[str] = []
+        self.more = False
+
+    def add(self, values: Iterable[str]) -> None:
+        for val in values:
+            self.count += 1
+            if val in self.examples:
+                continue
+            if len(self.examples) < self.max_examples:
+                self.examples.append(val)
+            else:
+                self.more = True
+
+    def messages(self) -> List[str]:
+        if not self.count:
+            return []
+        suffix = " ..." if self.more else ""
+        return [
+            f"{self.child_table}.{self.child_col} has {self.count} row(s) not found in {self.parent_table}; "
+            f"examples: {', '.join(self.examples)}{suffix}"
+        ]
+
+
+def iter_key_batches(path: Path, columns: Sequence[str]):
+    """Yield lists of up to VALIDATION_BATCH_ROWS key-column tuples from one file."""
+    batch: List[Tuple[str, ...]] = []
+    for row in iter_tsv_columns(path, columns):
+        batch.append(row)
+        if len(batch) >= VALIDATION_BATCH_ROWS:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_key_column(values: Sequence[str], label: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (int64 keys, null mask) for one batch of raw key values."""
+    keys = np.zeros(len(values), dtype=np.int64)
+    nulls = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        value = value.strip()
+        if value in NULL_VALUES:
+            nulls[i] = True
             continue
-        if val not in parent_ids:
-            missing.append(val)
-    if not missing:
-        return []
-    unique = []
-    seen = set()
-    for val in missing:
-        if val not in seen:
-            unique.append(val)
-            seen.add(val)
-    examples = ", ".join(unique[:max_examples])
-    suffix = " ..." if len(unique) > max_examples else ""
-    return [
-        f"{child_table}.{child_col} has {len(missing)} row(s) not found in {parent_table}; examples: {examples}{suffix}"
-    ]
+        try:
+            keys[i] = int(value)
+        except ValueError:
+            raise ValueError(f"{label} has a non-integer key value: {value!r}") from None
+    return keys, nulls
+
+
+def sorted_key_lookup(sorted_keys: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Boolean mask of ``values`` present in the sorted unique array ``sorted_keys``."""
+    if sorted_keys.size == 0:
+        return np.zeros(values.shape, dtype=bool)
+    positions = np.searchsorted(sorted_keys, values)
+    positions[positions == sorted_keys.size] = 0
+    return sorted_keys[positions] == values
 
 
 def validate_relationships(tsv_dir: Path, tables: Sequence[str]) -> Dict[str, int]:
-    rows: Dict[str, List[Dict[str, str]]] = {}
-    row_counts: Dict[str, int] = {}
+    """Check PK uniqueness and FK references across all TSV files/chunks.
 
-    for table in tables:
-        if table == "sequence_type_audit":
-            continue
-        files = table_input_files(tsv_dir, table)
-        if files:
-            table_rows = read_table_files(tsv_dir, table)
-            rows[table] = table_rows
-            row_counts[table] = len(table_rows)
+    Tables are streamed in dependency order reading only their key columns, so
+    every parent's keys are known before its children are checked. Each table's
+    PKs are kept as one sorted int64 array (8 bytes per key); child references
+    are checked per batch against it, so memory follows the number of keys
+    rather than rows x columns.
+    """
+    no_keys = np.empty(0, dtype=np.int64)
+    present = [table for table in LOAD_ORDER if table in tables and table_input_files(tsv_dir, table)]
+    row_counts: Dict[str, int] = {}
+    parent_keys: Dict[str, np.ndarray] = {}
+    duplicate_pks: Dict[str, bool] = {}
+    refs = {(child, col): MissingRefs(child, col, parent) for child, col, parent, _, _ in FK_RULES}
+    skipped_rules = set()
+    nonnull_run_refs = 0
+
+    for table in present:
+        pk_col = PK_COLUMNS[table]
+        rules = [rule for rule in FK_RULES if rule[0] == table]
+        active_rules = []
+        for rule in rules:
+            _, col, parent, _, skip_if_empty = rule
+            if skip_if_empty and parent_keys.get(parent, no_keys).size == 0:
+                skipped_rules.add((table, col))
+            else:
+                active_rules.append(rule)
+        columns = [pk_col] + [col for _, col, _, _, _ in rules if col != pk_col]
+
+        pk_values = array("q")
+        n_rows = 0
+        for path in table_input_files(tsv_dir, table):
+            for batch in iter_key_batches(path, columns):
+                n_rows += len(batch)
+                parsed = {
+                    col: parse_key_column([row[i] for row in batch], f"{path.name} {col}")
+                    for i, col in enumerate(columns)
+                }
+                keys, nulls = parsed[pk_col]
+                pk_values.frombytes(keys[~nulls].tobytes())
+                for _, col, parent, allow_null, _ in active_rules:
+                    keys, nulls = parsed[col]
+                    found = sorted_key_lookup(parent_keys.get(parent, no_keys), keys)
+                    orphan = ~nulls & ~found
+                    if not allow_null:
+                        orphan |= nulls
+                    refs[(table, col)].add(r"\N" if nulls[i] else str(keys[i]) for i in np.flatnonzero(orphan))
+                if table == "window_set" and (table, "run_pk") in skipped_rules:
+                    nonnull_run_refs += int((~parsed["run_pk"][1]).sum())
+
+        pks = np.sort(np.frombuffer(pk_values, dtype=np.int64)) if len(pk_values) else no_keys
+        duplicate_pks[table] = bool(pks.size > 1 and np.any(pks[1:] == pks[:-1]))
+        parent_keys[table] = np.unique(pks)
+        row_counts[table] = n_rows
 
     errors: List[str] = []
-
-    species_pks = ids(rows.get("natural_history", []), "species_pk")
-    genome_pks = ids(rows.get("genomes", []), "genome_pk")
-    sequence_pks = ids(rows.get("sequences", []), "sequence_pk")
-    run_pks = ids(rows.get("analysis_run", []), "run_pk")
-    window_set_pks = ids(rows.get("window_set", []), "window_set_pk")
-    window_pks = ids(rows.get("genomic_windows", []), "window_pk")
-
-    if "genomes" in rows and species_pks:
-        errors += find_missing_refs(rows["genomes"], "genomes", "species_pk", species_pks, "natural_history", allow_null=True)
-    if "species_name_audit" in rows and species_pks:
-        errors += find_missing_refs(rows["species_name_audit"], "species_name_audit", "species_pk", species_pks, "natural_history", allow_null=True)
-    if "sequences" in rows:
-        errors += find_missing_refs(rows["sequences"], "sequences", "genome_pk", genome_pks, "genomes")
-
-    if "window_set" in rows:
-        errors += find_missing_refs(rows["window_set"], "window_set", "genome_pk", genome_pks, "genomes")
-        if run_pks:
-            errors += find_missing_refs(rows["window_set"], "window_set", "run_pk", run_pks, "analysis_run")
-        else:
-            nonnull_run_refs = [r.get("run_pk") for r in rows["window_set"] if not is_null(r.get("run_pk"))]
-            if nonnull_run_refs:
+    for child, col, parent, _, _ in FK_RULES:
+        if child not in row_counts:
+            continue
+        if (child, col) in skipped_rules:
+            if (child, col) == ("window_set", "run_pk") and nonnull_run_refs:
                 errors.append("window_set.tsv contains run_pk values, but analysis_run.tsv was not found. Load/create analysis_run first.")
-
-    if "genomic_windows" in rows:
-        errors += find_missing_refs(rows["genomic_windows"], "genomic_windows", "window_set_pk", window_set_pks, "window_set")
-        errors += find_missing_refs(rows["genomic_windows"], "genomic_windows", "sequence_pk", sequence_pks, "sequences")
-
-    if "gc_window_stats" in rows:
-        errors += find_missing_refs(rows["gc_window_stats"], "gc_window_stats", "window_pk", window_pks, "genomic_windows")
-        stats_pks = ids(rows["gc_window_stats"], "window_pk")
-        missing_stats = window_pks - stats_pks
-        if missing_stats:
-            examples = ", ".join(sorted(missing_stats)[:10])
-            errors.append(f"{len(missing_stats)} genomic_windows row(s) have no gc_window_stats row; examples: {examples}")
-
-    if "sequence_summary" in rows:
-        errors += find_missing_refs(rows["sequence_summary"], "sequence_summary", "sequence_pk", sequence_pks, "sequences")
-        errors += find_missing_refs(rows["sequence_summary"], "sequence_summary", "genome_pk", genome_pks, "genomes")
-        if run_pks:
-            errors += find_missing_refs(rows["sequence_summary"], "sequence_summary", "run_pk", run_pks, "analysis_run")
-
-    if "genome_summary" in rows:
-        errors += find_missing_refs(rows["genome_summary"], "genome_summary", "genome_pk", genome_pks, "genomes")
-        if species_pks:
-            errors += find_missing_refs(rows["genome_summary"], "genome_summary", "species_pk", species_pks, "natural_history", allow_null=True)
-        if run_pks:
-            errors += find_missing_refs(rows["genome_summary"], "genome_summary", "run_pk", run_pks, "analysis_run")
+            continue
+        errors += refs[(child, col)].messages()
+        if (child, col) == ("gc_window_stats", "window_pk"):
+            missing_stats = np.setdiff1d(parent_keys.get("genomic_windows", no_keys), parent_keys[child])
+            if missing_stats.size:
+                examples = ", ".join(str(pk) for pk in missing_stats[:10])
+                errors.append(f"{missing_stats.size} genomic_windows row(s) have no gc_window_stats row; examples: {examples}")
 
     # Primary-key duplicate checks across all files/chunks for each table.
-    pk_cols = {
-        "natural_history": "species_pk",
-        "species_name_audit": "species_name_audit_pk",
-        "genomes": "genome_pk",
-        "sequences": "sequence_pk",
-        "analysis_run": "run_pk",
-        "window_set": "window_set_pk",
-        "genomic_windows": "window_pk",
-        "gc_window_stats": "window_pk",
-        "sequence_summary": "sequence_summary_pk",
-        "genome_summary": "genome_summary_pk",
-    }
-    for table, pk_col in pk_cols.items():
-        if table not in rows:
-            continue
-        vals = [clean(r.get(pk_col)) for r in rows[table] if not is_null(r.get(pk_col))]
-        if len(vals) != len(set(vals)):
+    for table, pk_col in PK_COLUMNS.items():
+        if duplicate_pks.get(table):
             errors.append(f"Duplicate primary-key values detected in {table}.{pk_col}")
 
     if errors:
@@ -388,12 +549,17 @@ def count_rows_in_file(path: Path) -> int:
     with open_text(path) as handle:
         return max(0, sum(1 for _ in handle) - 1)
 
+def resolve_password(args: argparse.Namespace) -> None:
+    """Prompt once so --load-workers connections do not each ask for the password."""
+    if args.mysql_password is None:
+        args.mysql_password = getpass.getpass(f"MySQL password for {args.mysql_user}@{args.mysql_host}: ")
+
+
 def connect(args: argparse.Namespace):
     if pymysql is None:
         raise ImportError("pymysql is required. Install with: pip install pymysql")
+    resolve_password(args)
     password = args.mysql_password
-    if password is None:
-        password = getpass.getpass(f"MySQL password for {args.mysql_user}@{args.mysql_host}: ")
     return pymysql.connect(
         host=args.mysql_host,
         port=args.mysql_port,
@@ -407,11 +573,11 @@ def connect(args: argparse.Namespace):
     )
 
 
-def load_plain_tsv(cursor, table: str, path: Path) -> int:
+def load_plain_tsv(cursor, table: str, path: Path, target: Optional[str] = None) -> int:
     columns = TABLE_COLUMNS[table]
     column_sql = ", ".join(f"`{col}`" for col in columns)
     sql = (
-        f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table}` "
+        f"LOAD DATA LOCAL INFILE %s INTO TABLE `{target or table}` "
         "FIELDS TERMINATED BY '\t' LINES TERMINATED BY '\n' "
         f"IGNORE 1 LINES ({column_sql});"
     )
@@ -419,56 +585,483 @@ def load_plain_tsv(cursor, table: str, path: Path) -> int:
     return cursor.rowcount
 
 
-def load_table_file(cursor, table: str, path: Path) -> int:
+class GzipInfileStream:
+    """Decompress one .tsv.gz chunk into a named pipe for LOAD DATA LOCAL INFILE.
+
+    The MySQL client opens the pipe path like a regular file and reads it packet
+    by packet, so the decompressed TSV never touches disk and memory stays at one
+    copy buffer plus the pipe buffer. A feeder thread writes into the pipe; any
+    decompression error is kept in ``error`` and must be raised by the caller
+    after the LOAD statement returns, because the server only sees a short file.
+    """
+
+    def __init__(self, source: Path):
+        self.source = source
+        self.fifo_dir = Path(tempfile.mkdtemp(prefix="gz_infile_"))
+        self.path = self.fifo_dir / source.name[: -len(".gz")]
+        os.mkfifo(self.path, 0o600)
+        self.error: Optional[BaseException] = None
+        self.abandoned = False
+        self.thread = threading.Thread(target=self._feed, name=f"gunzip-{source.name}", daemon=True)
+
+    def _feed(self) -> None:
+        try:
+            # Open the pipe first: the reader blocks until a writer exists, so a
+            # missing/corrupt source must still open it (and end it) to avoid a hang.
+            with open(self.path, "wb") as sink:
+                with gzip.open(self.source, "rb") as source:
+                    while not self.abandoned:
+                        chunk = source.read(GZIP_STREAM_CHUNK_BYTES)
+                        if not chunk:
+                            break
+                        sink.write(chunk)
+        except BaseException as exc:
+            self.error = exc
+
+    def __enter__(self) -> "GzipInfileStream":
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.thread.is_alive():
+            # The server failed before reading the pipe (or stopped early): hold a
+            # reader open and drain it so the feeder can leave open()/write().
+            self.abandoned = True
+            fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                while self.thread.is_alive():
+                    try:
+                        os.read(fd, 1 << 16)
+                    except BlockingIOError:
+                        pass
+                    self.thread.join(0.05)
+            finally:
+                os.close(fd)
+        self.thread.join()
+        shutil.rmtree(self.fifo_dir, ignore_errors=True)
+        return False
+
+
+def load_table_file(cursor, table: str, path: Path, target: Optional[str] = None) -> int:
     """Load one plain TSV or gzip-compressed TSV chunk into MySQL.
 
     MySQL LOAD DATA LOCAL INFILE cannot read gzip directly, so compressed
-    chunks are decompressed to a temporary TSV and loaded one chunk at a time.
+    chunks are streamed through a named pipe (GzipInfileStream) and no scratch
+    copy is written. Platforms without os.mkfifo fall back to decompressing
+    into a temporary TSV. ``target`` names a different table with the same
+    columns, e.g. a --staged-window-load staging table.
     """
-    if str(path).endswith(".gz"):
+    if not str(path).endswith(".gz"):
+        return load_plain_tsv(cursor, table, path, target)
+
+    if not hasattr(os, "mkfifo"):
         with tempfile.NamedTemporaryFile("wb", suffix=f".{table}.tsv", delete=False) as tmp:
             tmp_path = Path(tmp.name)
             with gzip.open(path, "rb") as source:
                 shutil.copyfileobj(source, tmp)
         try:
-            return load_plain_tsv(cursor, table, tmp_path)
+            return load_plain_tsv(cursor, table, tmp_path, target)
         finally:
             tmp_path.unlink(missing_ok=True)
-    return load_plain_tsv(cursor, table, path)
+
+    with GzipInfileStream(path) as stream:
+        loaded = load_plain_tsv(cursor, table, stream.path, target)
+    if stream.error is not None:
+        raise RuntimeError(f"Could not decompress {path} while loading {table}: {stream.error}") from stream.error
+    return loaded
+
+def relax_session_checks(cursor) -> None:
+    """Skip FK checks for this session's bulk load.
+
+    Only used with --relax-load-checks, which always runs database_fk_checks
+    afterwards. unique_checks stays on: validate_relationships only checks PK
+    uniqueness, and secondary UNIQUE keys would otherwise go unenforced.
+    """
+    cursor.execute("SET SESSION foreign_key_checks=0;")
+
+
+def load_table_parallel(
+    connections: Sequence,
+    table: str,
+    files: Sequence[Path],
+    tsv_dir: Path,
+    target: Optional[str] = None,
+) -> int:
+    """Load the chunks of one table concurrently, one chunk per idle worker connection.
+
+    Chunks of a table carry disjoint PK ranges, so they can be inserted side by
+    side. Nothing is committed here; the caller commits every worker connection
+    once the whole table has loaded, before any child table starts.
+    """
+    idle: "queue.Queue" = queue.Queue()
+    for conn in connections:
+        idle.put(conn)
+
+    def load_one(path: Path) -> int:
+        conn = idle.get()
+        try:
+            with conn.cursor() as cursor:
+                return load_table_file(cursor, table, path, target)
+        finally:
+            idle.put(conn)
+
+    table_total = 0
+    executor = ThreadPoolExecutor(max_workers=len(connections))
+    try:
+        for path, loaded in zip(files, executor.map(load_one, files)):
+            table_total += loaded
+            print(f"  loaded {path.relative_to(tsv_dir)} into {target or table}: {loaded} row(s)")
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+    return table_total
+
 
 def table_count(cursor, table: str) -> int:
     cursor.execute(f"SELECT COUNT(*) AS n FROM `{table}`;")
     return int(cursor.fetchone()["n"])
 
 
-def database_fk_checks(cursor) -> List[str]:
-    """Run lightweight orphan checks after load."""
+def database_fk_checks(cursor, table_names: Optional[Dict[str, str]] = None) -> List[str]:
+    """Run lightweight orphan checks after load.
+
+    ``table_names`` maps a table to the name to check instead, so the staging
+    tables of --staged-window-load can be checked before they are swapped in.
+    """
     checks = [
-        ("genomes.species_pk", "SELECT COUNT(*) AS n FROM genomes g LEFT JOIN natural_history nh ON g.species_pk = nh.species_pk WHERE g.species_pk IS NOT NULL AND nh.species_pk IS NULL"),
-        ("sequences.genome_pk", "SELECT COUNT(*) AS n FROM sequences s LEFT JOIN genomes g ON s.genome_pk = g.genome_pk WHERE g.genome_pk IS NULL"),
-        ("window_set.genome_pk", "SELECT COUNT(*) AS n FROM window_set ws LEFT JOIN genomes g ON ws.genome_pk = g.genome_pk WHERE g.genome_pk IS NULL"),
-        ("genomic_windows.window_set_pk", "SELECT COUNT(*) AS n FROM genomic_windows gw LEFT JOIN window_set ws ON gw.window_set_pk = ws.window_set_pk WHERE ws.window_set_pk IS NULL"),
-        ("genomic_windows.sequence_pk", "SELECT COUNT(*) AS n FROM genomic_windows gw LEFT JOIN sequences s ON gw.sequence_pk = s.sequence_pk WHERE s.sequence_pk IS NULL"),
-        ("gc_window_stats.window_pk", "SELECT COUNT(*) AS n FROM gc_window_stats gcs LEFT JOIN genomic_windows gw ON gcs.window_pk = gw.window_pk WHERE gw.window_pk IS NULL"),
-        ("sequence_summary.sequence_pk", "SELECT COUNT(*) AS n FROM sequence_summary ss LEFT JOIN sequences s ON ss.sequence_pk = s.sequence_pk WHERE s.sequence_pk IS NULL"),
-        ("sequence_summary.genome_pk", "SELECT COUNT(*) AS n FROM sequence_summary ss LEFT JOIN genomes g ON ss.genome_pk = g.genome_pk WHERE g.genome_pk IS NULL"),
-        ("genome_summary.genome_pk", "SELECT COUNT(*) AS n FROM genome_summary gs LEFT JOIN genomes g ON gs.genome_pk = g.genome_pk WHERE g.genome_pk IS NULL"),
-        ("genome_summary.species_pk", "SELECT COUNT(*) AS n FROM genome_summary gs LEFT JOIN natural_history nh ON gs.species_pk = nh.species_pk WHERE gs.species_pk IS NOT NULL AND nh.species_pk IS NULL"),
+        ("genomes.species_pk", "SELECT COUNT(*) AS n FROM {genomes} g LEFT JOIN {natural_history} nh ON g.species_pk = nh.species_pk WHERE g.species_pk IS NOT NULL AND nh.species_pk IS NULL"),
+        ("sequences.genome_pk", "SELECT COUNT(*) AS n FROM {sequences} s LEFT JOIN {genomes} g ON s.genome_pk = g.genome_pk WHERE g.genome_pk IS NULL"),
+        ("window_set.genome_pk", "SELECT COUNT(*) AS n FROM {window_set} ws LEFT JOIN {genomes} g ON ws.genome_pk = g.genome_pk WHERE g.genome_pk IS NULL"),
+        ("genomic_windows.window_set_pk", "SELECT COUNT(*) AS n FROM {genomic_windows} gw LEFT JOIN {window_set} ws ON gw.window_set_pk = ws.window_set_pk WHERE ws.window_set_pk IS NULL"),
+        ("genomic_windows.sequence_pk", "SELECT COUNT(*) AS n FROM {genomic_windows} gw LEFT JOIN {sequences} s ON gw.sequence_pk = s.sequence_pk WHERE s.sequence_pk IS NULL"),
+        ("gc_window_stats.window_pk", "SELECT COUNT(*) AS n FROM {gc_window_stats} gcs LEFT JOIN {genomic_windows} gw ON gcs.window_pk = gw.window_pk WHERE gw.window_pk IS NULL"),
+        ("sequence_summary.sequence_pk", "SELECT COUNT(*) AS n FROM {sequence_summary} ss LEFT JOIN {sequences} s ON ss.sequence_pk = s.sequence_pk WHERE s.sequence_pk IS NULL"),
+        ("sequence_summary.genome_pk", "SELECT COUNT(*) AS n FROM {sequence_summary} ss LEFT JOIN {genomes} g ON ss.genome_pk = g.genome_pk WHERE g.genome_pk IS NULL"),
+        ("genome_summary.genome_pk", "SELECT COUNT(*) AS n FROM {genome_summary} gs LEFT JOIN {genomes} g ON gs.genome_pk = g.genome_pk WHERE g.genome_pk IS NULL"),
+        ("genome_summary.species_pk", "SELECT COUNT(*) AS n FROM {genome_summary} gs LEFT JOIN {natural_history} nh ON gs.species_pk = nh.species_pk WHERE gs.species_pk IS NOT NULL AND nh.species_pk IS NULL"),
     ]
+    names = {table: f"`{(table_names or {}).get(table, table)}`" for table in LOAD_ORDER}
     problems = []
     for label, sql in checks:
-        cursor.execute(sql)
+        cursor.execute(sql.format(**names))
         n = int(cursor.fetchone()["n"])
         if n:
             problems.append(f"{label}: {n} orphan row(s)")
     return problems
 
 
-def truncate_tables(cursor, tables: Sequence[str]) -> None:
+def staging_table(table: str) -> str:
+    return f"{table}__staging"
+
+
+def old_table(table: str) -> str:
+    return f"{table}__old"
+
+
+def secondary_index_sql(cursor, table: str) -> Dict[str, str]:
+    """Return {index name: ADD INDEX clause} for every non-PRIMARY index of ``table``."""
+    cursor.execute(
+        "SELECT INDEX_NAME AS index_name, NON_UNIQUE AS non_unique, INDEX_TYPE AS index_type, "
+        "COLUMN_NAME AS column_name, SUB_PART AS sub_part "
+        "FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME <> 'PRIMARY' "
+        "ORDER BY INDEX_NAME, SEQ_IN_INDEX;",
+        (table,),
+    )
+    indexes: Dict[str, Dict[str, object]] = {}
+    for row in cursor.fetchall():
+        if row["column_name"] is None:
+            raise RuntimeError(f"{table}.{row['index_name']} is a functional index; --staged-window-load cannot rebuild it.")
+        index = indexes.setdefault(row["index_name"], {"non_unique": int(row["non_unique"]), "type": row["index_type"], "columns": []})
+        part = f"({row['sub_part']})" if row["sub_part"] else ""
+        index["columns"].append(f"`{row['column_name']}`{part}")
+    clauses = {}
+    for name, index in indexes.items():
+        kind = "UNIQUE " if not index["non_unique"] else ""
+        if index["type"] in ("FULLTEXT", "SPATIAL"):
+            kind = f"{index['type']} "
+        clauses[name] = f"ADD {kind}INDEX `{name}` ({', '.join(index['columns'])})"
+    return clauses
+
+
+def foreign_keys_touching(cursor, tables: Sequence[str]) -> List[Dict[str, object]]:
+    """Return FK constraints declared on, or referencing, any of ``tables``."""
+    placeholders = ", ".join(["%s"] * len(tables))
+    cursor.execute(
+        "SELECT kcu.CONSTRAINT_NAME AS name, kcu.TABLE_NAME AS table_name, kcu.COLUMN_NAME AS column_name, "
+        "kcu.REFERENCED_TABLE_NAME AS ref_table, kcu.REFERENCED_COLUMN_NAME AS ref_column, "
+        "rc.UPDATE_RULE AS update_rule, rc.DELETE_RULE AS delete_rule "
+        "FROM information_schema.KEY_COLUMN_USAGE kcu "
+        "JOIN information_schema.REFERENTIAL_CONSTRAINTS rc "
+        "  ON rc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA AND rc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME "
+        "  AND rc.TABLE_NAME = kcu.TABLE_NAME "
+        "WHERE kcu.TABLE_SCHEMA = DATABASE() AND kcu.REFERENCED_TABLE_NAME IS NOT NULL "
+        f"  AND (kcu.TABLE_NAME IN ({placeholders}) OR kcu.REFERENCED_TABLE_NAME IN ({placeholders})) "
+        "ORDER BY kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.ORDINAL_POSITION;",
+        tuple(tables) + tuple(tables),
+    )
+    keys: Dict[Tuple[str, str], Dict[str, object]] = {}
+    for row in cursor.fetchall():
+        key = keys.setdefault(
+            (row["table_name"], row["name"]),
+            {
+                "name": row["name"], "table": row["table_name"], "columns": [],
+                "ref_table": row["ref_table"], "ref_columns": [],
+                "update_rule": row["update_rule"], "delete_rule": row["delete_rule"],
+            },
+        )
+        key["columns"].append(row["column_name"])
+        key["ref_columns"].append(row["ref_column"])
+    return list(keys.values())
+
+
+def prepare_staging_tables(cursor, tables: Sequence[str]) -> Dict[str, Dict[str, str]]:
+    """Create empty <table>__staging copies without secondary indexes.
+
+    Returns the ADD INDEX clauses to rebuild per table after loading. CREATE
+    TABLE ... LIKE does not copy foreign keys, so the staging tables have none
+    while loading; they are moved over from the live tables by swap_staged_tables.
+    """
+    index_sql: Dict[str, Dict[str, str]] = {}
+    for table in tables:
+        staging = staging_table(table)
+        cursor.execute(f"DROP TABLE IF EXISTS `{staging}`;")
+        cursor.execute(f"CREATE TABLE `{staging}` LIKE `{table}`;")
+        index_sql[table] = secondary_index_sql(cursor, staging)
+        if index_sql[table]:
+            drops = ", ".join(f"DROP INDEX `{name}`" for name in index_sql[table])
+            cursor.execute(f"ALTER TABLE `{staging}` {drops};")
+    return index_sql
+
+
+def build_staging_indexes(cursor, table: str, clauses: Dict[str, str]) -> None:
+    """Build all secondary indexes of a loaded staging table in one ALTER TABLE."""
+    if clauses:
+        cursor.execute(f"ALTER TABLE `{staging_table(table)}` {', '.join(clauses.values())};")
+
+
+def swap_staged_tables(cursor, tables: Sequence[str], keep_old: bool = False) -> None:
+    """Swap staging tables in with a single atomic RENAME TABLE, then move the FKs.
+
+    Queries see either all old or all new window tables. Foreign keys stay with
+    the renamed old tables, so afterwards every FK on or into the old tables is
+    dropped and recreated under its original name on the new ones (with
+    foreign_key_checks off: the staging data was orphan-checked before the swap).
+    """
+    original_keys = foreign_keys_touching(cursor, tables)
+    renames = []
+    for table in tables:
+        renames.append(f"`{table}` TO `{old_table(table)}`")
+        renames.append(f"`{staging_table(table)}` TO `{table}`")
+
+    cursor.execute("SELECT @@SESSION.foreign_key_checks AS fk_checks;")
+    fk_checks = int(cursor.fetchone()["fk_checks"])
+    cursor.execute("SET SESSION foreign_key_checks=0;")
+    renamed = False
+    try:
+        for table in tables:
+            cursor.execute(f"DROP TABLE IF EXISTS `{old_table(table)}`;")
+        cursor.execute("RENAME TABLE " + ", ".join(renames) + ";")
+        renamed = True
+        touched = list(tables) + [old_table(table) for table in tables]
+        for key in foreign_keys_touching(cursor, touched):
+            cursor.execute(f"ALTER TABLE `{key['table']}` DROP FOREIGN KEY `{key['name']}`;")
+        if not keep_old:
+            for table in tables:
+                cursor.execute(f"DROP TABLE `{old_table(table)}`;")
+        for key in original_keys:
+            columns = ", ".join(f"`{col}`" for col in key["columns"])
+            ref_columns = ", ".join(f"`{col}`" for col in key["ref_columns"])
+            cursor.execute(
+                f"ALTER TABLE `{key['table']}` ADD CONSTRAINT `{key['name']}` FOREIGN KEY ({columns}) "
+                f"REFERENCES `{key['ref_table']}` ({ref_columns}) "
+                f"ON DELETE {key['delete_rule']} ON UPDATE {key['update_rule']};"
+            )
+    except Exception as exc:
+        if not renamed:
+            raise
+        wanted = ", ".join(f"{key['table']}.{key['name']}" for key in original_keys) or "none"
+        raise RuntimeError(
+            f"Staged tables were swapped in, but moving their foreign keys failed ({exc}). "
+            f"Expected constraints: {wanted}."
+        ) from exc
+    finally:
+        cursor.execute(f"SET SESSION foreign_key_checks={fk_checks};")
+
+
+def chunk_signature(row: Dict[str, str], tsv_dir: Path) -> str:
+    """Identify one version of a manifest chunk; changes whenever its rows would."""
+    payload = {col: clean(row.get(col)) for col in CHUNK_SIGNATURE_COLUMNS}
+    if is_null(row.get("fingerprint")):
+        # Builds without fingerprints: fall back to the chunk file itself.
+        stat = (tsv_dir / row["chunk_path"]).stat()
+        payload["file"] = [stat.st_size, stat.st_mtime_ns]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def read_chunk_manifest(tsv_dir: Path, tsv_only: bool = True) -> List[Dict[str, str]]:
+    """Return window_chunk_manifest.tsv rows with a ``signature`` column added.
+
+    ``tsv_only`` rejects manifests of parquet builds, which --incremental cannot
+    load; full loads only record the manifest in the ledger and pass False.
+    """
+    path = tsv_dir / WINDOW_CHUNK_MANIFEST
+    if not path.exists():
+        raise FileNotFoundError(f"--incremental needs {path}; rebuild the TSVs with 00_build_starter_sql_tsvs_v14.py.")
+    rows = []
+    for row in read_tsv(path):
+        if row["table_name"] not in CHUNKABLE_TABLES:
+            continue
+        if tsv_only and not str(row["chunk_path"]).endswith((".tsv", ".tsv.gz")):
+            raise ValueError(f"--incremental loads TSV chunks only; manifest lists {row['chunk_path']}.")
+        row["signature"] = chunk_signature(row, tsv_dir)
+        rows.append(row)
+    return rows
+
+
+def ledger_key(row: Dict[str, object]) -> Tuple[str, str, int, int]:
+    return (
+        str(row["table_name"]),
+        str(row["accession_id"]),
+        int(row["standard_window_size_bp"]),
+        int(row["step_size_bp"]),
+    )
+
+
+def read_load_ledger(cursor) -> Dict[Tuple[str, str, int, int], Dict[str, object]]:
+    cursor.execute(f"SELECT {', '.join(f'`{col}`' for col in LEDGER_COLUMNS)} FROM `{LOAD_LEDGER_TABLE}`;")
+    return {ledger_key(row): row for row in cursor.fetchall()}
+
+
+def write_load_ledger(cursor, rows: Sequence[Dict[str, object]], replace_all: bool = False) -> None:
+    """Record manifest chunks as loaded; ``replace_all`` first forgets every other chunk."""
+    if replace_all:
+        cursor.execute(f"DELETE FROM `{LOAD_LEDGER_TABLE}`;")
+    if rows:
+        cursor.executemany(
+            f"REPLACE INTO `{LOAD_LEDGER_TABLE}` ({', '.join(f'`{col}`' for col in LEDGER_COLUMNS)}) "
+            f"VALUES ({', '.join(['%s'] * len(LEDGER_COLUMNS))});",
+            [tuple(row[col] for col in LEDGER_COLUMNS) for row in rows],
+        )
+
+
+def upsert_table_file(cursor, table: str, path: Path, key_table: Optional[str] = None) -> int:
+    """Insert new rows and update existing ones by PK.
+
+    Goes through a temporary copy of the table and INSERT ... ON DUPLICATE KEY
+    UPDATE, so existing parent rows are updated in place rather than deleted
+    (which REPLACE would do, tripping FK restrictions or cascades). With
+    ``key_table``, the loaded PKs are also collected there.
+    """
+    incoming = f"{table}__incoming"
+    columns = TABLE_COLUMNS[table]
+    column_sql = ", ".join(f"`{col}`" for col in columns)
+    updates = ", ".join(f"`{col}` = VALUES(`{col}`)" for col in columns if col != PK_COLUMNS[table])
+    cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{incoming}`;")
+    cursor.execute(f"CREATE TEMPORARY TABLE `{incoming}` LIKE `{table}`;")
+    try:
+        loaded = load_table_file(cursor, table, path, incoming)
+        cursor.execute(
+            f"INSERT INTO `{table}` ({column_sql}) SELECT {column_sql} FROM `{incoming}` "
+            f"ON DUPLICATE KEY UPDATE {updates};"
+        )
+        if key_table:
+            pk = PK_COLUMNS[table]
+            cursor.execute(f"INSERT IGNORE INTO `{key_table}` (`{pk}`) SELECT `{pk}` FROM `{incoming}`;")
+    finally:
+        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{incoming}`;")
+    return loaded
+
+
+def load_incremental(cursor, tsv_dir: Path, tables: Sequence[str]) -> None:
+    """Load only manifest chunks that are new or changed since the last load.
+
+    Small tables are upserted in full, and their rows missing from the TSVs
+    (e.g. genomes dropped from the build) are deleted afterwards, children
+    first. For the chunked window tables the manifest is compared with the load
+    ledger: rows of changed and removed chunks are deleted first (so renumbered
+    PK ranges cannot collide), then new and changed chunks are loaded and the
+    ledger is updated, all in the caller's transaction.
+    """
+    manifest = read_chunk_manifest(tsv_dir)
+    ledger = read_load_ledger(cursor)
+    manifest_by_key = {ledger_key(row): row for row in manifest}
+    missing = sorted(CHUNKABLE_TABLES.intersection(tables) - {row["table_name"] for row in manifest})
+    if missing:
+        raise ValueError(f"{WINDOW_CHUNK_MANIFEST} does not list chunks for: {', '.join(missing)}")
+    if not ledger and table_count(cursor, "genomic_windows"):
+        raise RuntimeError(
+            f"{LOAD_LEDGER_TABLE} is empty but genomic_windows already has rows, so loaded chunks cannot be "
+            "told apart. Run one full load with --truncate first; it records the ledger."
+        )
+
+    to_load = [row for key, row in manifest_by_key.items() if key not in ledger or ledger[key]["signature"] != row["signature"]]
+    changed = [ledger[ledger_key(row)] for row in to_load if ledger_key(row) in ledger]
+    removed = [row for key, row in ledger.items() if key not in manifest_by_key]
+    print(
+        f"[INFO] Chunk manifest vs {LOAD_LEDGER_TABLE}: {len(to_load) - len(changed)} new, {len(changed)} changed, "
+        f"{len(manifest_by_key) - len(to_load)} unchanged, {len(removed)} removed chunk(s)."
+    )
+
+    stale = changed + removed
+    for table in TRUNCATE_ORDER:
+        for row in stale:
+            if row["table_name"] == table:
+                cursor.execute(CHUNK_DELETE_SQL[table], row)
+                print(f"  deleted {cursor.rowcount} row(s) of {row['chunk_path']} from {table}")
+
+    key_tables: Dict[str, str] = {}
+    for table in tables:
+        if table not in CHUNKABLE_TABLES:
+            key_tables[table] = f"{table}__current_keys"
+            cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{key_tables[table]}`;")
+            cursor.execute(f"CREATE TEMPORARY TABLE `{key_tables[table]}` (`{PK_COLUMNS[table]}` BIGINT NOT NULL PRIMARY KEY);")
+
+    print("[INFO] Loading TSVs...")
+    for table in tables:
+        if table in CHUNKABLE_TABLES:
+            table_total = 0
+            for row in to_load:
+                if row["table_name"] != table:
+                    continue
+                loaded = load_table_file(cursor, table, tsv_dir / row["chunk_path"])
+                table_total += loaded
+                print(f"  loaded {row['chunk_path']} into {table}: {loaded} row(s)")
+        else:
+            table_total = 0
+            for path in table_input_files(tsv_dir, table):
+                loaded = upsert_table_file(cursor, table, path, key_tables[table])
+                table_total += loaded
+                print(f"  upserted {path.relative_to(tsv_dir)} into {table}: {loaded} row(s)")
+        print(f"  [TABLE TOTAL] {table}: {table_total} row(s)")
+
+    print("[INFO] Deleting rows that are no longer in the TSVs...")
+    for table in TRUNCATE_ORDER:
+        if table not in key_tables:
+            continue
+        pk = PK_COLUMNS[table]
+        cursor.execute(
+            f"DELETE t FROM `{table}` t LEFT JOIN `{key_tables[table]}` k ON t.`{pk}` = k.`{pk}` "
+            f"WHERE k.`{pk}` IS NULL;"
+        )
+        if cursor.rowcount:
+            print(f"  deleted {cursor.rowcount} row(s) of {table} absent from {table}.tsv")
+        cursor.execute(f"DROP TEMPORARY TABLE `{key_tables[table]}`;")
+
+    for row in removed:
+        cursor.execute(
+            f"DELETE FROM `{LOAD_LEDGER_TABLE}` WHERE {' AND '.join(f'`{col}` = %s' for col in LEDGER_KEY_COLUMNS)};",
+            ledger_key(row),
+        )
+    write_load_ledger(cursor, to_load)
+
+
+def truncate_tables(cursor, tables: Sequence[str], skip: Sequence[str] = ()) -> None:
     cursor.execute("SET FOREIGN_KEY_CHECKS=0;")
     try:
         for table in TRUNCATE_ORDER:
-            if table in tables:
+            if table in tables and table not in skip:
                 cursor.execute(f"TRUNCATE TABLE `{table}`;")
     finally:
         cursor.execute("SET FOREIGN_KEY_CHECKS=1;")
@@ -486,6 +1079,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--dry-run", action="store_true", help="Validate TSVs and print load order, but do not load.")
     parser.add_argument("--truncate", action="store_true", help="Truncate target tables before loading, in safe reverse dependency order.")
     parser.add_argument("--no-post-check", action="store_true", help="Skip post-load database orphan checks.")
+    parser.add_argument("--load-workers", type=int, default=1, help="Load chunks of the same table concurrently over N extra connections. Tables still load in dependency order, but each table is committed once its chunks finish instead of one transaction for the whole load. Default: 1")
+    parser.add_argument("--relax-load-checks", action="store_true", help="Turn off foreign_key_checks in the loading sessions (unique_checks stay on). Orphans are re-checked with the post-load checks, which cannot be skipped in this mode.")
+    parser.add_argument("--staged-window-load", action="store_true", help="Load genomic_windows/gc_window_stats into <table>__staging tables without secondary indexes, build the indexes once, orphan-check them, and swap them in with one RENAME TABLE. The live window tables keep serving queries until the swap and are not truncated. Other tables are reloaded in place after the window tables, just before the swap (truncated first with --truncate, otherwise upserted by primary key).")
+    parser.add_argument("--incremental", action="store_true", help=f"Load only window chunks that are new or changed according to {WINDOW_CHUNK_MANIFEST} and the {LOAD_LEDGER_TABLE} table: rows of changed or removed chunks are deleted and reloaded, other tables are upserted by primary key and their rows missing from the TSVs are deleted.")
+    parser.add_argument("--keep-old-window-tables", action="store_true", help="With --staged-window-load, keep the replaced tables as <table>__old instead of dropping them.")
     parser.add_argument("--include-sequence-type-audit", action="store_true", help="Reserved for later; not loaded by default because it is an audit table not listed in the request.")
     return parser.parse_args()
 
@@ -495,6 +1093,14 @@ def main() -> None:
     tsv_dir = Path(args.tsv_dir).expanduser().resolve()
     if not tsv_dir.exists():
         raise FileNotFoundError(f"TSV directory does not exist: {tsv_dir}")
+    if args.load_workers < 1:
+        raise ValueError("--load-workers must be at least 1.")
+    if args.relax_load_checks and args.no_post_check:
+        raise ValueError("--relax-load-checks relies on the post-load orphan checks; drop --no-post-check.")
+    if args.incremental and (args.truncate or args.staged_window_load or args.load_workers > 1):
+        raise ValueError("--incremental runs in one transaction on the live tables; it cannot be combined with --truncate, --staged-window-load or --load-workers.")
+    if args.keep_old_window_tables and not args.staged_window_load:
+        raise ValueError("--keep-old-window-tables only applies with --staged-window-load.")
 
     tables = existing_tables(tsv_dir, include_audit=False)
     missing_required = [table for table in REQUIRED_FILES if table not in tables]
@@ -537,29 +1143,105 @@ def main() -> None:
         print("\n[OK] No SQL changes made.")
         return
 
+    staged = [table for table in STAGED_TABLES if table in tables] if args.staged_window_load else []
     conn = connect(args)
+    workers = []
+    committed_tables: List[str] = []
+    swap_started = False
+    truncated_in_place = False
     try:
+        if args.load_workers > 1:
+            workers = [connect(args) for _ in range(args.load_workers)]
         with conn.cursor() as cursor:
-            if args.truncate:
+            manifest = []
+            if (tsv_dir / WINDOW_CHUNK_MANIFEST).exists():
+                # DDL commits implicitly, so create the ledger before any rows load.
+                cursor.execute(LOAD_LEDGER_DDL)
+                manifest = read_chunk_manifest(tsv_dir, tsv_only=False) if not args.incremental else []
+            elif args.incremental:
+                raise FileNotFoundError(f"--incremental needs {tsv_dir / WINDOW_CHUNK_MANIFEST}.")
+
+            if args.truncate and not staged:
                 print("[INFO] Truncating tables in reverse dependency order...")
                 truncate_tables(cursor, tables)
 
-            print("[INFO] Loading TSVs...")
-            for table in tables:
-                table_total = 0
-                files = table_input_files(tsv_dir, table)
-                for path in files:
-                    loaded = load_table_file(cursor, table, path)
-                    table_total += loaded
-                    print(f"  loaded {path.relative_to(tsv_dir)} into {table}: {loaded} row(s)")
-                print(f"  [TABLE TOTAL] {table}: {table_total} row(s)")
+            index_sql: Dict[str, Dict[str, str]] = {}
+            if staged:
+                print("[INFO] Creating staging tables without secondary indexes: " + ", ".join(staging_table(t) for t in staged))
+                index_sql = prepare_staging_tables(cursor, staged)
+
+            if args.relax_load_checks:
+                print("[INFO] Disabling foreign-key checks in loading sessions...")
+                relax_session_checks(cursor)
+                for worker in workers:
+                    with worker.cursor() as worker_cursor:
+                        relax_session_checks(worker_cursor)
+
+            if args.incremental:
+                load_incremental(cursor, tsv_dir, tables)
+            else:
+                print("[INFO] Loading TSVs...")
+                # Staged window tables have no FKs while loading, so they go first; the
+                # live tables are replaced only after the long window load, right
+                # before the swap, instead of sitting empty or stale meanwhile.
+                in_place = [table for table in tables if table not in staged]
+                upsert_in_place = False
+                for table in staged + in_place:
+                    target = staging_table(table) if table in staged else None
+                    if staged and table == in_place[0]:
+                        if args.truncate:
+                            print("[INFO] Truncating non-staged tables in reverse dependency order...")
+                            truncate_tables(cursor, in_place)
+                            truncated_in_place = True
+                        else:
+                            # LOAD DATA LOCAL skips duplicate keys, which would keep the old rows.
+                            print("[INFO] Upserting non-staged tables by primary key...")
+                            upsert_in_place = True
+                    table_total = 0
+                    files = table_input_files(tsv_dir, table)
+                    if upsert_in_place:
+                        for path in files:
+                            loaded = upsert_table_file(cursor, table, path)
+                            table_total += loaded
+                            print(f"  upserted {path.relative_to(tsv_dir)} into {table}: {loaded} row(s)")
+                    elif workers and len(files) > 1:
+                        table_total = load_table_parallel(workers, table, files, tsv_dir, target)
+                    else:
+                        for path in files:
+                            loaded = load_table_file(cursor, table, path, target)
+                            table_total += loaded
+                            print(f"  loaded {path.relative_to(tsv_dir)} into {target or table}: {loaded} row(s)")
+                    if workers or target:
+                        # Child tables load on other connections and must see these rows;
+                        # staging DDL commits implicitly anyway.
+                        conn.commit()
+                        for worker in workers:
+                            worker.commit()
+                        committed_tables.append(target or table)
+                    if target:
+                        print(f"[INFO] Building secondary indexes on {target}...")
+                        build_staging_indexes(cursor, table, index_sql[table])
+                    print(f"  [TABLE TOTAL] {table}: {table_total} row(s)")
+                if manifest and args.truncate:
+                    write_load_ledger(cursor, manifest, replace_all=True)
+                elif manifest:
+                    # Without --truncate, LOAD DATA skips duplicate PKs and old chunks stay
+                    # behind, so the loaded rows no longer match any manifest. An empty
+                    # ledger makes the next --incremental ask for a --truncate reload.
+                    print(f"[WARN] Clearing {LOAD_LEDGER_TABLE}: only a --truncate load can record which chunks are loaded.", file=sys.stderr)
+                    write_load_ledger(cursor, [], replace_all=True)
 
             if not args.no_post_check:
                 print("[INFO] Running post-load orphan checks...")
-                problems = database_fk_checks(cursor)
+                problems = database_fk_checks(cursor, {table: staging_table(table) for table in staged})
                 if problems:
                     raise RuntimeError("Post-load relationship checks failed:\n  " + "\n  ".join(problems))
 
+            if staged:
+                print("[INFO] Swapping staged tables in with RENAME TABLE: " + ", ".join(staged))
+                swap_started = True
+                swap_staged_tables(cursor, staged, keep_old=args.keep_old_window_tables)
+
             print("[INFO] Database row counts after load:")
             for table in tables:
                 print(f"  {table}\t{table_count(cursor, table)} rows")
@@ -568,11 +1250,24 @@ def main() -> None:
         print("\n[OK] Load committed successfully.")
     except Exception:
         conn.rollback()
+        for worker in workers:
+            worker.rollback()
         print("\n[ERROR] Load failed. Transaction rolled back.", file=sys.stderr)
+        if committed_tables:
+            print(
+                "[WARN] Already committed before the failure: " + ", ".join(committed_tables)
+                + ". Rerun with --truncate to reload them.",
+                file=sys.stderr,
+            )
+        if staged and not swap_started:
+            print("[INFO] The live window tables were not changed; staging tables are left for inspection.", file=sys.stderr)
+            if truncated_in_place:
+                print("[WARN] The non-staged tables were already truncated. Rerun the load to refill them.", file=sys.stderr)
         raise
     finally:
+        for worker in workers:
+            worker.close()
         conn.close()
 
-
 if __name__ == "__main__":
     main()
@@ -50,6 +50,10 @@ import pandas as pd
 import pyfaidx
 from Bio.SeqIO.FastaIO import SimpleFastaParser
 
+# genome_store.py lives at the repository root (see its docstring for this import).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import genome_store
+
 
 STOP_CODONS = {"TAA", "TAG", "TGA"}
 FLANK_SPECS = [
@@ -128,7 +132,14 @@ def now_str() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
-def load_genome(input_fasta: Path) -> pyfaidx.Fasta:
+def load_genome(input_fasta: Path, build_store: bool = False) -> pyfaidx.Fasta:
+    """Open a genome, preferring the shared memory-mapped genome store (see genome_store.py).
+
+    The store mimics pyfaidx.Fasta(as_raw=True) slicing, so callers are unchanged.
+    """
+    store = genome_store.open_genome_store(input_fasta, build=build_store)
+    if store is not None:
+        return store
     try:
         return pyfaidx.Fasta(str(input_fasta), as_raw=True, build_index=True)
     except pyfaidx.FaidxException as e:
@@ -659,6 +670,7 @@ def main() -> None:
     parser.add_argument("--genomes-metadata", default=None, help="Optional genomes_metadata.csv path with path_to_fna")
     parser.add_argument("--outdir", default=None, help="Output directory; default: <genomes>/records/sql_tsvs/compleasm_features")
     parser.add_argument("--test", action="store_true", help="Restrict execution to two genomes")
+    parser.add_argument("--genome-store", action="store_true", help="Build genomes/<accession>/genome_store for genomes without one and slice from it; existing stores are always used")
     args = parser.parse_args()
 
     genomes_dir = Path(args.genomes).resolve()
@@ -731,7 +743,7 @@ def main() -> None:
         try:
             cds_sequences = load_cds_sequences(cds_fasta)
             full_records = parse_full_table(full_table)
-            genome = load_genome(genome_fasta)
+            genome = load_genome(genome_fasta, build_store=args.genome_store)
         except Exception as e:
             print(f"WARNING: skipping {accession}; failed input parsing/loading: {e}")
             continue
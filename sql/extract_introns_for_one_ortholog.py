@@ -44,9 +44,19 @@ from typing import Dict, List, Tuple
 
 import pyfaidx
 
+# genome_store.py lives at the repository root (see its docstring for this import).
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import genome_store
+
 
 def load_genome(input_fasta: Path) -> pyfaidx.Fasta:
-    # 1. Index the FASTA file with pyfaidx for fast access
+    # 1. Use the shared memory-mapped genome store if one was built for this FASTA
+    store = genome_store.open_genome_store(input_fasta)
+    if store is not None:
+        print(f"Status: Genome store opened: {store.store_dir}")
+        return store
+
+    # 2. Otherwise index the FASTA file with pyfaidx for fast access
     try:
         genome = pyfaidx.Fasta(
             str(input_fasta),